@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+
+
+class SeriouslyConfig(AppConfig):
+    name = "django_seriously"
+    verbose_name = "django-seriously"
+
+    def ready(self):
+        from django_seriously.pydantic import register_integrations
+        from django_seriously.settings import seriously_settings
+        from django_seriously.utils.models import compile_validation_plans
+
+        # resolve and validate all settings now instead of in the first request
+        seriously_settings.load()
+        compile_validation_plans()
+        register_integrations()
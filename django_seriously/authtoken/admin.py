@@ -6,15 +6,17 @@ from django.utils.translation import gettext_lazy as _
 from django_seriously.authtoken.forms import TokenChangeForm
 from django_seriously.authtoken.models import Token
 from django_seriously.authtoken.utils import generate_token
+from django_seriously.utils.admin import LookaheadPaginationMixin
 
 
-class TokenAdmin(ModelAdmin):
+class TokenAdmin(LookaheadPaginationMixin, ModelAdmin):
     list_display = (
         "id",
         "user",
         "name",
         "scopes",
     )
+    list_select_related = ("user",)
     form = TokenChangeForm
 
     def save_model(self, request, obj: Token, form, change):
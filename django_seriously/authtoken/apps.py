@@ -1,6 +1,13 @@
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
 
 
 class AuthtokenConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "django_seriously.authtoken"
+
+    def ready(self):
+        from django_seriously.settings import seriously_settings
+
+        # the core app loads the settings, but it is optional for authtoken
+        if not apps.is_installed("django_seriously"):
+            seriously_settings.load()
@@ -12,6 +12,7 @@ from rest_framework.authentication import BaseAuthentication, get_authorization_
 from rest_framework.permissions import BasePermission
 
 from django_seriously.settings import seriously_settings
+from django_seriously.utils.metrics import instrument
 
 if TYPE_CHECKING:
     from django_seriously.authtoken.models import Token
@@ -56,13 +57,17 @@ class TokenAuthentication(BaseAuthentication):
 
         return self.authenticate_credentials(token_str)
 
+    @instrument("authtoken.authenticate")
     def authenticate_credentials(self, token_str: str) -> tuple[UserType, "Token"]:
         """ """
         try:
             token_bytes = base64.urlsafe_b64decode(token_str)
             if len(token_bytes) != 32:
                 raise ValueError()
-            token_id = uuid.UUID(bytes=token_bytes[:16], version=4)
+            token_id = uuid.UUID(bytes=token_bytes[:16])
+            # random (uuid4) or time-ordered (uuid7) ids, see AUTH_TOKEN_ID_FACTORY
+            if token_id.version not in (4, 7):
+                raise ValueError()
             raw_token = token_bytes[16:]
         except ValueError:
             raise exceptions.AuthenticationFailed(_("Invalid token."))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authtoken', '0002_token_last_seen_at_alter_token_scopes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='token',
+            index=models.Index(fields=['user', 'last_seen_at'], name='authtoken_token_seen'),
+        ),
+        migrations.AddIndex(
+            model_name='token',
+            index=models.Index(fields=['user', 'created_at'], name='authtoken_token_created'),
+        ),
+    ]
@@ -1,13 +1,61 @@
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.deletion import get_candidate_relations_to_delete
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
+from django_seriously.authtoken.signals import tokens_revoked
 from django_seriously.settings import seriously_settings
 from django_seriously.utils.models import DjangoBaseModel
 
 
+class TokenQuerySet(models.QuerySet):
+    def revoke(self, batch_size: int = 1000) -> int:
+        """
+        Delete the tokens of this queryset in chunks of batch_size, with one DELETE
+        statement per chunk. Unlike delete(), no per-object signals are sent. Only if
+        other models reference tokens, each chunk goes through delete() so that their
+        on_delete is honored. In both cases, tokens_revoked is sent once per chunk so
+        auth caches can be invalidated in bulk. Returns the number of revoked tokens.
+        """
+        if self.query.is_sliced:
+            raise TypeError("Cannot use 'limit' or 'offset' with revoke().")
+        collect = self._has_delete_relations()
+        queryset = self.order_by("pk")
+        queryset._for_write = True
+        using = queryset.db
+        revoked = 0
+        while True:
+            chunk = list(queryset.values_list("pk", "user_id")[:batch_size])
+            if not chunk:
+                return revoked
+            token_ids = [token_id for token_id, _ in chunk]
+            tokens = self.model._base_manager.using(using).filter(pk__in=token_ids)
+            if collect:
+                revoked += tokens.delete()[1].get(self.model._meta.label, 0)
+            else:
+                revoked += tokens._raw_delete(using)
+            tokens_revoked.send(
+                sender=self.model,
+                token_ids=token_ids,
+                user_ids={user_id for _, user_id in chunk},
+                using=using,
+            )
+            if len(chunk) < batch_size:
+                return revoked
+
+    def _has_delete_relations(self) -> bool:
+        """whether deleting tokens has to cascade to, or update, rows of other models"""
+        return any(
+            relation.on_delete is not models.DO_NOTHING
+            for relation in get_candidate_relations_to_delete(self.model._meta)
+        )
+
+
+TokenManager = models.Manager.from_queryset(TokenQuerySet)
+
+
 class Token(DjangoBaseModel):
     name = models.CharField(max_length=25, blank=True)
     key = models.CharField(_("Key"), max_length=128)
@@ -26,6 +74,8 @@ class Token(DjangoBaseModel):
     )
     last_seen_at = models.DateTimeField(blank=True, null=True)
 
+    objects = TokenManager()
+
     @cached_property
     def scope_list(self):
         return self.scopes.split(",")
@@ -53,3 +103,13 @@ class Token(DjangoBaseModel):
 
     class Meta:
         abstract = "django_seriously.authtoken" not in settings.INSTALLED_APPS
+        # per-user token listings, ordered by activity or age
+        # app label and class are truncated to stay within the 30 characters allowed
+        indexes = [
+            models.Index(
+                fields=["user", "last_seen_at"], name="%(app_label).10s_%(class).10s_seen"
+            ),
+            models.Index(
+                fields=["user", "created_at"], name="%(app_label).10s_%(class).10s_created"
+            ),
+        ]
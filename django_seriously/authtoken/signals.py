@@ -0,0 +1,4 @@
+from django.dispatch import Signal
+
+# sent once per chunk by TokenQuerySet.revoke() with token_ids, user_ids and using
+tokens_revoked = Signal()
@@ -1,7 +1,12 @@
+import asyncio
 import base64
+import functools
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
-from django.contrib.auth.hashers import get_hasher
+from asgiref.sync import sync_to_async
+from django.contrib.auth.hashers import check_password, get_hasher
 from django.utils.crypto import get_random_string
 
 from django_seriously.settings import seriously_settings
@@ -32,7 +37,7 @@ class TokenContainer:
 
 
 def generate_token() -> TokenContainer:
-    token_id = uuid.uuid4()
+    token_id: uuid.UUID = seriously_settings.AUTH_TOKEN_ID_FACTORY()
     secret = get_random_string(16)
     raw_bearer_token = token_id.bytes + secret.encode()
     return TokenContainer(
@@ -53,3 +58,41 @@ def make_password(password) -> str:
 
 def check_password_rehash(raw_password: str) -> bool:
     return not raw_password.startswith("pbkdf2_sha256$1000$")
+
+
+@functools.cache
+def _get_hashing_executor(max_workers: int) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="seriously-hashing")
+
+
+def get_hashing_executor() -> ThreadPoolExecutor:
+    """bounded pool of HASHING_WORKERS threads, shared by the process"""
+    return _get_hashing_executor(seriously_settings.HASHING_WORKERS)
+
+
+async def _run_hashing(func: Callable[..., Any], *args) -> Any:
+    # hashlib releases the GIL, so hashes run in parallel off the event loop
+    return await asyncio.get_running_loop().run_in_executor(get_hashing_executor(), func, *args)
+
+
+async def agenerate_token() -> TokenContainer:
+    return await _run_hashing(generate_token)
+
+
+async def amake_password(password) -> str:
+    return await _run_hashing(make_password, password)
+
+
+async def acheck_password(
+    password, encoded: str, setter: Callable[[str], Any] | None = None
+) -> bool:
+    """
+    like check_password, but the rehash follows CHECK_PASSWORD_REHASH and
+    MAKE_PASSWORD. setter gets the new hash and may save it, it is run with
+    sync_to_async.
+    """
+    is_correct = await _run_hashing(check_password, password, encoded)
+    if is_correct and setter is not None and seriously_settings.CHECK_PASSWORD_REHASH(encoded):
+        key = await _run_hashing(seriously_settings.MAKE_PASSWORD, password)
+        await sync_to_async(setter)(key)
+    return is_correct
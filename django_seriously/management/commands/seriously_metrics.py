@@ -0,0 +1,43 @@
+import argparse
+import json
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from django_seriously.utils.metrics import InMemorySink, use_sink
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a management command with in-memory instrumentation and print a summary of "
+        "the time spent in django-seriously, e.g. seriously_metrics bulk_create_users users.csv"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("command", help="management command to run")
+        parser.add_argument(
+            "args",
+            nargs=argparse.REMAINDER,
+            help="arguments of the command. Everything after the command is passed on, "
+            "so options of seriously_metrics (e.g. --json) must come before it.",
+        )
+        parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+
+    def handle(self, *args, command, **options):
+        sink = InMemorySink()
+        with use_sink(sink):
+            call_command(command, *args)
+        summary = sink.summary()
+
+        if options["json"]:
+            self.stdout.write(json.dumps(summary, indent=2))
+            return
+        for name, histogram in summary["histograms"].items():
+            self.stdout.write(
+                f"{name:<40} {histogram['count']:>8} calls  "
+                f"{histogram['sum'] * 1000:>10.1f} ms total  "
+                f"{histogram['p50'] * 1000:>8.3f} ms p50  "
+                f"{histogram['p95'] * 1000:>8.3f} ms p95"
+            )
+        for name, value in summary["counters"].items():
+            self.stdout.write(f"{name:<40} {value:>8}")
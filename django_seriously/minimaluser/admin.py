@@ -3,8 +3,11 @@ from django.contrib.auth import password_validation
 from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
 from django.contrib.auth.forms import UserCreationForm as DjangoUserCreationForm
 from django.core.exceptions import ValidationError
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
+from django_seriously.utils.admin import LookaheadPaginationMixin
+
 
 class UserCreationForm(DjangoUserCreationForm):
     password1 = forms.CharField(
@@ -56,7 +59,7 @@ class UserCreationForm(DjangoUserCreationForm):
         return user
 
 
-class MinimalUserAdmin(DjangoUserAdmin):
+class MinimalUserAdmin(LookaheadPaginationMixin, DjangoUserAdmin):
     add_form = UserCreationForm
     fieldsets = (
         (None, {"fields": ("id", "email", "password")}),
@@ -87,3 +90,12 @@ class MinimalUserAdmin(DjangoUserAdmin):
     list_display = ("email", "last_login", "is_staff", "is_superuser")
     search_fields = ("email",)
     ordering = ("email",)
+    # match emails by prefix instead of icontains, which cannot use an index
+    prefix_search = False
+
+    def get_search_results(self, request, queryset, search_term):
+        if not self.prefix_search or not search_term.strip():
+            return super().get_search_results(request, queryset, search_term)
+        # same expression as the case-insensitive email index of MinimalAbstractUser
+        queryset = queryset.alias(email_lower=Lower("email"))
+        return queryset.filter(email_lower__startswith=search_term.strip().lower()), False
@@ -1,6 +1,15 @@
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
 
 
 class MinimaluserConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "django_seriously.minimaluser"
+
+    def ready(self):
+        # connects the invalidation signals of the permission cache
+        from django_seriously.minimaluser import backends  # noqa: F401
+        from django_seriously.settings import seriously_settings
+
+        # the core app loads the settings, but it is optional for minimaluser
+        if not apps.is_installed("django_seriously"):
+            seriously_settings.load()
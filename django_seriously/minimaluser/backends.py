@@ -0,0 +1,140 @@
+import threading
+import time
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import caches
+from django.db.models.signals import m2m_changed, post_delete
+
+from django_seriously.settings import seriously_settings
+
+GLOBAL_VERSION_KEY = "seriously:perms:version"
+
+
+class CachedPermissionsBackend(ModelBackend):
+    """
+    ModelBackend that keeps each user's resolved permission sets in the Django cache
+    (``PERMISSION_CACHE`` alias) instead of only on the user instance, so repeated
+    requests skip the permission joins. Entries are keyed by a per-user version, which
+    is bumped when the user's groups or permissions change, and a global version, which
+    is bumped for changes affecting unknown users (group permissions, deletions). Object
+    permissions are not cached.
+    """
+
+    _stats = {"hits": 0, "misses": 0}
+    _stats_lock = threading.Lock()
+
+    def _get_permissions(self, user_obj, obj, from_name):
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+        perm_cache_name = f"_{from_name}_perm_cache"
+        if not hasattr(user_obj, perm_cache_name):
+            resolve = super()._get_permissions
+            perms = self._get_cached(user_obj, from_name, lambda u: resolve(u, obj, from_name))
+            setattr(user_obj, perm_cache_name, perms)
+        return getattr(user_obj, perm_cache_name)
+
+    def get_all_permissions(self, user_obj, obj=None):
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+        if not hasattr(user_obj, "_perm_cache"):
+            user_obj._perm_cache = self._get_cached(user_obj, "all", super().get_all_permissions)
+        return user_obj._perm_cache
+
+    def _get_cached(self, user_obj, name: str, resolve) -> set[str]:
+        cache = caches[seriously_settings.PERMISSION_CACHE]
+        user_key = _user_version_key(user_obj.pk)
+        versions = cache.get_many([GLOBAL_VERSION_KEY, user_key])
+        global_version = versions.get(GLOBAL_VERSION_KEY) or _init_version(GLOBAL_VERSION_KEY)
+        user_version = versions.get(user_key) or _init_version(user_key)
+        # superuser status changes the result but is not a relation
+        key = (
+            f"seriously:perms:{global_version}:{user_version}:{user_obj.pk}:"
+            f"{int(user_obj.is_superuser)}:{name}"
+        )
+        perms = cache.get(key)
+        if perms is not None:
+            self._count("hits")
+            return perms
+        self._count("misses")
+        perms = resolve(user_obj)
+        cache.set(key, perms, seriously_settings.PERMISSION_CACHE_TIMEOUT)
+        return perms
+
+    @classmethod
+    def _count(cls, name: str) -> None:
+        with cls._stats_lock:
+            cls._stats[name] += 1
+
+    @classmethod
+    def get_cache_stats(cls) -> dict[str, Any]:
+        """hits and misses of this process since start or last reset"""
+        with cls._stats_lock:
+            stats: dict[str, Any] = dict(cls._stats)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / total if total else None
+        return stats
+
+    @classmethod
+    def reset_cache_stats(cls) -> None:
+        with cls._stats_lock:
+            cls._stats.update(hits=0, misses=0)
+
+
+def _user_version_key(user_pk) -> str:
+    return f"seriously:perms:version:{user_pk}"
+
+
+def _init_version(key: str) -> int:
+    # versions start at the current time, so that an evicted version key cannot
+    # resurrect entries cached under an earlier version
+    cache = caches[seriously_settings.PERMISSION_CACHE]
+    cache.add(key, time.time_ns(), None)
+    return cache.get(key)
+
+
+def _bump_version(key: str) -> None:
+    cache = caches[seriously_settings.PERMISSION_CACHE]
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def invalidate_user_permissions(user_pk=None) -> None:
+    """invalidate cached permissions of one user or, without pk, of all users"""
+    _bump_version(GLOBAL_VERSION_KEY if user_pk is None else _user_version_key(user_pk))
+
+
+def _invalidate_on_m2m_changed(sender, instance, action, reverse, pk_set, **kwargs) -> None:
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    user_model = get_user_model()
+    user_relations = [
+        getattr(user_model, name).through
+        for name in ("groups", "user_permissions")
+        if hasattr(user_model, name)
+    ]
+    if sender in user_relations:
+        if not reverse:
+            invalidate_user_permissions(instance.pk)
+        elif pk_set:
+            for user_pk in pk_set:
+                invalidate_user_permissions(user_pk)
+        else:
+            invalidate_user_permissions()
+    elif sender is Group.permissions.through:
+        invalidate_user_permissions()
+
+
+def _invalidate_on_delete(sender, **kwargs) -> None:
+    invalidate_user_permissions()
+
+
+m2m_changed.connect(_invalidate_on_m2m_changed, dispatch_uid="seriously_permission_cache")
+post_delete.connect(_invalidate_on_delete, sender=Group, dispatch_uid="seriously_perm_group")
+post_delete.connect(
+    _invalidate_on_delete, sender=Permission, dispatch_uid="seriously_perm_permission"
+)
@@ -0,0 +1,10 @@
+"""
+Process pool worker of UserManager.bulk_create_users(). It lives apart from the models,
+so that workers started with "spawn" or "forkserver" can import it before Django is set up.
+"""
+
+
+def hash_passwords(hasher_class, passwords: list[str]) -> list[str]:
+    """only instantiates the pickled hasher class, which needs neither settings nor apps"""
+    hasher = hasher_class()
+    return [hasher.encode(password, hasher.salt()) for password in passwords]
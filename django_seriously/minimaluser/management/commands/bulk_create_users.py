@@ -0,0 +1,127 @@
+import csv
+import json
+import sys
+from typing import IO, Any, Iterable, Iterator
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models
+
+# password values are passed through to bulk_create_users as-is
+PASSWORD_KEYS = ("password", "password_hash")
+BOOLEAN_STRINGS = {
+    **dict.fromkeys(("true", "t", "yes", "y", "1"), True),
+    **dict.fromkeys(("false", "f", "no", "n", "0"), False),
+}
+
+
+def read_user_rows(stream: IO[str], format: str) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    lazily parse users from CSV (with header) or JSON lines into (line number, row),
+    empty CSV values are dropped
+    """
+    if format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, {key: value for key, value in row.items() if value}
+    elif format == "jsonl":
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                raise CommandError(f"Invalid JSON on line {line_number}: {e}")
+    else:
+        raise CommandError(f"Unknown format {format!r}")
+
+
+def clean_user_row(model: type[models.Model], row: Any) -> dict[str, Any]:
+    """
+    convert a parsed row to values of the model fields, e.g. "false" for booleans,
+    and validate them. Raises ValidationError with the messages per field.
+    """
+    if not isinstance(row, dict):
+        raise ValidationError("Expected an object of user fields")
+    errors: dict[str, list] = {}
+    if "email" not in row:
+        errors["email"] = ["This field is required."]
+    cleaned = {}
+    for key, value in row.items():
+        if key in PASSWORD_KEYS:
+            cleaned[key] = value
+            continue
+        try:
+            field = model._meta.get_field(key)
+        except FieldDoesNotExist:
+            field = None
+        if field is None or not field.concrete or field.many_to_many:
+            errors[key] = ["Unknown user field."]
+            continue
+        if isinstance(field, models.BooleanField) and isinstance(value, str):
+            value = BOOLEAN_STRINGS.get(value.strip().lower(), value)
+        try:
+            cleaned[field.attname] = field.clean(value, None)
+        except ValidationError as e:
+            errors.setdefault(key, []).extend(e.messages)
+    if errors:
+        raise ValidationError(errors)
+    return cleaned
+
+
+class Command(BaseCommand):
+    help = (
+        "Create users from a CSV or JSONL file with an email column and optionally "
+        "password (cleartext), password_hash (existing hash) or other user fields. "
+        "Invalid rows are reported and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help='input file, "-" for stdin')
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="input format, derived from the file extension by default",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--processes", type=int, help="password hashing processes, cpu count by default"
+        )
+
+    def handle(self, *args, **options):
+        model = get_user_model()
+        manager = model._default_manager
+        if not hasattr(manager, "bulk_create_users"):
+            raise CommandError("User model manager does not support bulk_create_users")
+
+        path = options["path"]
+        format = options["format"] or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+        stream = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+        self.skipped = 0
+        try:
+            created = manager.bulk_create_users(
+                self.clean_rows(model, read_user_rows(stream, format)),
+                batch_size=options["batch_size"],
+                processes=options["processes"],
+            )
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        self.stdout.write(f"Created {created} users")
+        if self.skipped:
+            self.stderr.write(f"Skipped {self.skipped} invalid rows")
+
+    def clean_rows(
+        self, model: type[models.Model], rows: Iterable[tuple[int, Any]]
+    ) -> Iterator[dict[str, Any]]:
+        for line_number, row in rows:
+            try:
+                yield clean_user_row(model, row)
+            except ValidationError as e:
+                self.skipped += 1
+                if hasattr(e, "error_dict"):
+                    messages = [f"{key}: {' '.join(m)}" for key, m in e.message_dict.items()]
+                else:
+                    messages = e.messages
+                self.stderr.write(f"Line {line_number}: {'; '.join(messages)}")
@@ -1,11 +1,21 @@
+import itertools
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Iterable, Optional
+
 from django.contrib.auth.base_user import AbstractBaseUser
+from django.contrib.auth.hashers import get_hasher, make_password
 from django.contrib.auth.models import PermissionsMixin
 from django.contrib.auth.models import UserManager as DjangoUserManager
+from django.core import checks
 from django.core.mail import send_mail
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from django_seriously.minimaluser.hashing import hash_passwords
+
 
 class UserManager(DjangoUserManager):
     """Adaptation for minimaluser with minor changes to the Django version"""
@@ -17,6 +27,114 @@ class UserManager(DjangoUserManager):
         user.save(using=self._db)
         return user
 
+    def filter_by_email(self, email):
+        """
+        Case-insensitive email lookup on ``Lower(email)``, which is exactly the expression
+        of the functional index on MinimalAbstractUser, so it never scans the table.
+        """
+        email = self.normalize_email(email).lower()
+        return self.alias(email_lower=Lower("email")).filter(email_lower=email)
+
+    def _filter_by_emails(self, emails: Iterable[str]):
+        """case-insensitive match of lowercase emails on Lower(email), like filter_by_email"""
+        return self.annotate(email_lower=Lower("email")).filter(email_lower__in=list(emails))
+
+    def get_by_natural_key(self, username):
+        """
+        Exact match first. Legacy rows that differ only in case are matched
+        case-insensitively, but only if that match is unambiguous.
+        """
+        try:
+            return self.get(**{self.model.USERNAME_FIELD: username})
+        except self.model.DoesNotExist:
+            pass
+        users = list(self.filter_by_email(username)[:2])
+        if len(users) != 1:
+            raise self.model.DoesNotExist(
+                f"{self.model._meta.object_name} matching query does not exist."
+            )
+        return users[0]
+
+    def bulk_create_users(
+        self,
+        rows: Iterable[dict[str, Any]],
+        batch_size: int = 1000,
+        processes: Optional[int] = None,
+    ) -> int:
+        """
+        Create users from dicts of model fields, e.g. streamed from a legacy system.
+        Passwords are given either in cleartext as ``password``, which gets hashed with
+        the default hasher on a pool of ``processes`` (cpu count by default, <= 1 hashes
+        in-process), or as an existing hash in ``password_hash``, which is stored as-is.
+        Rows without either get an unusable password. Emails are normalized, and rows
+        whose email already exists are skipped. Returns the number of created users.
+        """
+        if processes is None:
+            processes = os.cpu_count() or 1
+        rows = iter(rows)
+        created = 0
+        pool = ProcessPoolExecutor(processes) if processes > 1 else None
+        try:
+            while batch := list(itertools.islice(rows, batch_size)):
+                users = self._prepare_bulk_users(batch, pool, processes)
+                if users:
+                    # rows created meanwhile conflict and are ignored, so count the difference
+                    matching = self._filter_by_emails(user.email for user in users)
+                    with transaction.atomic(using=self.db):
+                        before = matching.count()
+                        self.bulk_create(users, batch_size=batch_size, ignore_conflicts=True)
+                        created += matching.count() - before
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return created
+
+    def _prepare_bulk_users(
+        self, batch: list[dict[str, Any]], pool: Optional[Executor], processes: int
+    ) -> list:
+        fields_by_email: dict[str, dict[str, Any]] = {}
+        for row in batch:
+            fields = dict(row)
+            email = self.normalize_email(fields.pop("email", None) or "").lower()
+            if email:
+                fields_by_email.setdefault(email, fields)
+        existing = self._filter_by_emails(fields_by_email).values_list("email_lower", flat=True)
+        for email in existing.iterator():
+            fields_by_email.pop(email, None)
+
+        cleartext = {
+            email: fields["password"]
+            for email, fields in fields_by_email.items()
+            if fields.get("password")
+        }
+        hashes = dict(
+            zip(cleartext, self._hash_passwords(list(cleartext.values()), pool, processes))
+        )
+
+        users = []
+        for email, fields in fields_by_email.items():
+            fields.pop("password", None)
+            password_hash = hashes.get(email) or fields.pop("password_hash", None)
+            fields.pop("password_hash", None)
+            users.append(
+                self.model(email=email, password=password_hash or make_password(None), **fields)
+            )
+        return users
+
+    def _hash_passwords(
+        self, passwords: list[str], pool: Optional[Executor], processes: int
+    ) -> list[str]:
+        hasher_class = type(get_hasher())
+        if pool is None or len(passwords) < 2:
+            return hash_passwords(hasher_class, passwords)
+        chunk_size = -(-len(passwords) // processes)
+        chunks = [passwords[i : i + chunk_size] for i in range(0, len(passwords), chunk_size)]
+        return [
+            password_hash
+            for hashes in pool.map(hash_passwords, [hasher_class] * len(chunks), chunks)
+            for password_hash in hashes
+        ]
+
     def create_user(self, email, password=None, **extra_fields):  # type: ignore[override]
         extra_fields.setdefault("is_staff", False)
         extra_fields.setdefault("is_superuser", False)
@@ -74,6 +192,28 @@ class MinimalAbstractUser(AbstractBaseUser, PermissionsMixin):
         verbose_name = _("user")
         verbose_name_plural = _("users")
         abstract = True
+        # subclasses that declare their own Meta must inherit this one to keep the index.
+        # app label and class are truncated to stay within the 30 characters allowed.
+        indexes = [
+            models.Index(Lower("email"), name="%(app_label).9s_%(class).11s_email_ci"),
+        ]
+
+    @classmethod
+    def check(cls, **kwargs):
+        return [*super().check(**kwargs), *cls._check_email_index()]
+
+    @classmethod
+    def _check_email_index(cls):
+        if any(index.expressions == (Lower("email"),) for index in cls._meta.indexes):
+            return []
+        return [
+            checks.Warning(
+                "The case-insensitive email index of MinimalAbstractUser is missing.",
+                hint="Let Meta inherit from MinimalAbstractUser.Meta.",
+                obj=cls,
+                id="minimaluser.W001",
+            )
+        ]
 
     def clean(self):
         super().clean()
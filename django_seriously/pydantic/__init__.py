@@ -1,12 +1,22 @@
-# import from this module means we likely also want to have DRF and drf-spectacular ready
-try:
-    # attempt to register DRF fields if feasible
-    import django_seriously.pydantic.drf_fields  # noqa: F401
-except ImportError:
-    pass
+import functools
 
-try:
-    # attempt to load drf-spectacular extensions if feasible
-    import django_seriously.pydantic.schema  # noqa: F401
-except ImportError:
-    pass
+
+@functools.cache
+def register_integrations() -> None:
+    """
+    Register the DRF serializer fields and the drf-spectacular extension, if those
+    packages are available. Deferred to ``SeriouslyConfig.ready`` or, if that app is
+    not installed, to the first model using one of the fields, so that importing this
+    package does not pull in DRF and drf-spectacular.
+    """
+    try:
+        # attempt to register DRF fields if feasible
+        import django_seriously.pydantic.drf_fields  # noqa: F401
+    except ImportError:
+        pass
+
+    try:
+        # attempt to load drf-spectacular extensions if feasible
+        import django_seriously.pydantic.schema  # noqa: F401
+    except ImportError:
+        pass
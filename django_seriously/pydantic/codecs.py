@@ -0,0 +1,98 @@
+import zlib
+from typing import Any, Callable
+
+from django.core.exceptions import ImproperlyConfigured
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover
+    msgpack = None  # type: ignore[assignment]
+
+# bytes-like objects as returned by DB drivers for binary columns
+Buffer = bytes | bytearray | memoryview
+
+
+class Compressor:
+    """
+    Compression stage for binary pydantic fields. Decompression accepts any buffer
+    (e.g. memoryview from the DB driver) without copying it beforehand.
+    """
+
+    name = "none"
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: Buffer) -> Buffer:
+        return data
+
+
+class ZlibCompressor(Compressor):
+    name = "zlib"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: Buffer) -> bytes:
+        return zlib.decompress(data)
+
+
+class ZstdCompressor(Compressor):
+    name = "zstd"
+
+    def __init__(self, level: int = 3):
+        self.compressor = zstandard.ZstdCompressor(level=level)
+        self.decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.compress(data)
+
+    def decompress(self, data: Buffer) -> bytes:
+        return self.decompressor.decompress(data)
+
+
+COMPRESSORS: dict[str, Callable[[], Compressor]] = {
+    "none": Compressor,
+    "zlib": ZlibCompressor,
+}
+if zstandard is not None:
+    COMPRESSORS["zstd"] = ZstdCompressor
+
+ENCODINGS = ["json"]
+if msgpack is not None:
+    ENCODINGS.append("msgpack")
+
+
+def get_compressor(name: str) -> Compressor:
+    try:
+        return COMPRESSORS[name]()
+    except KeyError:
+        raise ImproperlyConfigured(
+            f'Unknown compression "{name}". Available choices are {list(COMPRESSORS)}. '
+            f'"zstd" requires the "zstandard" package.'
+        )
+
+
+def check_encoding(name: str) -> str:
+    if name not in ENCODINGS:
+        raise ImproperlyConfigured(
+            f'Unknown encoding "{name}". Available choices are {ENCODINGS}. '
+            f'"msgpack" requires the "msgpack" package.'
+        )
+    return name
+
+
+def msgpack_dumps(value: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    return msgpack.packb(value, default=default)
+
+
+def msgpack_loads(data: Buffer) -> Any:
+    return msgpack.unpackb(data)
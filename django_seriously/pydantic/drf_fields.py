@@ -3,14 +3,19 @@ from rest_framework.fields import JSONField
 from rest_framework.serializers import ModelSerializer
 
 from django_seriously.pydantic.mixin import PydanticMixin
+from django_seriously.pydantic.model_fields import PydanticBinaryField as PydanticBinaryModelField
 from django_seriously.pydantic.model_fields import PydanticJSONField as PydanticJSONModelField
+from django_seriously.pydantic.model_fields import ValidatedBinaryField as ValidatedBinaryModelField
 from django_seriously.pydantic.model_fields import ValidatedJSONField as ValidatedJSONModelField
+from django_seriously.pydantic.model_fields import _register_integrations_on_use
 
 
 class ValidatedJSONField(PydanticMixin, JSONField):
     def __init__(self, **kwargs):
         self.structure = kwargs.pop("structure", None)
         super().__init__(**kwargs)
+        # serializer-only projects never instantiate a model field
+        _register_integrations_on_use()
 
     def to_internal_value(self, data):
         try:
@@ -30,6 +35,8 @@ def patch_drf_model_serializer():
     # register mapping
     ModelSerializer.serializer_field_mapping[ValidatedJSONModelField] = ValidatedJSONField
     ModelSerializer.serializer_field_mapping[PydanticJSONModelField] = ValidatedJSONField
+    ModelSerializer.serializer_field_mapping[ValidatedBinaryModelField] = ValidatedJSONField
+    ModelSerializer.serializer_field_mapping[PydanticBinaryModelField] = ValidatedJSONField
 
     ModelSerializer._build_standard_field = ModelSerializer.build_standard_field  # type: ignore[attr-defined]
 
@@ -1,3 +1,6 @@
+import copy
+from typing import Any
+
 from django.core.exceptions import ValidationError
 from django.forms import JSONField
 from django.forms.fields import CharField, InvalidJSONInput, JSONString
@@ -6,10 +9,46 @@ from django_seriously.pydantic.mixin import PydanticMixin
 
 
 class ValidatedJSONFormField(PydanticMixin, JSONField):
+    """
+    Parsing and dumping of the input text are memoized per form instance, as forms
+    parse the same input in clean, bound_data and has_changed. The memo is keyed
+    on the raw JSON text and callers get copies of the parsed value, so changes
+    to e.g. cleaned_data don't leak into later renders. Form instances get their
+    own memo when the declared field is copied for them.
+    """
+
     def __init__(self, structure, **kwargs):
         self.structure = structure
+        self._parsed: dict[str | bytes, Any] = {}
+        self._dumped: dict[str | bytes, bytes] = {}
         super().__init__(**kwargs)
 
+    def __deepcopy__(self, memo):
+        result = super().__deepcopy__(memo)
+        result._parsed = {}
+        result._dumped = {}
+        return result
+
+    def _loads(self, value: Any) -> Any:
+        if not isinstance(value, (str, bytes)):
+            return super()._loads(value)
+        if value not in self._parsed:
+            try:
+                self._parsed[value] = super()._loads(value)
+            except ValidationError as e:
+                self._parsed[value] = e
+        result = self._parsed[value]
+        if isinstance(result, ValidationError):
+            raise copy.copy(result)
+        return copy.deepcopy(result)
+
+    def _dump_data(self, data: Any) -> bytes:
+        if not isinstance(data, (str, bytes)) or self.disabled or data in self.empty_values:
+            return self._dump_json(self.to_python(data))
+        if data not in self._dumped:
+            self._dumped[data] = self._dump_json(self.to_python(data))
+        return self._dumped[data]
+
     def prepare_value(self, value):
         if isinstance(value, InvalidJSONInput):
             return value
@@ -52,4 +91,4 @@ class PydanticJSONFormField(ValidatedJSONFormField):
             return True
         # For purposes of seeing whether something has changed, True isn't the
         # same as 1 and the order of keys doesn't matter.
-        return self._dump_json(initial) != self._dump_json(self.to_python(data))
+        return self._dump_json(initial) != self._dump_data(data)
@@ -0,0 +1,206 @@
+import datetime
+import decimal
+import enum
+import json
+import types
+import typing
+import uuid
+from typing import Any
+
+import pydantic
+from django.db import connections, models
+from django.db.backends.utils import names_digest
+from django.db.models.fields.json import compile_json_path
+from pydantic import BaseModel, TypeAdapter
+
+
+class Indexed:
+    """
+    Marker for fields of a pydantic structure that should be indexed by ValidatedJSONField
+    and PydanticJSONField. Only top-level fields of a BaseModel structure are considered.
+
+        class Address(BaseModel):
+            city: Annotated[str, Indexed()]
+    """
+
+
+TEXT_TYPES = (str, datetime.datetime, datetime.date, datetime.time, uuid.UUID, decimal.Decimal)
+
+
+def get_indexed_keys(structure: TypeAdapter) -> dict[str, Any]:
+    """maps keys marked with Indexed to their (non-optional) annotation"""
+    model = getattr(structure, "_type", None)
+    if not isinstance(model, type) or not issubclass(model, BaseModel):
+        return {}
+    return {
+        name: _strip_optional(field_info.annotation)
+        for name, field_info in model.model_fields.items()
+        if any(m is Indexed or isinstance(m, Indexed) for m in field_info.metadata)
+    }
+
+
+def get_key_kind(annotation: Any) -> str:
+    """database representation used for comparing and indexing values of a key"""
+    if not isinstance(annotation, type):
+        return "json"
+    if issubclass(annotation, bool):
+        return "boolean"
+    if issubclass(annotation, int):
+        return "integer"
+    if issubclass(annotation, float):
+        return "float"
+    if issubclass(annotation, TEXT_TYPES) or issubclass(annotation, enum.Enum):
+        return "text"
+    return "json"
+
+
+def _strip_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+class StructureValueMixin:
+    """
+    Coerces query values with the structure's type for the key and serializes them like
+    the model field does, e.g. datetime objects are compared as their JSON string.
+    """
+
+    def __init__(self, adapter: TypeAdapter, encoder: Any, **kwargs):
+        self.adapter = adapter
+        self.encoder = encoder
+        super().__init__(**kwargs)
+
+    def get_prep_value(self, value):
+        try:
+            value = json.loads(json.dumps(self.adapter.validate_python(value), cls=self.encoder))
+        except (pydantic.ValidationError, TypeError, ValueError):
+            # not a complete value (e.g. pattern lookups), leave it to the database
+            pass
+        return super().get_prep_value(value)  # type: ignore[misc]
+
+
+class StructureIntegerValue(StructureValueMixin, models.BigIntegerField):
+    pass
+
+
+class StructureFloatValue(StructureValueMixin, models.FloatField):
+    pass
+
+
+class StructureBooleanValue(StructureValueMixin, models.BooleanField):
+    pass
+
+
+class StructureTextValue(StructureValueMixin, models.TextField):
+    pass
+
+
+VALUE_FIELDS: dict[str, type[models.Field]] = {
+    "integer": StructureIntegerValue,
+    "float": StructureFloatValue,
+    "boolean": StructureBooleanValue,
+    "text": StructureTextValue,
+}
+
+POSTGRES_CASTS = {
+    "integer": "::bigint",
+    "float": "::double precision",
+    "boolean": "::boolean",
+    "text": "",
+}
+
+
+class StructureKeyTransform(models.Transform):
+    """
+    Extracts a top-level key of a pydantic JSON field typed according to the structure.
+    Indexes and typed lookups use this very expression, so both compile to identical SQL
+    and the database is able to match the query to the index. The key is inlined as a
+    literal for the same reason.
+    """
+
+    def __init__(self, key_name: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.key_name = str(key_name)
+
+    @property
+    def kind(self) -> str:
+        return get_key_kind(self.lhs.output_field.indexed_keys.get(self.key_name))
+
+    def _resolve_output_field(self):
+        field = self.lhs.output_field
+        if self.kind == "json":
+            return models.JSONField(encoder=field.encoder)
+        annotation = field.indexed_keys[self.key_name]
+        return VALUE_FIELDS[self.kind](adapter=TypeAdapter(annotation), encoder=field.encoder)
+
+    def _literal(self, value: str) -> str:
+        return "'%s'" % value.replace("'", "''").replace("%", "%%")
+
+    def as_sql(self, compiler, connection):
+        lhs, params = compiler.compile(self.lhs)
+        path = self._literal(compile_json_path([self.key_name]))
+        return f"JSON_EXTRACT({lhs}, {path})", params
+
+    def as_oracle(self, compiler, connection):
+        lhs, params = compiler.compile(self.lhs)
+        path = self._literal(compile_json_path([self.key_name]))
+        function = "JSON_QUERY" if self.kind == "json" else "JSON_VALUE"
+        return f"{function}({lhs}, {path})", params
+
+    def as_postgresql(self, compiler, connection):
+        lhs, params = compiler.compile(self.lhs)
+        key = self._literal(self.key_name)
+        if self.kind == "json":
+            return f"({lhs} -> {key})", params
+        return f"({lhs} ->> {key}){POSTGRES_CASTS[self.kind]}", params
+
+
+class StructureKeyTransformFactory:
+    def __init__(self, key_name: str):
+        self.key_name = key_name
+
+    def __call__(self, *args, **kwargs):
+        return StructureKeyTransform(self.key_name, *args, **kwargs)
+
+
+# vendors that can index the expression of StructureKeyTransform. MySQL rejects
+# functional indexes returning JSON, and MariaDB has no functional indexes at all.
+STRUCTURE_INDEX_VENDORS = ("sqlite", "postgresql", "oracle")
+
+
+def get_unsupported_vendors() -> set[str]:
+    """vendors of the configured databases on which StructureIndex cannot be created"""
+    return {connections[alias].vendor for alias in connections} - set(STRUCTURE_INDEX_VENDORS)
+
+
+class StructureIndex(models.Index):
+    """
+    Expression index on a key marked with Indexed. Scalar keys get a regular (b-tree)
+    index. On PostgreSQL, non-scalar keys (lists, dicts, nested models) get a GIN index
+    instead, which serves containment lookups.
+    """
+
+    def __init__(self, field_name: str, key_name: str, *, name: str, **kwargs):
+        self.field_name = field_name
+        self.key_name = key_name
+        super().__init__(StructureKeyTransform(key_name, models.F(field_name)), name=name, **kwargs)
+
+    @classmethod
+    def for_model(cls, model: type[models.Model], field_name: str, key_name: str):
+        table = model._meta.db_table
+        digest = names_digest(table, field_name, key_name, length=6)
+        return cls(field_name, key_name, name=f"{table[:12]}_{key_name[:8]}_{digest}")
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        if schema_editor.connection.vendor == "postgresql":
+            field = model._meta.get_field(self.field_name)
+            if get_key_kind(field.indexed_keys.get(self.key_name)) == "json":
+                using = " USING gin"
+        return super().create_sql(model, schema_editor, using=using, **kwargs)
+
+    def deconstruct(self):
+        path, _, kwargs = super().deconstruct()
+        return path, (self.field_name, self.key_name), kwargs
@@ -3,10 +3,13 @@ from typing import Any
 from django.core import exceptions
 from pydantic import BaseModel, TypeAdapter, ValidationError
 
+from django_seriously.utils.metrics import instrument
+
 
 class PydanticMixin:
     structure: TypeAdapter
 
+    @instrument("pydantic.dump_json")
     def _dump_json(self, value: Any, indent: int | None = None) -> bytes:
         try:
             return self.structure.dump_json(value, indent=indent)
@@ -15,14 +18,15 @@ class PydanticMixin:
                 f"Invalid type structure for {self.structure._type.__name__}: {e}"
             )
 
-    def _dump_python(self, value: Any) -> dict[str, Any]:
+    def _dump_python(self, value: Any, mode: str = "python") -> dict[str, Any]:
         try:
-            return self.structure.dump_python(value)
+            return self.structure.dump_python(value, mode=mode)
         except ValidationError as e:
             raise exceptions.ValidationError(
                 f"Invalid type structure for {self.structure._type.__name__}: {e}"
             )
 
+    @instrument("pydantic.loads")
     def _loads(self, value: Any) -> BaseModel:
         try:
             if isinstance(value, (str, bytes)):
@@ -1,24 +1,72 @@
+import hashlib
+import json
 from typing import Any
 
+from django.apps import apps
+from django.core import checks
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.utils.functional import cached_property
 from pydantic import TypeAdapter
 
+from django_seriously.pydantic import register_integrations
+from django_seriously.pydantic.codecs import (
+    Buffer,
+    check_encoding,
+    get_compressor,
+    msgpack_dumps,
+    msgpack_loads,
+)
 from django_seriously.pydantic.forms import PydanticJSONFormField, ValidatedJSONFormField
+from django_seriously.pydantic.indexes import (
+    StructureIndex,
+    StructureKeyTransformFactory,
+    get_indexed_keys,
+    get_key_kind,
+    get_unsupported_vendors,
+)
 from django_seriously.pydantic.mixin import PydanticMixin
 
 
-class ValidatedJSONField(PydanticMixin, models.JSONField):
+def _register_integrations_on_use() -> None:
+    # otherwise registered in SeriouslyConfig.ready
+    if not apps.is_installed("django_seriously"):
+        register_integrations()
+
+
+class PydanticModelFieldMixin(PydanticMixin):
+    """change tracking shared by the JSON and binary model fields"""
+
+    encoder: type[json.JSONEncoder]
+
+    def fingerprint(self, value: Any) -> bytes:
+        """digest of the serialized value. used for detecting unchanged content"""
+        if value is None:
+            return b""
+        return self._digest(json.dumps(value, cls=self.encoder, sort_keys=True).encode())
+
+    def _digest(self, data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class ValidatedJSONField(PydanticModelFieldMixin, models.JSONField):
     """
     Model field that validates JSON data structures according to a specified
     pydantic model (structure). Data remains in generic python objects, while
     pydantic is only used for validation on save.
+
+    With ``track_changes=True``, ``DjangoBaseModel`` fingerprints the loaded value
+    and leaves the column out of the UPDATE if the content did not change.
+
+    Structure fields annotated with ``Indexed`` get an expression index, and lookups on
+    them (e.g. ``field__city="Berlin"``) coerce the query value to the field's type.
     """
 
-    def __init__(self, structure: Any, **kwargs):
+    def __init__(self, structure: Any, track_changes: bool = False, **kwargs):
         self.structure = (
             structure if isinstance(structure, TypeAdapter) else TypeAdapter(type=structure)
         )
+        self.track_changes = track_changes
         kwargs.setdefault("encoder", DjangoJSONEncoder)
         super().__init__(**kwargs)
 
@@ -26,8 +74,50 @@ class ValidatedJSONField(PydanticMixin, models.JSONField):
         name, path, args, kwargs = super().deconstruct()
         if self.structure is not None:
             kwargs["structure"] = self.structure
+        if self.track_changes:
+            kwargs["track_changes"] = True
         return name, path, args, kwargs
 
+    @cached_property
+    def indexed_keys(self) -> dict[str, Any]:
+        return get_indexed_keys(self.structure)
+
+    def contribute_to_class(self, cls, name, private_only=False):
+        super().contribute_to_class(cls, name, private_only=private_only)
+        _register_integrations_on_use()
+        # reported by the field check on databases that cannot index the keys
+        if cls._meta.abstract or not self.indexed_keys or get_unsupported_vendors():
+            return
+        existing = {index.name for index in cls._meta.indexes}
+        for key_name in self.indexed_keys:
+            index = StructureIndex.for_model(cls, name, key_name)
+            # rendered migration states already carry the index
+            if index.name not in existing:
+                cls._meta.indexes.append(index)
+                # make the migration autodetector consider the indexes option
+                cls._meta.original_attrs.setdefault("indexes", cls._meta.indexes)
+
+    def check(self, **kwargs):
+        return [*super().check(**kwargs), *self._check_indexed_keys()]
+
+    def _check_indexed_keys(self) -> list[checks.CheckMessage]:
+        vendors = get_unsupported_vendors() if self.indexed_keys else set()
+        if not vendors:
+            return []
+        return [
+            checks.Warning(
+                f"Indexed keys of this field are not indexed on {', '.join(sorted(vendors))}.",
+                hint="Lookups on them still work, but scan the table.",
+                obj=self,
+                id="django_seriously.W001",
+            )
+        ]
+
+    def get_transform(self, name):
+        if name in self.indexed_keys and get_key_kind(self.indexed_keys[name]) != "json":
+            return StructureKeyTransformFactory(name)
+        return super().get_transform(name)
+
     def validate(self, value, model_instance):
         # Checks whether value is JSON serializable with given encoder
         super(models.JSONField, self).validate(value, model_instance)
@@ -68,6 +158,12 @@ class PydanticJSONField(ValidatedJSONField):
             return value
         return self._loads(value)
 
+    def fingerprint(self, value: Any) -> bytes:
+        if value is None:
+            return b""
+        # not yet validated values (e.g. assigned dicts) are fingerprinted as they are
+        return self._digest(self.structure.dump_json(value, warnings=False))
+
     def get_prep_value(self, value):
         if value is None:
             return value
@@ -83,3 +179,136 @@ class PydanticJSONField(ValidatedJSONField):
                 **kwargs,
             }
         )
+
+
+class ValidatedBinaryField(PydanticModelFieldMixin, models.BinaryField):
+    """
+    Sibling of ValidatedJSONField for large documents that are never queried by
+    content. The document is stored in a binary column, compressed with ``compression``
+    ("zlib", "none" or "zstd" if installed) and encoded with ``encoding`` ("json" or
+    "msgpack" if installed).
+    """
+
+    empty_strings_allowed = False
+
+    def __init__(
+        self,
+        structure: Any,
+        compression: str = "zlib",
+        encoding: str = "json",
+        track_changes: bool = False,
+        **kwargs,
+    ):
+        self.structure = (
+            structure if isinstance(structure, TypeAdapter) else TypeAdapter(type=structure)
+        )
+        self.compression = compression
+        self.compressor = get_compressor(compression)
+        self.encoding = check_encoding(encoding)
+        self.track_changes = track_changes
+        self.encoder = DjangoJSONEncoder
+        kwargs.setdefault("editable", True)
+        super().__init__(**kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["structure"] = self.structure
+        if self.compression != "zlib":
+            kwargs["compression"] = self.compression
+        if self.encoding != "json":
+            kwargs["encoding"] = self.encoding
+        if self.track_changes:
+            kwargs["track_changes"] = True
+        # editable is the default here, contrary to BinaryField
+        if self.editable:
+            kwargs.pop("editable", None)
+        else:
+            kwargs["editable"] = False
+        return name, path, args, kwargs
+
+    def contribute_to_class(self, cls, name, private_only=False):
+        super().contribute_to_class(cls, name, private_only=private_only)
+        _register_integrations_on_use()
+
+    def validate(self, value, model_instance):
+        super(models.BinaryField, self).validate(value, model_instance)
+        self._loads(value)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return self._decode(self.compressor.decompress(value))
+
+    def to_python(self, value):
+        return value
+
+    def get_prep_value(self, value):
+        if value is None:
+            return value
+        return self.compressor.compress(self._encode(value))
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
+
+    def _encode(self, value: Any) -> bytes:
+        if self.encoding == "msgpack":
+            return msgpack_dumps(value, default=self.encoder().default)
+        return json.dumps(value, cls=self.encoder).encode()
+
+    def _decode(self, data: Buffer) -> Any:
+        if self.encoding == "msgpack":
+            return msgpack_loads(data)
+        return json.loads(data if isinstance(data, bytes) else bytes(data))
+
+    def formfield(self, form_class=None, choices_form_class=None, **kwargs):
+        return super().formfield(
+            **{
+                "form_class": form_class or ValidatedJSONFormField,
+                "structure": self.structure,
+                "encoder": self.encoder,
+                **kwargs,
+            }
+        )
+
+
+class PydanticBinaryField(ValidatedBinaryField):
+    """
+    Sibling of PydanticJSONField for large documents that are never queried by
+    content. Data will be deserialized to an instance of the pydantic model class.
+    """
+
+    def validate(self, value, model_instance):
+        super(models.BinaryField, self).validate(value, model_instance)
+        self._loads(self._dump_json(value))
+
+    def fingerprint(self, value: Any) -> bytes:
+        if value is None:
+            return b""
+        return self._digest(self.structure.dump_json(value, warnings=False))
+
+    def to_python(self, value):
+        if value is None:
+            return value
+        return self._loads(value)
+
+    def value_to_string(self, obj):
+        return self._dump_python(self.value_from_object(obj), mode="json")
+
+    def _encode(self, value: Any) -> bytes:
+        if self.encoding == "msgpack":
+            return msgpack_dumps(self._dump_python(value, mode="json"))
+        return self._dump_json(value)
+
+    def _decode(self, data: Buffer) -> Any:
+        if self.encoding == "msgpack":
+            return self._loads(msgpack_loads(data))
+        return self._loads(data if isinstance(data, bytes) else bytes(data))
+
+    def formfield(self, form_class=None, choices_form_class=None, **kwargs):
+        return super().formfield(
+            **{
+                "form_class": form_class or PydanticJSONFormField,
+                "structure": self.structure,
+                **kwargs,
+            }
+        )
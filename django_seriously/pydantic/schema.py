@@ -1,14 +1,68 @@
+import copy
+import inspect
+from typing import Any
+
+from django.core.signals import setting_changed
+from django.utils import translation
 from drf_spectacular.drainage import error
 from drf_spectacular.extensions import OpenApiSerializerFieldExtension
 from drf_spectacular.plumbing import (
+    ComponentRegistry,
+    ResolvedComponent,
     _get_type_hint_origin,
     build_array_type,
     build_basic_type,
     is_higher_order_type_hint,
 )
 from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.views import SpectacularAPIView
+from rest_framework.response import Response
 from rest_framework.utils.serializer_helpers import ReturnList
 
+SCHEMA_REF_PREFIX = "#/components/schemas/"
+
+# (structure, direction) -> (field schema, [(name, object, schema) of referenced components])
+_structure_cache: dict[tuple[Any, str], tuple[dict, list[tuple[str, Any, dict]]]] = {}
+# (path, version, language) -> generated schema of CachedSpectacularAPIView
+_view_cache: dict[tuple[str, Any, str | None], dict] = {}
+
+
+def clear_schema_cache(**kwargs) -> None:
+    _structure_cache.clear()
+    _view_cache.clear()
+
+
+def _clear_schema_cache_on_change(setting, **kwargs) -> None:
+    if setting in ("SPECTACULAR_SETTINGS", "ROOT_URLCONF"):
+        clear_schema_cache()
+
+
+setting_changed.connect(_clear_schema_cache_on_change)
+
+
+def _collect_components(
+    schema: Any, registry: ComponentRegistry, found: dict[str, tuple[str, Any, dict]]
+) -> dict[str, tuple[str, Any, dict]]:
+    """recursively gather all schema components referenced by schema"""
+    if isinstance(schema, dict):
+        ref = schema.get("$ref")
+        if isinstance(ref, str) and ref.startswith(SCHEMA_REF_PREFIX):
+            name = ref[len(SCHEMA_REF_PREFIX) :]
+            if name not in found:
+                try:
+                    component = registry[(name, ResolvedComponent.SCHEMA)]
+                except KeyError:
+                    return found
+                # snapshot, as postprocessing hooks modify the final schema in place
+                found[name] = (name, component.object, copy.deepcopy(component.schema))
+                _collect_components(component.schema, registry, found)
+        for value in schema.values():
+            _collect_components(value, registry, found)
+    elif isinstance(schema, list):
+        for item in schema:
+            _collect_components(item, registry, found)
+    return found
+
 
 class PydanticJsonFieldExtension(OpenApiSerializerFieldExtension):
     """
@@ -19,6 +73,9 @@ class PydanticJsonFieldExtension(OpenApiSerializerFieldExtension):
     are designed. The outermost class (the @extend_schema argument) has to be a subclass
     of pydantic.BaseModel. Inside this outermost BaseModel, any combination of dataclass
     and BaseModel can be used.
+
+    Schemas are memoized per structure and direction across schema generations. Cache
+    hits only re-register the referenced components with the current generation.
     """
 
     target_class = "django_seriously.pydantic.drf_fields.ValidatedJSONField"
@@ -29,6 +86,26 @@ class PydanticJsonFieldExtension(OpenApiSerializerFieldExtension):
             error("Could not find structure attribute containg model on ValidatedJSONField")
             return build_basic_type(OpenApiTypes.ANY)
 
+        key = (self.target.structure._type, direction)
+        try:
+            schema, components = _structure_cache[key]
+        except KeyError:
+            schema = self._map_structure(auto_schema, direction)
+            components = list(_collect_components(schema, auto_schema.registry, {}).values())
+            _structure_cache[key] = copy.deepcopy(schema), components
+            return schema
+        except TypeError:
+            # unhashable structure, skip caching
+            return self._map_structure(auto_schema, direction)
+
+        for name, obj, component_schema in components:
+            component = ResolvedComponent(name, ResolvedComponent.SCHEMA, object=obj)
+            if component not in auto_schema.registry:
+                component.schema = copy.deepcopy(component_schema)
+                auto_schema.registry.register(component)
+        return copy.deepcopy(schema)
+
+    def _map_structure(self, auto_schema, direction):
         is_list = False
         structure = self.target.structure._type
 
@@ -38,4 +115,46 @@ class PydanticJsonFieldExtension(OpenApiSerializerFieldExtension):
                 is_list, structure = True, args[0]
 
         schema = auto_schema._map_serializer_field(structure, direction)
+
+        # emit named object structures (e.g. dataclasses) as shared component
+        if (
+            inspect.isclass(structure)
+            and schema.get("type") == "object"
+            and schema.get("properties")
+        ):
+            component = ResolvedComponent(
+                name=structure.__name__,
+                type=ResolvedComponent.SCHEMA,
+                object=structure,
+                schema=schema,
+            )
+            auto_schema.registry.register_on_missing(component)
+            schema = component.ref
+
         return build_array_type(schema) if is_list else schema
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    Warm-cache version of SpectacularAPIView. The schema is generated once per process
+    for each path, version and language instead of on every request. Only public schemas
+    are cached, as other schemas depend on the requesting user's permissions.
+    """
+
+    def _get_schema_response(self, request):
+        if not self.serve_public:
+            return super()._get_schema_response(request)
+
+        version = self.api_version or request.version or self._get_version_parameter(request)
+        key = (request.path, version, translation.get_language())
+        if key not in _view_cache:
+            generator = self.generator_class(
+                urlconf=self.urlconf, api_version=version, patterns=self.patterns
+            )
+            _view_cache[key] = generator.get_schema(request=request, public=True)
+        return Response(
+            data=_view_cache[key],
+            headers={
+                "Content-Disposition": f'inline; filename="{self._get_filename(request, version)}"'
+            },
+        )
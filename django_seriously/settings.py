@@ -1,20 +1,43 @@
 from typing import Any
 
 from django.conf import settings
+from django.core.signals import setting_changed
 
 from django_seriously.utils.settings import AppSettings
 
 DEFAULTS: dict[str, Any] = {
     "AUTH_TOKEN_SCOPES": [],
     "AUTH_TOKEN_MODEL": "django_seriously.authtoken.models.Token",
+    "AUTH_TOKEN_ID_FACTORY": "uuid.uuid4",
     "MAKE_PASSWORD": "django_seriously.authtoken.utils.make_password",
     "CHECK_PASSWORD_REHASH": "django_seriously.authtoken.utils.check_password_rehash",
+    "VALIDATION_PLANS": True,
+    "ADMIN_ACTION_EXECUTOR": "django_seriously.utils.executors.ThreadPoolJobExecutor",
+    "PERMISSION_CACHE": "default",
+    "PERMISSION_CACHE_TIMEOUT": 300,
+    "HASHING_WORKERS": 4,
+    "METRICS_SINK": None,
 }
 
-IMPORT_STRINGS = ["AUTH_TOKEN_MODEL", "MAKE_PASSWORD", "CHECK_PASSWORD_REHASH"]
+IMPORT_STRINGS = [
+    "AUTH_TOKEN_MODEL",
+    "AUTH_TOKEN_ID_FACTORY",
+    "MAKE_PASSWORD",
+    "CHECK_PASSWORD_REHASH",
+    "ADMIN_ACTION_EXECUTOR",
+    "METRICS_SINK",
+]
 
 seriously_settings = AppSettings(
     user_settings=getattr(settings, "SERIOUSLY_SETTINGS", {}),
     defaults=DEFAULTS,
     import_strings=IMPORT_STRINGS,
 )
+
+
+def reload_settings(setting, value, **kwargs) -> None:
+    if setting == "SERIOUSLY_SETTINGS":
+        seriously_settings.reload(user_settings=value or {})
+
+
+setting_changed.connect(reload_settings)
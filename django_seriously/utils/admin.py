@@ -1,20 +1,76 @@
 import abc
+import json
+import uuid
+from collections.abc import Iterable
 from typing import Any, Generic, Optional, Type, TypeVar, Union
 
 from django.contrib import messages
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.mixins import AccessMixin
-from django.db import models, transaction
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.core.signals import setting_changed
+from django.db import DatabaseError, connections, models, router, transaction
+from django.db.models.constants import LOOKUP_SEP
 from django.http.response import HttpResponse, JsonResponse
-from django.urls.base import reverse
+from django.urls.base import get_script_prefix, get_urlconf, reverse
 from django.urls.conf import include, path
-from django.utils.functional import Promise
+from django.urls.exceptions import NoReverseMatch
+from django.utils.functional import Promise, cached_property
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 from django.views.generic.base import View
 
+from django_seriously.utils.executors import get_executor
+from django_seriously.utils.metrics import instrument
+
 _T = TypeVar("_T", bound=models.Model)
 
+# stand-ins for the pk when reversing url templates, by pk type
+URL_PK_PLACEHOLDERS: dict[type, str] = {
+    uuid.UUID: "0bad1dea-0000-4000-8000-000000000000",
+    int: "987654321987654321",
+}
+# (viewname, args, pk type, script prefix, language, urlconf) -> url template or None
+_url_templates: dict[tuple, Optional[str]] = {}
+
+
+def _clear_url_templates_on_change(setting, **kwargs) -> None:
+    if setting == "ROOT_URLCONF":
+        _url_templates.clear()
+
+
+setting_changed.connect(_clear_url_templates_on_change)
+
+
+def reverse_pk(viewname: str, pk: Any, *args: str) -> str:
+    """
+    Same as ``reverse(viewname, args=[pk, *args])``, but the route is only resolved once
+    per script prefix, language and urlconf into a template that the pk is filled into.
+    The template is used for int and UUID pks, which need no quoting.
+    """
+    if type(pk) not in URL_PK_PLACEHOLDERS:
+        return reverse(viewname, args=[pk, *args])
+
+    key = (viewname, args, type(pk), get_script_prefix(), get_language(), get_urlconf())
+    try:
+        template = _url_templates[key]
+    except KeyError:
+        placeholder = URL_PK_PLACEHOLDERS[type(pk)]
+        try:
+            template = reverse(viewname, args=[placeholder, *args])
+        except NoReverseMatch:
+            template = None
+        if template is not None and template.count(placeholder) != 1:
+            template = None
+        _url_templates[key] = template
+
+    if template is None:
+        return reverse(viewname, args=[pk, *args])
+    return template.replace(URL_PK_PLACEHOLDERS[type(pk)], str(pk))
+
 
 class AdminRequiredMixin(AccessMixin):
     """Verify that the current user is authenticated and is admin"""
@@ -34,6 +90,12 @@ class AdminItemAction(AdminRequiredMixin, View, Generic[_T], metaclass=abc.ABCMe
     model_cls: _T
     successful_message = _("Action completed successfully")
     error_message = _("Action failed: {}")
+    bulk_message = _("Action completed for {} of {} items")
+    queued_message = _("Action started")
+    # run perform_action() on the ADMIN_ACTION_EXECUTOR instead of within the request
+    background = False
+    # rows locked and processed per transaction by bulk requests
+    bulk_batch_size = 100
     actions = [
         ("nop", _("No operation")),
     ]
@@ -42,15 +104,14 @@ class AdminItemAction(AdminRequiredMixin, View, Generic[_T], metaclass=abc.ABCMe
         super().__init_subclass__(**kwargs)  # type: ignore
         cls._registry.append(cls)
 
-    def post(self, request, id: str, action: str):
+    @instrument("admin.item_action")
+    def post(self, request, action: str, id: Optional[str] = None):
+        if id is None:
+            return self.post_bulk(request, action)
+        if self.background:
+            return self.post_background(request, id, action)
         try:
-            # try to obtain referenced model object
-            obj = self.model_cls.objects.get(id=id)  # type: ignore
-            # see if object is still actionable (might have changed in the meantime)
-            with transaction.atomic():
-                if not self.is_actionable(obj, action):
-                    raise ValueError("not actionable anymore")
-                res = self.perform_action(obj, action)
+            res = self._perform(id, action)
             messages.success(request, self.successful_message)
             if res is None:
                 return HttpResponse(status=204)
@@ -60,19 +121,171 @@ class AdminItemAction(AdminRequiredMixin, View, Generic[_T], metaclass=abc.ABCMe
             messages.error(request, self.error_message.format(e))
             return HttpResponse(status=400)
 
+    def get(self, request, job_id: Optional[str] = None, **kwargs):
+        """status of a background job, only visible to the user who submitted it"""
+        if job_id is None:
+            return self.http_method_not_allowed(request)
+        status = get_executor().get_status(job_id)
+        if status is None or status.pop("owner", None) != request.user.pk:
+            return JsonResponse({"error": "unknown job"}, status=404)
+        return JsonResponse(status)
+
+    def post_background(self, request, id: str, action: str):
+        """queues the action and responds with the job id and its status url"""
+
+        def job(report_progress):
+            self.report_progress = report_progress  # type: ignore[method-assign]
+            return self._perform(id, action)
+
+        # under ATOMIC_REQUESTS, the job must not see (or outlive) an uncommitted request
+        job_id = get_executor().submit(
+            job, owner=request.user.pk, using=router.db_for_write(self.model_cls)
+        )
+        messages.info(request, self.queued_message)
+        return JsonResponse(
+            {
+                "job_id": job_id,
+                "status_url": reverse(f"{self.__class__.__name__.lower()}_job", args=[job_id]),
+            },
+            status=202,
+        )
+
+    def _perform(self, id: str, action: str) -> Any:
+        with transaction.atomic():
+            # try to obtain referenced model object
+            obj = self.model_cls.objects.select_for_update().get(id=id)  # type: ignore
+            # see if object is still actionable (might have changed in the meantime)
+            if not self.is_actionable(obj, action):
+                raise ValueError("not actionable anymore")
+            return self.perform_action(obj, action)
+
+    def report_progress(self, progress: float) -> None:
+        """
+        reports the progress (0.0 - 1.0) of a background perform_action() to the
+        status endpoint. does nothing for regular requests.
+        """
+
+    def post_bulk(self, request, action: str):
+        """
+        Performs the action on all items given by ``ids`` (form data or JSON). Items
+        are locked and processed in transactions of ``bulk_batch_size``. Items locked
+        by someone else are skipped instead of waited for. Responds with the outcome
+        by id: "ok" (with "result"), "not_actionable", "skipped" or "error".
+        """
+        try:
+            ids = self._get_bulk_ids(request)
+        except (ValueError, KeyError, TypeError):
+            return JsonResponse({"error": "invalid ids"}, status=400)
+        if action not in dict(self.actions):
+            return JsonResponse({"error": "invalid action"}, status=400)
+
+        pk_field = self.model_cls._meta.pk  # type: ignore[attr-defined]
+        results: dict[str, dict[str, Any]] = {}
+        pks = {}
+        for raw_id in ids:
+            try:
+                pks[pk_field.to_python(raw_id)] = str(raw_id)
+            except ValidationError:
+                results[str(raw_id)] = {"status": "error", "error": "invalid id"}
+
+        batch = list(pks)
+        for start in range(0, len(batch), self.bulk_batch_size):
+            chunk = batch[start : start + self.bulk_batch_size]
+            try:
+                with transaction.atomic():
+                    objs = list(
+                        self.model_cls.objects.select_for_update(skip_locked=True)  # type: ignore
+                        .filter(pk__in=chunk)
+                        .order_by("pk")
+                    )
+                    actionable = self.get_actionable(objs)
+                    objs = [obj for obj in objs if action in actionable.get(obj.pk, ())]
+                    chunk_results = self.perform_actions(objs, action) if objs else {}
+            except Exception as e:
+                for pk in chunk:
+                    results[pks[pk]] = {"status": "error", "error": str(e)}
+                continue
+            for pk in chunk:
+                if pk in chunk_results:
+                    results[pks[pk]] = {"status": "ok", "result": chunk_results[pk]}
+                elif pk in actionable:
+                    results[pks[pk]] = {"status": "not_actionable"}
+                else:
+                    # locked by a concurrent request or gone
+                    results[pks[pk]] = {"status": "skipped"}
+
+        completed = sum(result["status"] == "ok" for result in results.values())
+        messages.info(request, self.bulk_message.format(completed, len(ids)))
+        return JsonResponse({"results": results})
+
+    def _get_bulk_ids(self, request) -> list[str]:
+        if request.content_type == "application/json":
+            ids = json.loads(request.body)["ids"]
+        else:
+            ids = request.POST.getlist("ids")
+        if not isinstance(ids, list):
+            raise TypeError("ids must be a list")
+        return ids
+
     @abc.abstractmethod
     def perform_action(self, obj: _T, action: str) -> Any:
         raise NotImplementedError()
 
+    def perform_actions(self, objs: list[_T], action: str) -> dict[Any, Any]:
+        """
+        performs the action on a batch of locked, actionable objects and returns the
+        results by pk. override to process the batch at once.
+        """
+        return {obj.pk: self.perform_action(obj, action) for obj in objs}
+
     @classmethod
     @abc.abstractmethod
     def is_actionable(cls, obj: _T, action: str) -> bool:
         """does the action apply to this particular object"""
         return True
 
+    @classmethod
+    def get_actionable(cls, objs: list[_T]) -> dict[Any, set[str]]:
+        """
+        actions that apply, by object pk. override to evaluate a whole changelist page
+        at once instead of calling is_actionable() for every object and action.
+        """
+        return {
+            obj.pk: {action for action, _ in cls.actions if cls.is_actionable(obj, action)}
+            for obj in objs
+        }
+
+    @classmethod
+    def prefetch_actionable(cls, objs: Iterable[_T]) -> None:
+        """evaluate get_actionable() once and keep the result on the objects for rendering"""
+        objs = list(objs)
+        actionable = cls.get_actionable(objs)
+        for obj in objs:
+            if not hasattr(obj, "_actionable_cache"):
+                obj._actionable_cache = {}  # type: ignore[attr-defined]
+            obj._actionable_cache[cls] = actionable.get(obj.pk, set())  # type: ignore[attr-defined]
+
     @classmethod
     def extra_javascript(cls):
-        return ""
+        if not cls.background:
+            return ""
+        # polls the job status, showing the progress on the button until it finishes
+        return """
+            if (resp.status === 202) {
+                const job = await resp.json();
+                let status = {status: 'pending'};
+                while (status.status === 'pending' || status.status === 'running') {
+                    await new Promise(resolve => setTimeout(resolve, 1000));
+                    status = await (await fetch(job.status_url, {credentials: 'same-origin'})).json();
+                    if (status.progress !== null && status.progress !== undefined) {
+                        this.textContent = Math.round(status.progress * 100) + '%';
+                    }
+                }
+                if (status.status !== 'done') {
+                    alert('action failed: ' + (status.error || status.status));
+                }
+            }
+        """
 
     @classmethod
     def action_markup(cls, obj: _T):
@@ -83,7 +296,11 @@ class AdminItemAction(AdminRequiredMixin, View, Generic[_T], metaclass=abc.ABCMe
     @classmethod
     def _action(cls, obj: _T, action: str, label: Union[str, Promise]):
         """template rendering of action"""
-        if not cls.is_actionable(obj, action):
+        actionable = getattr(obj, "_actionable_cache", {}).get(cls)
+        if actionable is None:
+            if not cls.is_actionable(obj, action):
+                return ""
+        elif action not in actionable:
             return ""
 
         return format_html(
@@ -106,7 +323,7 @@ class AdminItemAction(AdminRequiredMixin, View, Generic[_T], metaclass=abc.ABCMe
                 .catch(err => alert('request failed. please try again.'));
                 return false;">{}</a>
             """,  # noqa: E501
-            reverse(cls.__name__.lower(), args=[obj.pk, action]),
+            reverse_pk(cls.__name__.lower(), obj.pk, action),
             cls.extra_javascript(),
             label,
         )
@@ -123,19 +340,250 @@ class AdminItemAction(AdminRequiredMixin, View, Generic[_T], metaclass=abc.ABCMe
             name=cls.__name__.lower(),
         )
 
+    @classmethod
+    def _bulk_path(cls):
+        """returns the urlpattern of bulk requests"""
+        return path(
+            route=(
+                f"{cls.model_cls._meta.app_label}/{cls.model_cls.__name__.lower()}/"  # type: ignore[attr-defined]
+                f"{cls.__name__.lower()}/<str:action>/"
+            ),
+            view=cls.as_view(),
+            name=f"{cls.__name__.lower()}_bulk",
+        )
+
+    @classmethod
+    def _job_path(cls):
+        """returns the urlpattern of the background job status"""
+        return path(
+            route=(
+                f"{cls.model_cls._meta.app_label}/{cls.model_cls.__name__.lower()}/"  # type: ignore[attr-defined]
+                f"{cls.__name__.lower()}/jobs/<str:job_id>/"
+            ),
+            view=cls.as_view(),
+            name=f"{cls.__name__.lower()}_job",
+        )
+
     @classmethod
     def urls(cls):
-        return include([item._path() for item in cls._registry])
+        return include(
+            [
+                pattern
+                for item in cls._registry
+                for pattern in (item._path(), item._bulk_path(), item._job_path())
+            ]
+        )
+
+
+class AdminItemActionMixin:
+    """
+    ModelAdmin mixin that evaluates ``item_actions`` for the whole changelist page with
+    one get_actionable() call each, instead of per row and action.
+    """
+
+    item_actions: list[Type[AdminItemAction]] = []
+
+    def get_changelist_instance(self, request):
+        changelist = super().get_changelist_instance(request)  # type: ignore[misc]
+        for item_action in self.item_actions:
+            item_action.prefetch_actionable(changelist.result_list)
+        return changelist
 
 
 def admin_navigation_link(entity: models.Model, label: Optional[str] = None) -> str:
     if not entity:
         return ""
 
-    url = reverse(
-        f"admin:{entity._meta.app_label}_{entity._meta.model_name}_change",
-        args=[entity.pk],
-    )
+    url = reverse_pk(f"admin:{entity._meta.app_label}_{entity._meta.model_name}_change", entity.pk)
     if not label:
         label = str(entity)
-    return format_html(f'<a href="{url}">{label}</a>')
+    return format_html('<a href="{}">{}</a>', url, label)
+
+
+class RelatedLink:
+    """
+    Changelist column linking to a related object, given by its relation ``path``
+    (e.g. "author" or "article__author"). ``label`` names the related field shown as
+    link text, otherwise str() of the related object is used. With
+    RelatedLinkAdminMixin, the changelist loads the related objects in the same query.
+    """
+
+    def __init__(self, path: str, label: Optional[str] = None, description=None):
+        self.path = path
+        self.label = label
+        self.short_description = description or path.split(LOOKUP_SEP)[-1].replace("_", " ")
+        self.admin_order_field = f"{path}{LOOKUP_SEP}{label}" if label else path
+
+    def __call__(self, obj: models.Model) -> str:
+        entity: Optional[models.Model] = obj
+        for name in self.path.split(LOOKUP_SEP):
+            entity = getattr(entity, name)
+            if entity is None:
+                return ""
+        label = getattr(entity, self.label) if self.label else None
+        return admin_navigation_link(entity, label=None if label is None else str(label))
+
+    def get_only_fields(self) -> list[str]:
+        """fields of the related objects on the path that are needed for the link"""
+        names = self.path.split(LOOKUP_SEP)
+        fields = [LOOKUP_SEP.join(names[: i + 1]) for i in range(1, len(names))]
+        if self.label:
+            fields.append(f"{self.path}{LOOKUP_SEP}{self.label}")
+        return fields
+
+
+class RelatedLinkChangeListMixin:
+    def apply_select_related(self, qs):
+        qs = super().apply_select_related(qs)  # type: ignore[misc]
+        return self.model_admin.apply_related_links(qs, self.list_display)  # type: ignore[attr-defined]
+
+
+class RelatedLinkChangeList(RelatedLinkChangeListMixin, ChangeList):
+    pass
+
+
+# changelist class -> subclass that applies RelatedLink columns
+_related_link_changelists: dict[type, type] = {ChangeList: RelatedLinkChangeList}
+
+
+class RelatedLinkAdminMixin:
+    """
+    ModelAdmin mixin that selects the objects linked by RelatedLink columns together
+    with the changelist rows, loading only the fields the links need.
+    """
+
+    def get_changelist(self, request, **kwargs):
+        changelist = super().get_changelist(request, **kwargs)  # type: ignore[misc]
+        if issubclass(changelist, RelatedLinkChangeListMixin):
+            return changelist
+        if changelist not in _related_link_changelists:
+            _related_link_changelists[changelist] = type(
+                f"RelatedLink{changelist.__name__}", (RelatedLinkChangeListMixin, changelist), {}
+            )
+        return _related_link_changelists[changelist]
+
+    def apply_related_links(self, queryset: models.QuerySet, list_display) -> models.QuerySet:
+        links = [
+            link
+            for name in list_display
+            if isinstance(name, str) and isinstance(link := getattr(self, name, None), RelatedLink)
+        ]
+        # select_related() without arguments already follows all non-null relations
+        if not links or queryset.query.select_related is True:
+            return queryset
+        queryset = queryset.select_related(*(link.path for link in links))
+
+        # leave querysets alone that already limit the loaded fields
+        if queryset.query.deferred_loading != (frozenset(), True):
+            return queryset
+        only = {f.name for f in queryset.model._meta.concrete_fields}
+        # objects labeled with str() are loaded completely, including what lies beyond them
+        complete = {link.path for link in links if not link.label}
+        for link in links:
+            names = link.path.split(LOOKUP_SEP)
+            if not any(LOOKUP_SEP.join(names[:i]) in complete for i in range(1, len(names) + 1)):
+                only.update(link.get_only_fields())
+        return queryset.only(*only)
+
+
+class LowerBound(int):
+    """count that is only known to be at least its value, shown as e.g. "200+" """
+
+    def __str__(self) -> str:
+        return f"{int(self)}+"
+
+
+class LookaheadPaginator(Paginator):
+    """
+    Paginator that never counts the whole table. Only rows up to ``lookahead`` are
+    counted, which is cheap for any table size. Pages beyond that are still reachable
+    as the lookahead moves along with the requested page. If there are more rows, the
+    count is a LowerBound, unless the queryset is the unfiltered table and the database
+    statistics estimate at least ``threshold`` rows. The estimate is used then.
+    """
+
+    def __init__(self, object_list, per_page, lookahead: int, threshold=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.lookahead = lookahead
+        self.threshold = threshold
+
+    @cached_property
+    def count(self) -> int:
+        count = self.object_list[: self.lookahead].count()
+        if count < self.lookahead:
+            return count
+        if self.threshold is not None:
+            estimate = estimate_count(self.object_list)
+            if estimate is not None and estimate >= self.threshold:
+                # the lookahead keeps trailing pages reachable if the estimate is too low
+                return max(estimate, count)
+        return LowerBound(count)
+
+
+def estimate_count(queryset: models.QuerySet) -> Optional[int]:
+    """
+    Row count of the unfiltered table of queryset according to the database statistics.
+    None if there is no estimate or the queryset is filtered, as estimates of filtered
+    queries can be off by orders of magnitude.
+    """
+    query = queryset.query
+    if query.where or query.distinct or query.is_sliced:
+        return None
+    connection = connections[queryset.db]
+    table = queryset.model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [connection.ops.quote_name(table)],
+                )
+            elif connection.vendor == "mysql":
+                cursor.execute(
+                    "SELECT table_rows FROM information_schema.tables "
+                    "WHERE table_schema = DATABASE() AND table_name = %s",
+                    [table],
+                )
+            elif connection.vendor == "sqlite":
+                # only available after ANALYZE
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+                if cursor.fetchone() is None:
+                    return None
+                cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [table])
+            else:
+                return None
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    if row is None or row[0] is None:
+        return None
+    estimate = int(str(row[0]).split()[0])
+    # never analyzed on PostgreSQL
+    return estimate if estimate >= 0 else None
+
+
+class LookaheadPaginationMixin:
+    """
+    ModelAdmin mixin for large tables. The changelist does not count the table, but
+    shows the pages around the current one, up to ``lookahead_pages`` ahead. Unfiltered
+    changelists show the estimated row count once it exceeds ``estimated_count_threshold``
+    (None to disable).
+    """
+
+    lookahead_pages = 10
+    estimated_count_threshold: Optional[int] = 100_000
+    show_full_result_count = False
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        try:
+            page = max(int(request.GET.get("p", 1)), 1)
+        except ValueError:
+            page = 1
+        return LookaheadPaginator(
+            queryset,
+            per_page,
+            lookahead=(page + self.lookahead_pages) * per_page,
+            threshold=self.estimated_count_threshold,
+            orphans=orphans,
+            allow_empty_first_page=allow_empty_first_page,
+        )
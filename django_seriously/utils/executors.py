@@ -0,0 +1,117 @@
+import abc
+import functools
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from django.db import connections, transaction
+
+from django_seriously.settings import seriously_settings
+
+# a job receives a callable for reporting its progress (0.0 - 1.0)
+Job = Callable[[Callable[[float], None]], Any]
+
+
+class JobExecutor(abc.ABC):
+    """
+    Backend for running AdminItemAction jobs in the background. Job results must be
+    JSON serializable. Status is a dict with "status" ("pending", "running", "done"
+    or "failed"), "owner", "progress", "result" and "error".
+    """
+
+    @abc.abstractmethod
+    def submit(self, job: Job, owner: Any = None, using: Optional[str] = None) -> str:
+        """
+        queue job and return its id. The job starts once the current transaction on
+        ``using`` commits (right away in autocommit mode) and never if it rolls back.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def get_status(self, job_id: str) -> Optional[dict[str, Any]]:
+        """status of job, None if unknown"""
+        raise NotImplementedError()
+
+
+class ThreadPoolJobExecutor(JobExecutor):
+    """
+    Runs jobs in an in-process thread pool. Job status is only known to the process
+    that runs the job, so multi-process deployments need a shared backend or sticky
+    sessions. Only the most recent ``max_jobs`` are kept.
+    """
+
+    max_workers = 4
+    max_jobs = 1000
+
+    def __init__(self):
+        self.pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="seriously-jobs"
+        )
+        self.jobs: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def submit(self, job: Job, owner: Any = None, using: Optional[str] = None) -> str:
+        job_id = self._add_job(owner)
+        transaction.on_commit(functools.partial(self.pool.submit, self._run, job_id, job), using)
+        return job_id
+
+    def get_status(self, job_id: str) -> Optional[dict[str, Any]]:
+        with self.lock:
+            status = self.jobs.get(job_id)
+            return dict(status) if status is not None else None
+
+    def _add_job(self, owner: Any) -> str:
+        job_id = uuid.uuid4().hex
+        with self.lock:
+            self.jobs[job_id] = {"status": "pending", "owner": owner, "progress": None}
+            while len(self.jobs) > self.max_jobs:
+                self.jobs.popitem(last=False)
+        return job_id
+
+    def _update(self, job_id: str, **kwargs) -> None:
+        with self.lock:
+            if job_id in self.jobs:
+                self.jobs[job_id].update(kwargs)
+
+    def _run(self, job_id: str, job: Job) -> None:
+        try:
+            self._execute(job_id, job)
+        finally:
+            # connections are per thread and would stay open otherwise
+            connections.close_all()
+
+    def _execute(self, job_id: str, job: Job) -> None:
+        self._update(job_id, status="running")
+        try:
+            result = job(functools.partial(self._report_progress, job_id))
+            self._update(job_id, status="done", progress=1.0, result=result)
+        except Exception as e:
+            self._update(job_id, status="failed", error=str(e))
+
+    def _report_progress(self, job_id: str, progress: float) -> None:
+        self._update(job_id, progress=progress)
+
+
+class SynchronousJobExecutor(ThreadPoolJobExecutor):
+    """Runs jobs in the calling thread on commit. Meant for tests and development."""
+
+    def __init__(self):
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+
+    def submit(self, job: Job, owner: Any = None, using: Optional[str] = None) -> str:
+        job_id = self._add_job(owner)
+        transaction.on_commit(functools.partial(self._execute, job_id, job), using)
+        return job_id
+
+
+@functools.cache
+def _get_executor(executor_class: type[JobExecutor]) -> JobExecutor:
+    return executor_class()
+
+
+def get_executor() -> JobExecutor:
+    """executor instance of the ADMIN_ACTION_EXECUTOR setting, shared by the process"""
+    return _get_executor(seriously_settings.ADMIN_ACTION_EXECUTOR)
@@ -0,0 +1,193 @@
+import abc
+import contextlib
+import functools
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, ContextManager, Iterator, Optional, TypeVar
+
+from django.core.signals import setting_changed
+
+from django_seriously.settings import seriously_settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_UNSET: Any = object()
+# sink of the process, resolved from METRICS_SINK on first use
+_sink: Any = _UNSET
+
+
+class MetricsSink(abc.ABC):
+    """
+    Receiver of the library's instrumentation. Instrumented calls report their duration
+    in seconds to the ``<name>.duration`` histogram and raised exceptions to the
+    ``<name>.errors`` counter. A ``sample_rate`` share of the calls additionally runs
+    inside ``profile()``, e.g. to attach a sampling profiler.
+    """
+
+    sample_rate: float = 0.0
+
+    @abc.abstractmethod
+    def increment(self, name: str, value: int = 1) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def observe(self, name: str, value: float) -> None:
+        raise NotImplementedError()
+
+    def profile(self, name: str) -> ContextManager:
+        return contextlib.nullcontext()
+
+
+class Histogram:
+    def __init__(self, max_samples: int):
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.samples: deque[float] = deque(maxlen=max_samples)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.samples.append(value)
+
+    def summary(self) -> dict[str, float]:
+        samples = sorted(self.samples)
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count,
+            # percentiles of the most recent samples only
+            "p50": samples[len(samples) // 2],
+            "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        }
+
+
+class InMemorySink(MetricsSink):
+    """
+    Aggregates metrics in process memory, e.g. for development, tests or the
+    seriously_metrics command. Histograms keep exact totals and the last
+    ``max_samples`` values for percentiles.
+    """
+
+    max_samples = 1000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters: defaultdict[str, int] = defaultdict(int)
+        self.histograms: dict[str, Histogram] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self.lock:
+            self.counters[name] += value
+
+    def observe(self, name: str, value: float) -> None:
+        with self.lock:
+            if name not in self.histograms:
+                self.histograms[name] = Histogram(self.max_samples)
+            self.histograms[name].add(value)
+
+    def summary(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "counters": dict(sorted(self.counters.items())),
+                "histograms": {
+                    name: histogram.summary() for name, histogram in sorted(self.histograms.items())
+                },
+            }
+
+    def reset(self) -> None:
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+def get_sink() -> Optional[MetricsSink]:
+    """sink of the process, None if instrumentation is disabled"""
+    global _sink
+    if _sink is _UNSET:
+        sink_class = seriously_settings.METRICS_SINK
+        _sink = sink_class() if sink_class is not None else None
+    return _sink
+
+
+def set_sink(sink: Optional[MetricsSink]) -> Optional[MetricsSink]:
+    """replace the sink of the process, returns the previous one"""
+    global _sink
+    previous = get_sink()
+    _sink = sink
+    return previous
+
+
+@contextlib.contextmanager
+def use_sink(sink: Optional[MetricsSink]) -> Iterator[Optional[MetricsSink]]:
+    previous = set_sink(sink)
+    try:
+        yield sink
+    finally:
+        set_sink(previous)
+
+
+def _reset_sink(setting, **kwargs) -> None:
+    global _sink
+    if setting == "SERIOUSLY_SETTINGS":
+        _sink = _UNSET
+
+
+setting_changed.connect(_reset_sink)
+
+
+def increment(name: str, value: int = 1) -> None:
+    sink = get_sink()
+    if sink is not None:
+        sink.increment(name, value)
+
+
+def observe(name: str, value: float) -> None:
+    sink = get_sink()
+    if sink is not None:
+        sink.observe(name, value)
+
+
+def instrument(name: str) -> Callable[[F], F]:
+    """
+    Report calls of the decorated function as ``name``. Without a sink, the only
+    overhead is a global lookup and the wrapping call.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            sink = _sink
+            if sink is None:
+                return func(*args, **kwargs)
+            if sink is _UNSET:
+                sink = get_sink()
+                if sink is None:
+                    return func(*args, **kwargs)
+            return _measure(sink, name, func, args, kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _measure(sink: MetricsSink, name: str, func: Callable, args, kwargs) -> Any:
+    profile = sink.sample_rate and random.random() < sink.sample_rate
+    start = time.perf_counter()
+    try:
+        if profile:
+            with sink.profile(name):
+                return func(*args, **kwargs)
+        return func(*args, **kwargs)
+    except Exception:
+        sink.increment(f"{name}.errors")
+        raise
+    finally:
+        sink.observe(f"{name}.duration", time.perf_counter() - start)
@@ -1,23 +1,916 @@
+import contextlib
+import datetime
+import decimal
+import functools
+import operator
+import os
+import threading
+import time
 import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from contextvars import ContextVar
+from typing import Any
 
-from django.db import models
+from django.apps import apps
+from django.core.exceptions import NON_FIELD_ERRORS, FieldDoesNotExist, ValidationError
+from django.db import connection, connections, models, router, transaction
+from django.db.models.constants import LOOKUP_SEP
+from django.utils import timezone
+
+from django_seriously.settings import seriously_settings
+from django_seriously.utils.metrics import instrument
+
+try:
+    from django.db.models.expressions import DatabaseDefault
+
+    SKIPPED_VALUE_TYPES: tuple[type, ...] = (DatabaseDefault,)
+except ImportError:  # Django < 5.0
+    SKIPPED_VALUE_TYPES = ()
+
+# values of these types can be compared with their loaded counterpart. other values
+# (dicts, lists, pydantic models, ...) might have been mutated in place.
+IMMUTABLE_TYPES = (
+    type(None),
+    str,
+    bytes,
+    int,
+    float,
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+)
+
+
+_uuid7_lock = threading.Lock()
+# last 60 bit timestamp (milliseconds and 12 bits of sub-millisecond fraction)
+_uuid7_last = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7) as an alternative primary key default to
+    uuid4. Consecutive keys are close to each other in indexes, which keeps inserts
+    local. The 12 bits following the millisecond timestamp carry sub-millisecond
+    precision (~250ns). Keys of a process are strictly increasing: if the clock did not
+    advance or went backwards, the previous timestamp is incremented instead (RFC 9562,
+    section 6.2, method 3). Keys of different processes are only ordered by their clock.
+    """
+    global _uuid7_last
+    milliseconds, remainder = divmod(time.time_ns(), 1_000_000)
+    timestamp = milliseconds << 12 | remainder * 4096 // 1_000_000
+    with _uuid7_lock:
+        if timestamp <= _uuid7_last:
+            timestamp = _uuid7_last + 1
+        _uuid7_last = timestamp
+    random = int.from_bytes(os.urandom(8)) & 0x3FFF_FFFF_FFFF_FFFF
+    return uuid.UUID(
+        int=(timestamp >> 12 & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (timestamp & 0xFFF) << 64
+        | 0b10 << 62
+        | random
+    )
+
+
+@functools.cache
+def _get_tracked_fields(model: type[models.Model]) -> tuple[models.Field, ...]:
+    """concrete fields that support content fingerprinting (e.g. track_changes=True)"""
+    return tuple(
+        f
+        for f in model._meta.concrete_fields
+        if getattr(f, "track_changes", False) and not f.primary_key
+    )
+
+
+def _get_referenced_names(expression: Any) -> set[str]:
+    """field names referenced by a Q object or expression"""
+    names = set()
+    if isinstance(expression, models.Q):
+        for child in expression.children:
+            if isinstance(child, tuple):
+                names.add(child[0].split(LOOKUP_SEP)[0])
+                names |= _get_referenced_names(child[1])
+            else:
+                names |= _get_referenced_names(child)
+    elif isinstance(expression, models.F):
+        names.add(expression.name.split(LOOKUP_SEP)[0])
+    elif hasattr(expression, "get_source_expressions"):
+        for source in expression.get_source_expressions():
+            names |= _get_referenced_names(source)
+    return names
+
+
+@functools.cache
+def _get_validation_groups(model: type[models.Model]) -> tuple[frozenset[str] | None, ...]:
+    """
+    field names that are validated together in unique and constraint checks. Django
+    skips a check if any of its fields is excluded from validation. None stands for
+    checks whose fields cannot be determined.
+    """
+    opts = model._meta
+    groups: list[frozenset[str] | None] = []
+
+    def resolve(names) -> frozenset[str] | None:
+        try:
+            return frozenset(opts.pk.name if n == "pk" else opts.get_field(n).name for n in names)
+        except FieldDoesNotExist:
+            return None
+
+    for parent in [model, *opts.get_parent_list()]:
+        for unique_together in parent._meta.unique_together:
+            groups.append(resolve(unique_together))
+        for constraint in parent._meta.constraints:
+            if isinstance(constraint, models.UniqueConstraint):
+                names = {*constraint.fields, *_get_referenced_names(constraint.condition)}
+                for expression in constraint.expressions:
+                    names |= _get_referenced_names(expression)
+                groups.append(resolve(names))
+            elif isinstance(constraint, models.CheckConstraint):
+                # "check" prior to Django 5.1
+                condition = getattr(constraint, "condition", None) or getattr(constraint, "check")
+                groups.append(resolve(_get_referenced_names(condition)))
+            else:
+                groups.append(None)
+    for field in opts.fields:
+        for date_field in (field.unique_for_date, field.unique_for_month, field.unique_for_year):
+            if date_field:
+                groups.append(resolve((field.name, date_field)))
+    return tuple(groups)
+
+
+@functools.cache
+def _get_batched_unique_constraints(
+    model: type[models.Model],
+) -> tuple[tuple[type[models.Model], models.UniqueConstraint], ...]:
+    """
+    unique constraints that are equivalent to unique_together. when full_clean() runs
+    both checks, they are checked by validate_unique() instead of validate_constraints(),
+    so that they share its query.
+    """
+    return tuple(
+        (model_class, constraint)
+        for model_class in [model, *model._meta.get_parent_list()]
+        for constraint in model_class._meta.total_unique_constraints
+        if constraint.violation_error_message == constraint.default_violation_error_message
+        and getattr(constraint, "violation_error_code", None) is None
+        and getattr(constraint, "nulls_distinct", None) is not False
+        and not any(
+            getattr(model_class._meta.get_field(name), "generated", False)
+            for name in constraint.fields
+        )
+    )
+
+
+def _get_clean_exclude(model: type[models.Model], names: Iterable[str]) -> set[str]:
+    """fields that can be left out of full_clean when only the given fields changed"""
+    validated = {model._meta.get_field(name).name for name in names}
+    for group in _get_validation_groups(model):
+        if group is None:
+            return set()
+        if group & validated:
+            validated |= group
+    return {f.name for f in model._meta.fields if f.name not in validated}
+
+
+def _compile_cleaner(field: models.Field):
+    """
+    field.clean() specialized to the field's options, skipping the checks that cannot
+    apply. Fields customizing their validation keep their own clean().
+    """
+    field_class = type(field)
+    if (
+        field_class.clean is not models.Field.clean
+        or field_class.validate is not models.Field.validate
+        or field_class.run_validators is not models.Field.run_validators
+        or field.choices is not None
+    ):
+        return field.clean
+
+    to_python = field.to_python
+    validators = tuple(field.validators)
+    empty_values = field.empty_values
+    error_messages = field.error_messages
+    check_null = field.editable and not field.null
+    check_blank = field.editable and not field.blank
+
+    def clean(value, model_instance):
+        value = to_python(value)
+        if check_null and value is None:
+            raise ValidationError(error_messages["null"], code="null")
+        if check_blank and value in empty_values:
+            raise ValidationError(error_messages["blank"], code="blank")
+        if validators and value not in empty_values:
+            errors = []
+            for validator in validators:
+                try:
+                    validator(value)
+                except ValidationError as e:
+                    if hasattr(e, "code") and e.code in error_messages:
+                        e.message = error_messages[e.code]
+                    errors.extend(e.error_list)
+            if errors:
+                raise ValidationError(errors)
+        return value
+
+    return clean
+
+
+class ValidationPlan:
+    """
+    Validation steps of a model, resolved once instead of on every full_clean():
+    the field cleaners specialized to the field options, the unique checks together
+    with the fields involved in them, and the constraints validated individually.
+    """
+
+    def __init__(self, model: type["DjangoBaseModel"]):
+        # instance without __init__, as only class level information is used
+        instance = model.__new__(model)
+        self.fields = tuple(
+            (f.name, f.attname, f.empty_values if f.blank else (), _compile_cleaner(f))
+            for f in model._meta.fields
+            if not getattr(f, "generated", False)
+        )
+        unique_checks, date_checks = super(DjangoBaseModel, instance)._get_unique_checks()
+        self.unique_checks = tuple(
+            (model_class, unique_check, frozenset(unique_check))
+            for model_class, unique_check in unique_checks
+        )
+        self.batched_checks = tuple(
+            (model_class, tuple(constraint.fields), frozenset(constraint.fields))
+            for model_class, constraint in _get_batched_unique_constraints(model)
+        )
+        self.date_checks = tuple(
+            (date_check, frozenset(date_check[2:])) for date_check in date_checks
+        )
+        batched = {id(constraint) for _, constraint in _get_batched_unique_constraints(model)}
+        # overridden get_constraints() might depend on the instance
+        self.constraints = (
+            tuple(
+                (model_class, constraint, id(constraint) in batched)
+                for model_class, model_constraints in instance.get_constraints()
+                for constraint in model_constraints
+            )
+            if model.get_constraints is models.Model.get_constraints
+            else None
+        )
+
+    def get_unique_checks(self, exclude: Iterable[str], batched: bool) -> tuple[list, list]:
+        """same result as DjangoBaseModel._get_unique_checks(exclude)"""
+        checks = self.unique_checks + self.batched_checks if batched else self.unique_checks
+        return (
+            [(m, check) for m, check, names in checks if names.isdisjoint(exclude)],
+            [check for check, names in self.date_checks if names.isdisjoint(exclude)],
+        )
+
+
+@functools.cache
+def get_validation_plan(model: type["DjangoBaseModel"]) -> ValidationPlan:
+    return ValidationPlan(model)
+
+
+def compile_validation_plans() -> None:
+    """builds the validation plans of all installed DjangoBaseModel subclasses"""
+    for model in apps.get_models():
+        if issubclass(model, DjangoBaseModel):
+            get_validation_plan(model)
+
+
+def keyset_filter(
+    queryset: models.QuerySet, fields: Sequence[str], key: Sequence[Any], reverse: bool = False
+) -> models.QuerySet:
+    """
+    Rows that come after key in the ordering by fields, e.g. for ("created_at", "id"):
+    created_at > c OR (created_at = c AND id > i). Descending if reverse is set.
+    """
+    lookup = "lt" if reverse else "gt"
+    condition = models.Q()
+    for i, field in enumerate(fields):
+        condition |= models.Q(
+            *[models.Q(**{f: v}) for f, v in zip(fields[:i], key[:i])],
+            **{f"{field}__{lookup}": key[i]},
+        )
+    return queryset.filter(condition)
+
+
+class KeysetQuerySetMixin:
+    """
+    Keyset pagination for querysets, ordering by ``keyset_fields`` instead of using
+    OFFSET. Every page is a range lookup on the index, regardless of how deep it is.
+    For best results, add a composite index on the keyset fields.
+    """
+
+    keyset_fields: Sequence[str] = ("created_at", "id")
+
+    def keyset(self, after: Sequence[Any] | None = None, reverse: bool = False):
+        """ordered by the keyset fields, optionally starting after the given key"""
+        queryset = self.order_by(  # type: ignore[attr-defined]
+            *[f"-{field}" if reverse else field for field in self.keyset_fields]
+        )
+        if after is None:
+            return queryset
+        return keyset_filter(queryset, self.keyset_fields, after, reverse)
+
+    def keyset_key(self, obj: models.Model) -> tuple:
+        """key of an object, to be used for after"""
+        return tuple(
+            getattr(obj, obj._meta.get_field(field).attname) for field in self.keyset_fields
+        )
+
+    def iter_batches(self, batch_size: int = 1000, reverse: bool = False) -> Iterator[list]:
+        """iterates over the queryset in lists of batch_size, one query per batch"""
+        key = None
+        while True:
+            batch = list(self.keyset(after=key, reverse=reverse)[:batch_size])
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            key = self.keyset_key(batch[-1])
+
+
+class KeysetQuerySet(KeysetQuerySetMixin, models.QuerySet):
+    pass
+
+
+KeysetManager = models.Manager.from_queryset(KeysetQuerySet)
+
+
+# timestamp shared by all rows of a validated_bulk_create()
+_bulk_now: ContextVar[datetime.datetime | None] = ContextVar("bulk_now", default=None)
+
+
+class TimestampField(models.DateTimeField):
+    """
+    DateTimeField whose auto_now(_add) value is shared by all rows of a validated bulk
+    create. Deconstructs as a plain DateTimeField, so migrations are unaffected.
+    """
+
+    def pre_save(self, model_instance, add):
+        now = _bulk_now.get()
+        if now is not None and (self.auto_now or (self.auto_now_add and add)):
+            setattr(model_instance, self.attname, now)
+            return now
+        return super().pre_save(model_instance, add)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        return name, "django.db.models.DateTimeField", args, kwargs
+
+
+class ValidatedQuerySetMixin:
+    """
+    Bulk operations for DjangoBaseModel that validate like save() does. Invalid rows
+    are skipped and reported by position, while all valid rows are written.
+    """
+
+    def validated_bulk_create(
+        self, objs: Iterable[models.Model], batch_size: int | None = None, **kwargs
+    ) -> tuple[list, dict[int, ValidationError]]:
+        """bulk_create() of the valid objs. returns created objects and errors"""
+        objs = list(objs)
+        errors = self.model.bulk_full_clean(objs)  # type: ignore[attr-defined]
+        valid = [obj for i, obj in enumerate(objs) if i not in errors]
+        if not valid:
+            return [], errors
+        token = _bulk_now.set(timezone.now())
+        try:
+            with transaction.atomic(using=self.db, savepoint=False):  # type: ignore[attr-defined]
+                created = self.bulk_create(valid, batch_size=batch_size, **kwargs)  # type: ignore
+        finally:
+            _bulk_now.reset(token)
+        return created, errors
+
+    def validated_bulk_update(
+        self, objs: Iterable[models.Model], fields: Sequence[str], batch_size: int | None = None
+    ) -> tuple[int, dict[int, ValidationError]]:
+        """
+        bulk_update() of the valid objs. Like save(update_fields=...), only the given
+        fields are validated. Contrary to bulk_update(), auto_now fields (e.g.
+        updated_at) are set as well. Returns the number of updated rows and errors.
+        """
+        objs = list(objs)
+        model = self.model  # type: ignore[attr-defined]
+        errors = model.bulk_full_clean(objs, exclude=_get_clean_exclude(model, fields))
+        valid = [obj for i, obj in enumerate(objs) if i not in errors]
+        if not valid:
+            return 0, errors
+
+        fields = [model._meta.get_field(name).name for name in fields]
+        now = timezone.now()
+        for f in model._meta.concrete_fields:
+            if getattr(f, "auto_now", False):
+                for obj in valid:
+                    setattr(obj, f.attname, now)
+                if f.name not in fields:
+                    fields.append(f.name)
+        with transaction.atomic(using=self.db, savepoint=False):  # type: ignore[attr-defined]
+            rows = self.bulk_update(valid, fields, batch_size=batch_size)  # type: ignore
+        return rows, errors
+
+
+class ValidatedQuerySet(ValidatedQuerySetMixin, models.QuerySet):
+    pass
+
+
+ValidatedManager = models.Manager.from_queryset(ValidatedQuerySet)
 
 
 class DjangoBaseModel(models.Model):
     """Opinionated Django base model"""
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    created_at = TimestampField(auto_now_add=True)
+    updated_at = TimestampField(auto_now=True)
+
+    # see _batching_unique_constraints()
+    _batch_unique_constraints = False
 
     class Meta:
         abstract = True
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        if _get_tracked_fields(cls):
+            instance._fingerprints = instance._get_fingerprints()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._loaded_values = {
+            **getattr(self, "_loaded_values", {}),
+            **{
+                f.attname: self.__dict__[f.attname]
+                for f in self._meta.concrete_fields
+                if f.attname in self.__dict__ and (fields is None or f.attname in fields)
+            },
+        }
+        if _get_tracked_fields(self.__class__):
+            self._fingerprints = {
+                **getattr(self, "_fingerprints", {}),
+                **self._get_fingerprints(fields),
+            }
+
     def save(self, *args, **kwargs):
         """
         Because the default is ridiculous. This guarantees that validation
         logic is executed in every non-bulk save situation. This comes at
-        the expense of potentially running validation more than once.
+        the expense of potentially running validation more than once. For
+        bulk operations, see ValidatedQuerySetMixin.
+
+        Instances loaded from the database only validate fields that changed since
+        loading (or ``update_fields``), plus the unique and constraint checks
+        involving them. ``clean()`` always runs, and fields it changes are validated too.
+        """
+        using = kwargs.get("using") or router.db_for_write(self.__class__, instance=self)
+        incremental = not args and not self._state.adding and self._state.db == using
+
+        fingerprints = self._clean_for_save(incremental, kwargs)
+        if (
+            incremental
+            and fingerprints
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            kwargs["update_fields"] = self._get_update_fields(fingerprints)
+
+        result = super().save(*args, **kwargs)
+
+        written = {f.attname for f in self._meta.concrete_fields if f.attname in self.__dict__}
+        if kwargs.get("update_fields") is not None:
+            written &= {self._meta.get_field(f).attname for f in kwargs["update_fields"]}
+        self._loaded_values = {
+            **getattr(self, "_loaded_values", {}),
+            **{attname: self.__dict__[attname] for attname in written},
+        }
+        if fingerprints:
+            fingerprints = {k: v for k, v in fingerprints.items() if k in written}
+            self._fingerprints = {**getattr(self, "_fingerprints", {}), **fingerprints}
+        return result
+
+    def _clean_for_save(self, incremental: bool, kwargs: dict) -> dict[str, bytes]:
+        """validation part of save(), returns the fingerprints of the cleaned values"""
+        if not incremental:
+            self.full_clean()
+            return self._get_fingerprints()
+        fingerprints = self._get_fingerprints()
+        exclude = self._incremental_full_clean(fingerprints, kwargs)
+        # cleaning may have converted the validated values
+        cleaned = {f.attname for f in self._meta.fields if f.name not in exclude}
+        fingerprints.update(self._get_fingerprints(cleaned))
+        return fingerprints
+
+    def get_changed_fields(self) -> set[str]:
+        """
+        Names of fields that changed since the instance was loaded or last saved.
+        Fields holding mutable values (e.g. dicts) count as changed, unless they are
+        tracked with ``track_changes=True``.
+        """
+        return self._get_changed_fields(self._get_fingerprints())
+
+    def _get_changed_fields(self, fingerprints: dict[str, bytes]) -> set[str]:
+        loaded_values = getattr(self, "_loaded_values", {})
+        loaded_fingerprints = getattr(self, "_fingerprints", {})
+        changed = set()
+        for f in self._meta.concrete_fields:
+            if f.attname not in self.__dict__:
+                continue  # deferred
+            if f.attname in fingerprints:
+                if loaded_fingerprints.get(f.attname) != fingerprints[f.attname]:
+                    changed.add(f.name)
+                continue
+            value = self.__dict__[f.attname]
+            if (
+                f.attname not in loaded_values
+                or not isinstance(value, IMMUTABLE_TYPES)
+                or value != loaded_values[f.attname]
+            ):
+                changed.add(f.name)
+        return changed
+
+    @instrument("model.full_clean")
+    def _incremental_full_clean(self, fingerprints: dict[str, bytes], kwargs: dict) -> set[str]:
+        """
+        full_clean() without the fields that are not affected by the save. Fields that
+        clean() changes are validated as well. Returns the excluded fields.
+        """
+        exclude = self._get_clean_exclude(fingerprints, kwargs)
+        errors: dict = {}
+        try:
+            self.clean_fields(exclude=exclude)
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+        try:
+            self.clean()
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+
+        if exclude and kwargs.get("update_fields") is None:
+            touched = exclude - self._get_clean_exclude(self._get_fingerprints(), kwargs)
+            if touched:
+                try:
+                    self.clean_fields(exclude={f.name for f in self._meta.fields} - touched)
+                except ValidationError as e:
+                    errors = e.update_error_dict(errors)
+                exclude -= touched
+
+        checks_exclude = exclude | {name for name in errors if name != NON_FIELD_ERRORS}
+        with self._batching_unique_constraints(True):
+            try:
+                self.validate_unique(exclude=checks_exclude)
+            except ValidationError as e:
+                errors = e.update_error_dict(errors)
+            try:
+                self.validate_constraints(exclude=checks_exclude)
+            except ValidationError as e:
+                errors = e.update_error_dict(errors)
+        if errors:
+            raise ValidationError(errors)
+        return exclude
+
+    def _get_clean_exclude(self, fingerprints: dict[str, bytes], kwargs: dict) -> set[str]:
+        """fields left out of full_clean, as neither they nor their checks are affected"""
+        if kwargs.get("update_fields") is not None:
+            return _get_clean_exclude(self.__class__, kwargs["update_fields"])
+        return _get_clean_exclude(self.__class__, self._get_changed_fields(fingerprints))
+
+    @classmethod
+    @instrument("model.bulk_full_clean")
+    def bulk_full_clean(
+        cls, instances: Sequence["DjangoBaseModel"], exclude=None
+    ) -> dict[int, ValidationError]:
+        """
+        Runs full_clean() on a batch of instances. Fields are cleaned column by column
+        and foreign keys are checked with one query per field. Each unique check is
+        performed once for the whole batch, which also catches duplicates within the
+        batch. Returns validation errors by instance position.
+        """
+        exclude = set(exclude or ())
+        errors = cls._bulk_clean_fields(instances, exclude)
+        checks: dict[tuple[type[models.Model], tuple[str, ...]], dict[int, tuple]] = {}
+
+        for i, instance in enumerate(instances):
+            instance_errors = errors.setdefault(i, {})
+            try:
+                instance.clean()
+            except ValidationError as e:
+                instance_errors = e.update_error_dict(instance_errors)
+            instance_exclude = exclude | {n for n in instance_errors if n != NON_FIELD_ERRORS}
+            with instance._batching_unique_constraints(True):
+                try:
+                    instance.validate_constraints(exclude=instance_exclude)
+                except ValidationError as e:
+                    instance_errors = e.update_error_dict(instance_errors)
+                errors[i] = instance_errors
+                unique_checks, date_checks = instance._get_unique_checks(exclude=instance_exclude)
+            for model_class, unique_check in unique_checks:
+                values = instance._get_unique_values(model_class, unique_check)
+                if values is not None:
+                    checks.setdefault((model_class, unique_check), {})[i] = values
+            for key, messages in instance._perform_date_checks(date_checks).items():
+                instance_errors.setdefault(key, []).extend(messages)
+
+        for (model_class, unique_check), values_by_index in checks.items():
+            for i in cls._get_unique_conflicts(
+                model_class, unique_check, instances, values_by_index
+            ):
+                key = unique_check[0] if len(unique_check) == 1 else NON_FIELD_ERRORS
+                errors[i].setdefault(key, []).append(
+                    instances[i].unique_error_message(model_class, unique_check)
+                )
+        return {i: ValidationError(errors[i]) for i in sorted(errors) if errors[i]}
+
+    @classmethod
+    def _bulk_clean_fields(
+        cls, instances: Sequence["DjangoBaseModel"], exclude: set[str]
+    ) -> dict[int, dict[str, list]]:
+        """clean_fields() for a batch of instances, one field at a time"""
+        errors: dict[int, dict[str, list]] = {}
+        for f in cls._meta.fields:
+            if f.name in exclude or getattr(f, "generated", False):
+                continue
+            is_foreign_key = isinstance(f, models.ForeignKey) and not f.remote_field.parent_link
+            # rows by value, for checking the existence of referenced objects at once
+            references: dict[Any, list[int]] = {}
+            for i, instance in enumerate(instances):
+                raw_value = getattr(instance, f.attname)
+                if (f.blank and raw_value in f.empty_values) or isinstance(
+                    raw_value, SKIPPED_VALUE_TYPES
+                ):
+                    continue
+                try:
+                    if is_foreign_key:
+                        value = f.to_python(raw_value)
+                        models.Field.validate(f, value, instance)
+                        f.run_validators(value)
+                        if value is not None:
+                            references.setdefault(value, []).append(i)
+                    else:
+                        value = f.clean(raw_value, instance)
+                    setattr(instance, f.attname, value)
+                except ValidationError as e:
+                    errors.setdefault(i, {})[f.name] = e.error_list
+            if references:
+                for value in cls._get_missing_references(f, list(references)):
+                    for i in references[value]:
+                        errors.setdefault(i, {})[f.name] = [
+                            ValidationError(
+                                f.error_messages["invalid"],
+                                code="invalid",
+                                params={
+                                    "model": f.remote_field.model._meta.verbose_name,
+                                    "pk": value,
+                                    "field": f.remote_field.field_name,
+                                    "value": value,
+                                },
+                            )
+                        ]
+        return errors
+
+    @classmethod
+    def _get_missing_references(cls, field: models.ForeignKey, values: list) -> set:
+        """values of a foreign key that do not reference an existing object"""
+        related_model = field.remote_field.model
+        field_name = field.remote_field.field_name
+        using = router.db_for_read(related_model)
+        queryset = related_model._base_manager.using(using).complex_filter(
+            field.get_limit_choices_to()
+        )
+        batch_size = connections[using].features.max_query_params or len(values)
+        existing = set()
+        for start in range(0, len(values), batch_size):
+            existing |= set(
+                queryset.filter(
+                    **{f"{field_name}__in": values[start : start + batch_size]}
+                ).values_list(field_name, flat=True)
+            )
+        return set(values) - existing
+
+    @classmethod
+    def _get_unique_conflicts(
+        cls,
+        model_class: type[models.Model],
+        unique_check: tuple[str, ...],
+        instances: Sequence["DjangoBaseModel"],
+        values_by_index: dict[int, tuple],
+    ) -> list[int]:
+        """positions of instances that collide with existing rows or earlier instances"""
+        indexes_by_values: dict[tuple, list[int]] = {}
+        for i, values in values_by_index.items():
+            indexes_by_values.setdefault(values, []).append(i)
+
+        pending = list(indexes_by_values)
+        max_params = connections[router.db_for_read(model_class)].features.max_query_params
+        batch_size = max(1, max_params // len(unique_check)) if max_params else len(pending)
+        existing: dict[tuple, set] = {}
+        for start in range(0, len(pending), batch_size):
+            lookup = functools.reduce(
+                operator.or_,
+                (
+                    models.Q(**dict(zip(unique_check, v)))
+                    for v in pending[start : start + batch_size]
+                ),
+            )
+            for pk, *values in model_class._default_manager.filter(lookup).values_list(
+                "pk", *unique_check
+            ):
+                existing.setdefault(tuple(values), set()).add(pk)
+
+        conflicts = []
+        for values, indexes in indexes_by_values.items():
+            for n, i in enumerate(indexes):
+                instance = instances[i]
+                pks = existing.get(values, set())
+                if not instance._state.adding:
+                    # like validate_unique(), the instance's own row is not a conflict
+                    pks = pks - {instance._get_pk_val(model_class._meta)}
+                if pks or n > 0:
+                    conflicts.append(i)
+        return sorted(conflicts)
+
+    @instrument("model.full_clean")
+    def full_clean(self, exclude=None, validate_unique=True, validate_constraints=True):
+        # only if both checks run, total unique constraints join the unique checks' query
+        with self._batching_unique_constraints(validate_unique and validate_constraints):
+            super().full_clean(
+                exclude=exclude,
+                validate_unique=validate_unique,
+                validate_constraints=validate_constraints,
+            )
+
+    @contextlib.contextmanager
+    def _batching_unique_constraints(self, enabled: bool) -> Iterator[None]:
+        """
+        While enabled, validate_unique() checks the total unique constraints along with
+        the unique fields, and validate_constraints() skips them. Otherwise each check
+        keeps Django's semantics.
         """
-        self.full_clean()
-        return super().save(*args, **kwargs)
+        previous = self.__dict__.pop("_batch_unique_constraints", None)
+        self._batch_unique_constraints = enabled
+        try:
+            yield
+        finally:
+            del self._batch_unique_constraints
+            if previous is not None:
+                self._batch_unique_constraints = previous
+
+    def _get_validation_plan(self) -> ValidationPlan | None:
+        if not seriously_settings.VALIDATION_PLANS:
+            return None
+        return get_validation_plan(self.__class__)
+
+    def clean_fields(self, exclude=None):
+        plan = self._get_validation_plan()
+        if plan is None:
+            return super().clean_fields(exclude=exclude)
+
+        exclude = exclude or ()
+        errors = {}
+        for name, attname, empty_values, clean in plan.fields:
+            if name in exclude:
+                continue
+            raw_value = getattr(self, attname)
+            if raw_value in empty_values or isinstance(raw_value, SKIPPED_VALUE_TYPES):
+                continue
+            try:
+                setattr(self, attname, clean(raw_value, self))
+            except ValidationError as e:
+                errors[name] = e.error_list
+        if errors:
+            raise ValidationError(errors)
+
+    def _get_unique_checks(self, exclude=None, include_meta_constraints=False):
+        batched = self._batch_unique_constraints and not include_meta_constraints
+        plan = self._get_validation_plan()
+        if plan is not None and not include_meta_constraints:
+            return plan.get_unique_checks(exclude or (), batched)
+        unique_checks, date_checks = super()._get_unique_checks(
+            exclude=exclude, include_meta_constraints=include_meta_constraints
+        )
+        if batched:
+            for model_class, constraint in _get_batched_unique_constraints(self.__class__):
+                if not any(name in (exclude or ()) for name in constraint.fields):
+                    unique_checks.append((model_class, tuple(constraint.fields)))
+        return unique_checks, date_checks
+
+    def _get_unique_values(
+        self, model_class: type[models.Model], unique_check: tuple[str, ...]
+    ) -> tuple | None:
+        """values to look up for a unique check. None if the check does not apply"""
+        values = []
+        for field_name in unique_check:
+            f = self._meta.get_field(field_name)
+            value = getattr(self, f.attname)
+            if value is None or (
+                value == "" and connection.features.interprets_empty_strings_as_nulls
+            ):
+                return None
+            if f.primary_key and not self._state.adding:
+                return None
+            values.append(value)
+        return tuple(values)
+
+    def _perform_unique_checks(self, unique_checks):
+        """combines the unique checks against each model class into a single query"""
+        errors: dict[str, list] = {}
+        lookups: dict[type[models.Model], list[tuple[tuple[str, ...], models.Q]]] = {}
+        for model_class, unique_check in unique_checks:
+            values = self._get_unique_values(model_class, unique_check)
+            if values is not None:
+                lookup = models.Q(**dict(zip(unique_check, values)))
+                lookups.setdefault(model_class, []).append((unique_check, lookup))
+
+        for model_class, class_lookups in lookups.items():
+            qs = model_class._default_manager.filter(
+                functools.reduce(operator.or_, (lookup for _, lookup in class_lookups))
+            )
+            model_class_pk = self._get_pk_val(model_class._meta)
+            if not self._state.adding and model_class_pk is not None:
+                qs = qs.exclude(pk=model_class_pk)
+            counts = qs.aggregate(
+                **{
+                    f"check_{i}": models.Count("pk", filter=lookup)
+                    for i, (_, lookup) in enumerate(class_lookups)
+                }
+            )
+            for i, (unique_check, _) in enumerate(class_lookups):
+                if counts[f"check_{i}"]:
+                    key = unique_check[0] if len(unique_check) == 1 else NON_FIELD_ERRORS
+                    errors.setdefault(key, []).append(
+                        self.unique_error_message(model_class, unique_check)
+                    )
+        return errors
+
+    def validate_constraints(self, exclude=None):
+        plan = self._get_validation_plan()
+        if plan is not None and plan.constraints is not None:
+            constraints = tuple(
+                (model_class, constraint)
+                for model_class, constraint, batched in plan.constraints
+                if not (batched and self._batch_unique_constraints)
+            )
+        else:
+            batched_ids = (
+                {
+                    id(constraint)
+                    for _, constraint in _get_batched_unique_constraints(self.__class__)
+                }
+                if self._batch_unique_constraints
+                else set()
+            )
+            constraints = tuple(
+                (model_class, constraint)
+                for model_class, model_constraints in self.get_constraints()
+                for constraint in model_constraints
+                if id(constraint) not in batched_ids
+            )
+        if not constraints:
+            return
+
+        using = router.db_for_write(self.__class__, instance=self)
+        errors: dict[str, list] = {}
+        for model_class, constraint in constraints:
+            try:
+                constraint.validate(model_class, self, exclude=exclude, using=using)
+            except ValidationError as e:
+                fields = getattr(constraint, "fields", ())
+                if getattr(e, "code", None) == "unique" and len(fields) == 1:
+                    errors.setdefault(fields[0], []).append(e)
+                else:
+                    errors = e.update_error_dict(errors)
+        if errors:
+            raise ValidationError(errors)
+
+    def get_update_fields(self) -> list[str] | None:
+        """
+        Computes ``update_fields`` for saving this instance, leaving out tracked fields
+        (``track_changes=True``) whose content did not change since it was loaded or
+        last saved. Returns ``None`` if nothing can be left out.
+        """
+        return self._get_update_fields(self._get_fingerprints())
+
+    def _get_update_fields(self, fingerprints: dict[str, bytes]) -> list[str] | None:
+        loaded_fingerprints = getattr(self, "_fingerprints", {})
+        unchanged = {
+            attname
+            for attname, fingerprint in fingerprints.items()
+            if loaded_fingerprints.get(attname) == fingerprint
+        }
+        if not unchanged:
+            return None
+        deferred = self.get_deferred_fields()
+        return [
+            f.attname
+            for f in self._meta.concrete_fields
+            if not f.primary_key and f.attname not in unchanged and f.attname not in deferred
+        ]
+
+    def _get_fingerprints(self, attnames=None) -> dict[str, bytes]:
+        return {
+            f.attname: f.fingerprint(self.__dict__[f.attname])  # type: ignore[attr-defined]
+            for f in _get_tracked_fields(self.__class__)
+            if f.attname in self.__dict__ and (attnames is None or f.attname in attnames)
+        }
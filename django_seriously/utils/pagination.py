@@ -0,0 +1,116 @@
+import base64
+import datetime
+import json
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from django_seriously.utils.models import keyset_filter
+
+
+class KeyEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # DjangoJSONEncoder truncates to milliseconds, keys must be exact
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(BasePagination):
+    """
+    DRF pagination on ``keyset_fields``. Fields set on the paginator take precedence
+    over the ``keyset_fields`` of a KeysetQuerySet, which fall back to ``created_at``
+    and ``id`` of DjangoBaseModel. Unlike page number pagination, neither OFFSET nor COUNT(*)
+    is used, so deep pages are as fast as the first one. The cursor is an opaque
+    encoding of the last (or first) key of the current page.
+    """
+
+    page_size = 100
+    cursor_query_param = "cursor"
+    keyset_fields: tuple[str, ...] | None = None
+    default_keyset_fields: tuple[str, ...] = ("created_at", "id")
+    invalid_cursor_message = _("Invalid cursor")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.fields = self.get_keyset_fields(queryset)
+        self.model = queryset.model
+        key, reverse = self.decode_cursor(request)
+
+        ordering = [f"-{f}" if reverse else f for f in self.fields]
+        queryset = queryset.order_by(*ordering)
+        if key is not None:
+            queryset = keyset_filter(queryset, self.fields, key, reverse)
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = key is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, key is not None
+        self.page = results
+        return results
+
+    def get_keyset_fields(self, queryset) -> tuple[str, ...]:
+        if self.keyset_fields is not None:
+            return tuple(self.keyset_fields)
+        return tuple(getattr(queryset, "keyset_fields", self.default_keyset_fields))
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, obj, reverse: bool) -> str:
+        key = [getattr(obj, self.model._meta.get_field(f).attname) for f in self.fields]
+        data = json.dumps({"k": key, "r": reverse}, cls=KeyEncoder)
+        cursor = base64.urlsafe_b64encode(data.encode()).decode()
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request) -> tuple[list[Any] | None, bool]:
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            key = [
+                self.model._meta.get_field(f).to_python(value)
+                for f, value in zip(self.fields, data["k"], strict=True)
+            ]
+            return key, bool(data["r"])
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
@@ -1,5 +1,6 @@
 from typing import Any, Set
 
+from django.core.exceptions import ImproperlyConfigured
 from django.utils.module_loading import import_string
 
 
@@ -19,6 +20,10 @@ class AppSettings:
     reloading, and lazy evaluation.
     This class is shamelessly recycled from DRF's APISettings without
     introducing a dependency on DRF.
+
+    Once load() was called (e.g. in AppConfig.ready), all settings are resolved
+    up front and again on every reload(), so that import strings are never
+    imported during a request.
     """
 
     def __init__(
@@ -31,6 +36,7 @@ class AppSettings:
         self.defaults = defaults
         self.import_strings = import_strings
         self._cached_attrs: Set[str] = set()
+        self._loaded = False
 
     def __getattr__(self, attr):
         if attr not in self.defaults:
@@ -52,9 +58,20 @@ class AppSettings:
         setattr(self, attr, val)
         return val
 
-    def reload(self) -> None:
+    def load(self) -> None:
+        """resolve and validate all settings at once"""
+        invalid = set(self.user_settings) - set(self.defaults)
+        if invalid:
+            raise ImproperlyConfigured(f"Invalid settings: {', '.join(sorted(invalid))}")
+        for attr in self.defaults:
+            getattr(self, attr)
+        self._loaded = True
+
+    def reload(self, user_settings: dict[str, Any] | None = None) -> None:
         for attr in self._cached_attrs:
             delattr(self, attr)
         self._cached_attrs.clear()
-        if hasattr(self, "_user_settings"):
-            delattr(self, "_user_settings")
+        if user_settings is not None:
+            self.user_settings = user_settings
+        if self._loaded:
+            self.load()
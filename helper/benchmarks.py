@@ -0,0 +1,383 @@
+"""
+Micro benchmarks for django-seriously against an in-memory SQLite database.
+
+    python helper/benchmarks.py              # run all benchmarks
+    python helper/benchmarks.py <name> ...   # run selected benchmarks
+"""
+
+import os
+import sys
+import time
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+settings.configure(
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    SECRET_KEY="not very secret in benchmarks",
+    INSTALLED_APPS=(
+        "django.contrib.admin",
+        "django.contrib.auth",
+        "django.contrib.contenttypes",
+        "django.contrib.messages",
+        "django.contrib.sessions",
+        "rest_framework",
+        "django_seriously.authtoken",
+    ),
+    MIDDLEWARE=(
+        "django.contrib.sessions.middleware.SessionMiddleware",
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "django.contrib.messages.middleware.MessageMiddleware",
+    ),
+    TEMPLATES=[
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "APP_DIRS": True,
+            "OPTIONS": {
+                "context_processors": [
+                    "django.template.context_processors.request",
+                    "django.contrib.auth.context_processors.auth",
+                    "django.contrib.messages.context_processors.messages",
+                ],
+            },
+        },
+    ],
+    ROOT_URLCONF=__name__,
+    PASSWORD_HASHERS=("django.contrib.auth.hashers.PBKDF2PasswordHasher",),
+    DEFAULT_AUTO_FIELD="django.db.models.AutoField",
+    USE_TZ=True,
+    ALLOWED_HOSTS=["testserver"],
+)
+django.setup()
+
+from django.core import management  # noqa: E402
+from django.db import connection  # noqa: E402
+
+management.call_command("migrate", verbosity=0)
+
+BENCHMARKS: dict[str, Callable[[], None]] = {}
+urlpatterns: list = []
+
+
+def benchmark(func: Callable[[], None]) -> Callable[[], None]:
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def create_tables(*models) -> None:
+    with connection.schema_editor() as schema_editor:
+        for model in models:
+            schema_editor.create_model(model)
+
+
+def timed(label: str, func: Callable[[], object], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {number / elapsed:>10.1f} ops/s")
+    return elapsed
+
+
+@benchmark
+def binary_fields() -> None:
+    """storage size and read/write throughput of binary fields vs. JSONField"""
+    from datetime import datetime
+
+    from django.db import models
+    from pydantic import BaseModel
+
+    from django_seriously.pydantic.codecs import COMPRESSORS, ENCODINGS
+    from django_seriously.pydantic.model_fields import PydanticBinaryField, PydanticJSONField
+
+    class Item(BaseModel):
+        sku: str
+        description: str
+        price: float
+        tags: list[str]
+        updated: datetime
+
+    class Document(BaseModel):
+        title: str
+        items: list[Item]
+
+    document = Document(
+        title="benchmark",
+        items=[
+            Item(
+                sku=f"SKU-{i:06d}",
+                description=f"description of item number {i} " * 3,
+                price=i * 1.25,
+                tags=["red", "green", "blue"][: i % 3 + 1],
+                updated=datetime(2025, 1, 1, 12, i % 60),
+            )
+            for i in range(1000)
+        ],
+    )
+
+    variants: dict[str, models.Field] = {
+        "JSONField": models.JSONField(),
+        "PydanticJSONField": PydanticJSONField(structure=Document),
+    }
+    for encoding in ENCODINGS:
+        for compression in COMPRESSORS:
+            variants[f"PydanticBinaryField({compression}, {encoding})"] = PydanticBinaryField(
+                structure=Document, compression=compression, encoding=encoding
+            )
+
+    for i, (label, field) in enumerate(variants.items()):
+        model = type(
+            f"BinaryBenchmark{i}",
+            (models.Model,),
+            {"doc": field, "__module__": __name__, "Meta": type("Meta", (), {"app_label": "bm"})},
+        )
+        create_tables(model)
+        value = document.model_dump(mode="json") if type(field) is models.JSONField else document
+        model.objects.create(doc=value)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT LENGTH(doc) FROM {model._meta.db_table}")
+            size = cursor.fetchone()[0]
+
+        print(f"{label}: {size} bytes")
+        timed("write", lambda: model.objects.create(doc=value), number=100)
+        timed("read", lambda: list(model.objects.all()[:1]), number=100)
+
+
+@benchmark
+def admin_change_view() -> None:
+    """admin change view of a model with several large pydantic documents"""
+    from django.contrib import admin
+    from django.contrib.auth.models import User
+    from django.db import models
+    from django.test import Client
+    from django.urls import clear_url_caches, path
+    from pydantic import BaseModel
+
+    from django_seriously.pydantic.model_fields import PydanticJSONField
+
+    class Entry(BaseModel):
+        key: str
+        value: float
+        labels: list[str]
+
+    class Document(BaseModel):
+        entries: list[Entry]
+
+    document = Document(
+        entries=[
+            Entry(key=f"entry-{i}", value=i / 3, labels=["x", "y", "z"][: i % 3 + 1])
+            for i in range(500)
+        ]
+    )
+    model = type(
+        "AdminBenchmark",
+        (models.Model,),
+        {
+            **{f"doc{i}": PydanticJSONField(structure=Document) for i in range(4)},
+            "__module__": __name__,
+            "Meta": type("Meta", (), {"app_label": "bm"}),
+        },
+    )
+    create_tables(model)
+    obj = model.objects.create(**{f"doc{i}": document for i in range(4)})
+
+    class BenchmarkSite(admin.AdminSite):
+        def get_app_list(self, request, app_label=None):
+            # "bm" is not an installed app, skip the sidebar
+            return []
+
+    site = BenchmarkSite(name="benchmark")
+    site.register(model)
+    urlpatterns[:] = [path("admin/", site.urls)]
+    clear_url_caches()
+
+    client = Client()
+    client.force_login(User.objects.create_superuser("admin", "admin@example.com", "admin"))
+    url = f"/admin/bm/adminbenchmark/{obj.pk}/change/"
+    data = {f"doc{i}": document.model_dump_json() for i in range(4)}
+    invalid = {**data, "doc3": "{}"}
+
+    assert client.get(url).status_code == 200
+    assert client.post(url, data).status_code == 302
+    timed("GET", lambda: client.get(url), number=20)
+    timed("POST (unchanged)", lambda: client.post(url, data), number=20)
+    timed("POST (invalid, re-rendered)", lambda: client.post(url, invalid), number=20)
+
+
+@benchmark
+def incremental_clean() -> None:
+    """queries and throughput of DjangoBaseModel.save with incremental vs. full validation"""
+    from django.contrib.auth.models import User
+    from django.db import models
+    from django.test.utils import CaptureQueriesContext
+    from django.utils import timezone
+
+    from django_seriously.authtoken.models import Token
+
+    user = User.objects.create_user("bench", "bench@example.com")
+    token = Token.objects.create(name="bench", key="pbkdf2$", user=user)
+    token = Token.objects.get(pk=token.pk)
+
+    def full_save(**kwargs):
+        # previous behavior: complete validation on every save
+        token.full_clean()
+        models.Model.save(token, **kwargs)
+
+    variants = {
+        "full": full_save,
+        "incremental": token.save,
+    }
+    for label, save in variants.items():
+        print(f"{label}:")
+        for case, kwargs in [
+            ("update_fields", {"update_fields": ["last_seen_at"]}),
+            ("changed fields", {}),
+        ]:
+
+            def run():
+                token.last_seen_at = timezone.now()
+                token.name = token.name[::-1]
+                save(**kwargs)
+
+            with CaptureQueriesContext(connection) as ctx:
+                run()
+            timed(f"{case} ({len(ctx.captured_queries)} queries)", run, number=2000)
+
+
+@benchmark
+def uuid_primary_keys() -> None:
+    """insert throughput of random (uuid4) vs. time-ordered (uuid7) primary keys"""
+    import uuid
+
+    from django.db import models
+
+    from django_seriously.utils.models import uuid7
+
+    for factory in (uuid.uuid4, uuid7):
+        model = type(
+            f"UUIDBenchmark{factory.__name__}",
+            (models.Model,),
+            {
+                "id": models.UUIDField(primary_key=True, default=factory),
+                "value": models.IntegerField(),
+                "__module__": __name__,
+                "Meta": type("Meta", (), {"app_label": "bm"}),
+            },
+        )
+        create_tables(model)
+        # inserts into an already large table, as locality only matters then
+        model.objects.bulk_create([model(value=i) for i in range(200_000)], batch_size=1000)
+
+        def insert():
+            model.objects.bulk_create([model(value=0) for _ in range(1000)])
+
+        timed(f"{factory.__name__} (batches of 1000 rows)", insert, number=200)
+
+
+@benchmark
+def validation_plans() -> None:
+    """DjangoBaseModel.full_clean with precompiled validation plans vs. Django's generic path"""
+    from unittest import mock
+
+    from django.core.validators import MaxValueValidator
+    from django.db import models
+
+    from django_seriously.utils.models import DjangoBaseModel
+
+    model = type(
+        "ValidationPlanBenchmark",
+        (DjangoBaseModel,),
+        {
+            **{f"text_{i}": models.CharField(max_length=50, blank=True) for i in range(5)},
+            **{
+                f"number_{i}": models.IntegerField(validators=[MaxValueValidator(1000)])
+                for i in range(5)
+            },
+            "code": models.CharField(max_length=20, unique=True),
+            "__module__": __name__,
+            "Meta": type(
+                "Meta",
+                (),
+                {
+                    "app_label": "bm",
+                    "unique_together": [("number_0", "number_1")],
+                    "constraints": [
+                        models.CheckConstraint(
+                            **{
+                                "condition" if django.VERSION >= (5, 1) else "check": models.Q(
+                                    number_2__gte=0
+                                )
+                            },
+                            name="bm_number_2_positive",
+                        ),
+                    ],
+                },
+            ),
+        },
+    )
+    create_tables(model)
+    instance = model(code="bench", **{f"number_{i}": i for i in range(5)}, text_0="foo")
+
+    for enabled in (False, True):
+        with mock.patch("django_seriously.settings.seriously_settings.VALIDATION_PLANS", enabled):
+            label = "plan" if enabled else "generic"
+            timed(f"{label}: clean_fields", instance.clean_fields, number=20000)
+            timed(
+                f"{label}: full_clean (without queries)",
+                lambda: instance.full_clean(validate_unique=False, validate_constraints=False),
+                number=20000,
+            )
+            timed(f"{label}: full_clean", instance.full_clean, number=2000)
+
+
+@benchmark
+def token_hashing() -> None:
+    """concurrent async token generation and checks on hashing pools of different sizes"""
+    import asyncio
+    from unittest import mock
+
+    from django_seriously.authtoken.utils import acheck_password, agenerate_token
+
+    async def generate(count):
+        return await asyncio.gather(*(agenerate_token() for _ in range(count)))
+
+    tokens = asyncio.run(generate(1))
+
+    async def check(count):
+        await asyncio.gather(
+            *(acheck_password(tokens[0].bearer[16:], tokens[0].key) for _ in range(count))
+        )
+
+    for workers in (1, 2, 4, 8):
+        with mock.patch("django_seriously.settings.seriously_settings.HASHING_WORKERS", workers):
+            timed(
+                f"{workers} workers: agenerate_token (x100)", lambda: asyncio.run(generate(100)), 20
+            )
+            timed(f"{workers} workers: acheck_password (x100)", lambda: asyncio.run(check(100)), 20)
+
+
+@benchmark
+def metrics_overhead() -> None:
+    """cost of instrumented calls without a metrics sink and with the in-memory sink"""
+    from django_seriously.utils.metrics import InMemorySink, instrument, use_sink
+
+    def plain() -> None:
+        pass
+
+    instrumented = instrument("bm.call")(plain)
+
+    timed("plain call", plain, number=1_000_000)
+    with use_sink(None):
+        timed("instrumented, disabled", instrumented, number=1_000_000)
+    with use_sink(InMemorySink()):
+        timed("instrumented, in-memory sink", instrumented, number=200_000)
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        print(f"### {name}: {BENCHMARKS[name].__doc__}")
+        BENCHMARKS[name]()
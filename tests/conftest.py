@@ -39,9 +39,11 @@ def pytest_configure(config):
             "django.contrib.sessions.middleware.SessionMiddleware",
             "django.middleware.common.CommonMiddleware",
             "django.contrib.auth.middleware.AuthenticationMiddleware",
+            "django.contrib.messages.middleware.MessageMiddleware",
             "django.middleware.locale.LocaleMiddleware",
         ),
         INSTALLED_APPS=(
+            "django.contrib.admin",
             "django.contrib.auth",
             "django.contrib.contenttypes",
             "django.contrib.sessions",
@@ -49,6 +51,7 @@ def pytest_configure(config):
             "django.contrib.messages",
             "django.contrib.staticfiles",
             "rest_framework",
+            "django_seriously",
             "django_seriously.authtoken",
             "drf_spectacular",
             "tests",
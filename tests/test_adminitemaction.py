@@ -0,0 +1,329 @@
+import threading
+
+import pytest
+from django.conf.urls.i18n import i18n_patterns
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.db import connection, models
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import path, reverse, set_script_prefix
+from django.utils import translation
+
+from django_seriously.utils.admin import (
+    AdminItemAction,
+    AdminItemActionMixin,
+    admin_navigation_link,
+    reverse_pk,
+)
+from django_seriously.utils.executors import ThreadPoolJobExecutor
+from django_seriously.utils.models import DjangoBaseModel
+
+
+class ActionTestModel(DjangoBaseModel):
+    name = models.CharField(max_length=20)
+
+
+class ActionTestItem(DjangoBaseModel):
+    parent = models.ForeignKey(ActionTestModel, on_delete=models.CASCADE)
+    done = models.BooleanField(default=False)
+
+
+class ActionTestAction(AdminItemAction[ActionTestModel]):
+    model_cls = ActionTestModel
+    actions = [("finish", "Finish"), ("reopen", "Reopen")]
+
+    @classmethod
+    def is_actionable(cls, obj: ActionTestModel, action: str) -> bool:
+        items = ActionTestItem.objects.filter(parent=obj)
+        if action == "finish":
+            return items.filter(done=False).exists()
+        return items.filter(done=True).exists()
+
+    @classmethod
+    def get_actionable(cls, objs):
+        actionable: dict = {obj.pk: set() for obj in objs}
+        for parent_id, done in ActionTestItem.objects.filter(parent__in=objs).values_list(
+            "parent_id", "done"
+        ):
+            actionable[parent_id].add("reopen" if done else "finish")
+        return actionable
+
+    def perform_action(self, obj: ActionTestModel, action: str) -> None:
+        ActionTestItem.objects.filter(parent=obj).update(done=action == "finish")
+
+
+class BackgroundTestAction(ActionTestAction):
+    background = True
+
+    def perform_action(self, obj: ActionTestModel, action: str) -> str:
+        self.report_progress(0.5)
+        super().perform_action(obj, action)
+        return obj.name
+
+
+site = admin.AdminSite(name="actiontest")
+
+
+@admin.register(ActionTestModel, site=site)
+class ActionTestModelAdmin(AdminItemActionMixin, admin.ModelAdmin):
+    list_display = ("name", "admin_actions")
+    item_actions = [ActionTestAction]
+
+    def admin_actions(self, obj: ActionTestModel):
+        return ActionTestAction.action_markup(obj)
+
+
+site.register(User)
+
+urlpatterns = [
+    path("admin/", AdminItemAction.urls()),
+    path("admin/", site.urls),
+]
+
+
+class I18nUrls:
+    urlpatterns = i18n_patterns(
+        path("admin/", AdminItemAction.urls()),
+        path("admin/", site.urls),
+    )
+
+
+def create_objects(count: int) -> None:
+    for i in range(count):
+        obj = ActionTestModel.objects.create(name=f"obj{i}")
+        ActionTestItem.objects.create(parent=obj, done=i % 2 == 0)
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+def test_action_markup():
+    create_objects(2)
+    objs = list(ActionTestModel.objects.order_by("name"))
+
+    # per object and action without prefetching
+    with CaptureQueriesContext(connection) as ctx:
+        markups = [ActionTestAction.action_markup(obj) for obj in objs]
+    assert len(ctx.captured_queries) == 4
+
+    with CaptureQueriesContext(connection) as ctx:
+        ActionTestAction.prefetch_actionable(objs)
+        assert [ActionTestAction.action_markup(obj) for obj in objs] == markups
+    assert len(ctx.captured_queries) == 1
+    assert "/reopen/" in markups[0] and "/finish/" not in markups[0]
+    assert "/finish/" in markups[1] and "/reopen/" not in markups[1]
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+def test_changelist_constant_queries():
+    client = Client()
+    client.force_login(User.objects.create_superuser("admin", "admin@example.com", "pw"))
+    url = "/admin/tests/actiontestmodel/"
+
+    query_counts = []
+    for count in (5, 20):
+        create_objects(count)
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+        assert response.status_code == 200
+        query_counts.append(len(ctx.captured_queries))
+        rows = ActionTestModel.objects.count()
+        assert response.content.count(b"/actiontestaction/finish/") == rows // 2
+        assert response.content.count(b"/actiontestaction/reopen/") == rows - rows // 2
+    assert query_counts[0] == query_counts[1]
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+def test_item_action():
+    client = Client()
+    client.force_login(User.objects.create_superuser("admin", "admin@example.com", "pw"))
+    create_objects(2)
+    obj = ActionTestModel.objects.get(name="obj1")
+    url = f"/admin/tests/actiontestmodel/{obj.pk}/actiontestaction/finish/"
+
+    assert client.post(url).status_code == 204
+    assert ActionTestItem.objects.get(parent=obj).done is True
+    # not actionable anymore
+    assert client.post(url).status_code == 400
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+def test_bulk_action(monkeypatch):
+    client = Client()
+    client.force_login(User.objects.create_superuser("admin", "admin@example.com", "pw"))
+    monkeypatch.setattr(ActionTestAction, "bulk_batch_size", 4)
+    create_objects(10)
+    objs = list(ActionTestModel.objects.order_by("name"))
+    ids = [str(obj.pk) for obj in objs]
+    missing = "00000000-0000-0000-0000-000000000000"
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.post(
+            "/admin/tests/actiontestmodel/actiontestaction/finish/",
+            {"ids": [*ids, missing, "invalid"]},
+            content_type="application/json",
+        )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    # unfinished objects (odd positions) are finished, in 3 batches
+    assert {i for i, pk in enumerate(ids) if results[pk]["status"] == "ok"} == {1, 3, 5, 7, 9}
+    assert {i for i, pk in enumerate(ids) if results[pk]["status"] == "not_actionable"} == {
+        0,
+        2,
+        4,
+        6,
+        8,
+    }
+    assert results[missing] == {"status": "skipped"}
+    assert results["invalid"]["status"] == "error"
+    assert not ActionTestItem.objects.filter(done=False).exists()
+    assert sum("UPDATE" in q["sql"] for q in ctx.captured_queries) == 5
+    # lock + actionable check per batch, regardless of batch content
+    assert sum('FROM "tests_actiontestitem"' in q["sql"] for q in ctx.captured_queries) == 3
+
+    response = client.post(
+        "/admin/tests/actiontestmodel/actiontestaction/finish/", {"ids": ids[:2]}
+    )
+    assert response.status_code == 200
+    assert [r["status"] for r in response.json()["results"].values()] == ["not_actionable"] * 2
+
+    response = client.post("/admin/tests/actiontestmodel/actiontestaction/nope/", {"ids": ids})
+    assert response.status_code == 400
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+def test_bulk_action_error(monkeypatch):
+    client = Client()
+    client.force_login(User.objects.create_superuser("admin", "admin@example.com", "pw"))
+    monkeypatch.setattr(ActionTestAction, "bulk_batch_size", 2)
+    create_objects(4)
+    ids = [str(obj.pk) for obj in ActionTestModel.objects.order_by("name")]
+
+    def perform_actions(self, objs, action):
+        ActionTestItem.objects.filter(parent__in=objs).update(done=action == "finish")
+        if any(str(obj.pk) == ids[2] for obj in objs):
+            raise ValueError("broken")
+        return {obj.pk: "done" for obj in objs}
+
+    monkeypatch.setattr(ActionTestAction, "perform_actions", perform_actions)
+    response = client.post(
+        "/admin/tests/actiontestmodel/actiontestaction/reopen/",
+        {"ids": ids},
+        content_type="application/json",
+    )
+    results = response.json()["results"]
+    assert results[ids[0]] == {"status": "ok", "result": "done"}
+    assert results[ids[1]] == {"status": "not_actionable"}
+    # the whole failed batch is rolled back
+    assert results[ids[2]] == {"status": "error", "error": "broken"}
+    assert results[ids[3]] == {"status": "error", "error": "broken"}
+    assert ActionTestItem.objects.get(parent_id=ids[0]).done is False
+    assert ActionTestItem.objects.get(parent_id=ids[2]).done is True
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+@override_settings(
+    SERIOUSLY_SETTINGS={
+        "ADMIN_ACTION_EXECUTOR": "django_seriously.utils.executors.SynchronousJobExecutor"
+    }
+)
+def test_background_action(django_capture_on_commit_callbacks):
+    client = Client()
+    client.force_login(User.objects.create_superuser("admin", "admin@example.com", "pw"))
+    create_objects(2)
+    obj = ActionTestModel.objects.get(name="obj1")
+    url = f"/admin/tests/actiontestmodel/{obj.pk}/backgroundtestaction/finish/"
+    assert "resp.status === 202" in BackgroundTestAction.action_markup(obj)
+
+    # the job only starts once the request's transaction commits
+    with django_capture_on_commit_callbacks() as callbacks:
+        response = client.post(url)
+        assert response.status_code == 202
+        status_url = response.json()["status_url"]
+        assert response.json()["job_id"] in status_url
+        assert client.get(status_url).json()["status"] == "pending"
+    for callback in callbacks:
+        callback()
+    assert client.get(status_url).json() == {"status": "done", "progress": 1.0, "result": "obj1"}
+    assert ActionTestItem.objects.get(parent=obj).done is True
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(url)
+    status = client.get(response.json()["status_url"]).json()
+    assert status["status"] == "failed"
+    assert status["error"] == "not actionable anymore"
+
+    # jobs are only visible to the user who submitted them
+    other = Client()
+    other.force_login(User.objects.create_superuser("other", "other@example.com", "pw"))
+    assert other.get(status_url).status_code == 404
+
+    unknown_url = "/admin/tests/actiontestmodel/backgroundtestaction/jobs/unknown/"
+    assert client.get(unknown_url).status_code == 404
+    assert client.get(url).status_code == 405
+
+
+@pytest.mark.django_db
+def test_thread_pool_executor(django_capture_on_commit_callbacks):
+    executor = ThreadPoolJobExecutor()
+    started, proceed = threading.Event(), threading.Event()
+
+    def job(report_progress):
+        report_progress(0.25)
+        started.set()
+        proceed.wait(5)
+        return 42
+
+    with django_capture_on_commit_callbacks(execute=True):
+        job_id = executor.submit(job, owner=1)
+    started.wait(5)
+    assert executor.get_status(job_id) == {"status": "running", "owner": 1, "progress": 0.25}
+    proceed.set()
+    executor.pool.shutdown(wait=True)
+    assert executor.get_status(job_id) == {
+        "status": "done",
+        "owner": 1,
+        "progress": 1.0,
+        "result": 42,
+    }
+    assert executor.get_status("unknown") is None
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+def test_reverse_pk():
+    obj = ActionTestModel.objects.create(name="<foo>")
+    user = User.objects.create_user("foo")
+
+    def check():
+        for name, pk, args in [
+            ("actiontest:tests_actiontestmodel_change", obj.pk, []),
+            ("actiontest:auth_user_change", user.pk, []),
+            ("actiontest:auth_user_change", "a/b c", []),
+            ("actiontestaction", obj.pk, ["finish"]),
+        ]:
+            assert reverse_pk(name, pk, *args) == reverse(name, args=[pk, *args])
+        assert reverse(
+            "actiontest:tests_actiontestmodel_change", args=[obj.pk]
+        ) in admin_navigation_link(obj)
+
+    check()
+    try:
+        set_script_prefix("/prefix/")
+        check()
+        assert reverse_pk("actiontestaction", obj.pk, "finish").startswith("/prefix/admin/")
+    finally:
+        set_script_prefix("/")
+
+    with override_settings(ROOT_URLCONF=I18nUrls):
+        for language in ("de-de", "en-us"):
+            with translation.override(language):
+                check()
+                url = reverse_pk("actiontestaction", obj.pk, "finish")
+                assert url.startswith(f"/{language}/admin/")
+    assert reverse_pk("actiontestaction", obj.pk, "finish").startswith("/admin/")
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import os
 import uuid
@@ -5,8 +6,15 @@ from typing import Tuple
 from unittest import mock
 
 import pytest
+from asgiref.sync import async_to_sync
+from django.contrib import admin
 from django.contrib.auth.hashers import get_hasher
 from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models.signals import post_delete
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import path
 from django.utils.crypto import get_random_string
 from rest_framework.permissions import IsAuthenticated
@@ -15,8 +23,19 @@ from rest_framework.test import APIClient
 from rest_framework.views import APIView
 
 from django_seriously.authtoken.authentication import TokenAuthentication, TokenHasScope
-from django_seriously.authtoken.models import Token
-from django_seriously.authtoken.utils import TokenContainer, generate_token
+from django_seriously.authtoken.models import Token, TokenQuerySet
+from django_seriously.authtoken.signals import tokens_revoked
+from django_seriously.authtoken.utils import (
+    TokenContainer,
+    acheck_password,
+    agenerate_token,
+    amake_password,
+    generate_token,
+    get_hashing_executor,
+    make_password,
+)
+from django_seriously.settings import seriously_settings
+from django_seriously.utils.models import uuid7
 
 
 class TestAPIView(APIView):
@@ -41,6 +60,7 @@ class TestAPIScopedView(APIView):
 urlpatterns = [
     path("u/", TestAPIView.as_view()),
     path("s/", TestAPIScopedView.as_view()),
+    path("admin/", admin.site.urls),
 ]
 
 
@@ -79,6 +99,25 @@ def test_unknown_token():
     assert response.status_code == 401
 
 
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+@mock.patch("django_seriously.settings.seriously_settings.AUTH_TOKEN_ID_FACTORY", uuid7)
+def test_time_ordered_token_auth():
+    token, token_container = gen_token()
+    assert token.id.version == 7
+
+    response = APIClient().get("/u/", HTTP_AUTHORIZATION=f"Bearer {token_container.encoded_bearer}")
+    assert response.status_code == 200
+
+    # other versions are rejected
+    token_id = uuid.UUID(bytes=token.id.bytes, version=1)
+    Token.objects.filter(id=token.id).update(id=token_id)
+    raw_bearer_token = token_id.bytes + token_container.bearer[16:]
+    bearer = base64.urlsafe_b64encode(raw_bearer_token).decode()
+    response = APIClient().get("/u/", HTTP_AUTHORIZATION=f"Bearer {bearer}")
+    assert response.status_code == 401
+
+
 @pytest.mark.urls(__name__)
 @pytest.mark.django_db
 def test_known_id_invalid_secret():
@@ -171,3 +210,178 @@ def test_token_rehash():
     assert saved_key_rehashed.startswith("pbkdf2_sha256$5000$")
     # no change in method, so nothing is supposed to change
     assert saved_key_rehashed == saved_key_rehashed2
+
+
+def test_settings_snapshot():
+    # resolved at startup, lookups are plain attribute reads
+    assert vars(seriously_settings)["MAKE_PASSWORD"] is make_password
+    assert vars(seriously_settings)["AUTH_TOKEN_MODEL"] is Token
+
+    with override_settings(
+        SERIOUSLY_SETTINGS={"AUTH_TOKEN_SCOPES": ["a"], "AUTH_TOKEN_ID_FACTORY": "uuid.uuid1"}
+    ):
+        assert vars(seriously_settings)["AUTH_TOKEN_ID_FACTORY"] is uuid.uuid1
+        assert seriously_settings.AUTH_TOKEN_SCOPES == ["a"]
+    assert seriously_settings.AUTH_TOKEN_ID_FACTORY is uuid.uuid4
+    assert seriously_settings.AUTH_TOKEN_SCOPES == []
+
+    with pytest.raises(ImproperlyConfigured, match="AUTH_TOKEN_SCOPE"):
+        with override_settings(SERIOUSLY_SETTINGS={"AUTH_TOKEN_SCOPE": ["a"]}):
+            pass  # pragma: no cover
+    assert seriously_settings.AUTH_TOKEN_SCOPES == []
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+def test_token_admin_changelist():
+    client = Client()
+    client.force_login(User.objects.create_superuser("admin", "admin@example.com", "pw"))
+
+    query_counts = []
+    for count in (2, 8):
+        for i in range(count):
+            Token.objects.create(
+                key="pbkdf2$", name="test", user=User.objects.create_user(f"{count}-{i}")
+            )
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get("/admin/authtoken/token/")
+        assert response.status_code == 200
+        assert response.context["cl"].result_count == Token.objects.count()
+        query_counts.append(len(ctx.captured_queries))
+    assert query_counts[0] == query_counts[1]
+
+
+@pytest.mark.django_db
+def test_token_bulk_revocation():
+    alice, bob = User.objects.create_user("alice"), User.objects.create_user("bob")
+    for user, count in ((alice, 5), (bob, 2)):
+        for i in range(count):
+            Token.objects.create(key="pbkdf2$", name=str(i), user=user)
+    revocations = []
+
+    def receiver(sender, token_ids, user_ids, **kwargs):
+        revocations.append((len(token_ids), user_ids))
+
+    tokens_revoked.connect(receiver)
+    try:
+        with CaptureQueriesContext(connection) as ctx:
+            assert Token.objects.filter(user=alice).revoke(batch_size=2) == 5
+    finally:
+        tokens_revoked.disconnect(receiver)
+
+    # select + delete per chunk, a short chunk ends the loop
+    assert len(ctx.captured_queries) == 6
+    assert revocations == [(2, {alice.pk}), (2, {alice.pk}), (1, {alice.pk})]
+    assert list(Token.objects.values_list("user", flat=True)) == [bob.pk, bob.pk]
+    assert Token.objects.all().revoke() == 2
+    assert not Token.objects.exists()
+
+    with pytest.raises(TypeError):
+        Token.objects.all()[:10].revoke()
+
+
+@pytest.mark.django_db
+def test_token_revocation_with_delete_relations():
+    user = User.objects.create_user("carol")
+    for i in range(3):
+        Token.objects.create(key="pbkdf2$", name=str(i), user=user)
+    deleted, revocations = [], []
+
+    def delete_receiver(sender, instance, **kwargs):
+        deleted.append(instance.pk)
+
+    def revoke_receiver(sender, token_ids, **kwargs):
+        revocations.append(token_ids)
+
+    # tokens referenced by other models go through the collector of delete()
+    post_delete.connect(delete_receiver, sender=Token)
+    tokens_revoked.connect(revoke_receiver)
+    try:
+        with mock.patch.object(TokenQuerySet, "_has_delete_relations", return_value=True):
+            assert Token.objects.filter(user=user).revoke(batch_size=2) == 3
+    finally:
+        post_delete.disconnect(delete_receiver, sender=Token)
+        tokens_revoked.disconnect(revoke_receiver)
+    assert sorted(deleted) == sorted(token_id for ids in revocations for token_id in ids)
+    assert len(deleted) == 3 and not Token.objects.exists()
+
+
+def test_token_index_names():
+    # the names of the existing migration
+    assert [index.name for index in Token._meta.indexes] == [
+        "authtoken_token_seen",
+        "authtoken_token_created",
+    ]
+
+    # Token is abstract without the authtoken app, subclasses get their own names
+    names = [
+        index.name % {"app_label": "organizations", "class": "organizationaccesstoken"}
+        for index in Token._meta.original_attrs["indexes"]
+    ]
+    assert names == ["organizati_organizati_seen", "organizati_organizati_created"]
+
+
+def test_async_hashing():
+    async def issue():
+        tokens = await asyncio.gather(*(agenerate_token() for _ in range(8)))
+        checks = await asyncio.gather(
+            *(acheck_password(t.bearer[16:], t.key) for t in tokens),
+            acheck_password(b"wrong", tokens[0].key),
+        )
+        return tokens, checks, await amake_password("secret")
+
+    with mock.patch("django_seriously.settings.seriously_settings.HASHING_WORKERS", 2):
+        tokens, checks, key = asyncio.run(issue())
+        assert get_hashing_executor()._max_workers == 2
+    assert len({t.id for t in tokens}) == 8
+    assert checks == [True] * 8 + [False]
+    assert key.startswith("pbkdf2_sha256$1000$")
+
+
+@pytest.mark.django_db
+def test_async_token_rehash():
+    token, token_container = gen_token()
+    raw_token = token_container.bearer[16:]
+    saved_key_original = token.key
+
+    def set_key(key: str) -> None:
+        token.key = key
+        token.save(update_fields=["key"])
+
+    def make_new_password(password) -> str:
+        hasher = get_hasher("pbkdf2_sha256")
+        return hasher.encode(password, hasher.salt(), iterations=5_000)  # type: ignore
+
+    def check_new_password_rehash(raw_password: str) -> bool:
+        return not raw_password.startswith("pbkdf2_sha256$5000$")
+
+    check = async_to_sync(acheck_password)
+    # current hashing method, nothing is supposed to change
+    assert check(raw_token, token.key, setter=set_key)
+    token.refresh_from_db()
+    assert token.key == saved_key_original
+
+    with (
+        mock.patch(
+            "django_seriously.settings.seriously_settings.CHECK_PASSWORD_REHASH",
+            check_new_password_rehash,
+        ),
+        mock.patch(
+            "django_seriously.settings.seriously_settings.MAKE_PASSWORD",
+            make_new_password,
+        ),
+    ):
+        # wrong passwords don't trigger the rehash
+        assert not check(b"wrong", token.key, setter=set_key)
+        token.refresh_from_db()
+        assert token.key == saved_key_original
+
+        assert check(raw_token, token.key, setter=set_key)
+        token.refresh_from_db()
+        saved_key_rehashed = token.key
+        assert check(raw_token, token.key, setter=set_key)
+        token.refresh_from_db()
+
+    assert saved_key_original.startswith("pbkdf2_sha256$1000$")
+    assert saved_key_rehashed.startswith("pbkdf2_sha256$5000$")
+    assert token.key == saved_key_rehashed
@@ -1,9 +1,21 @@
+import time
+import uuid
+from unittest import mock
+
+import django
 import pytest
+from django.contrib.auth.models import User
 from django.core import exceptions
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
 
-from django_seriously.utils.models import DjangoBaseModel
+from django_seriously.utils.models import (
+    DjangoBaseModel,
+    ValidatedManager,
+    get_validation_plan,
+    uuid7,
+)
 
 
 class TestModel(DjangoBaseModel):
@@ -19,8 +31,299 @@ def test_base_model_derivation():
     assert inst.field == 1
 
 
+def test_uuid7():
+    ids = [uuid7() for _ in range(1000)]
+    assert all(i.version == 7 and i.variant == uuid.RFC_4122 for i in ids)
+    timestamps = [i.bytes[:6] for i in ids]
+    assert timestamps == sorted(timestamps)
+    assert len(set(ids)) == len(ids)
+    assert abs(int.from_bytes(ids[0].bytes[:6]) / 1000 - time.time()) < 5
+
+    # strictly increasing, even if the clock stands still or goes backwards
+    now = time.time_ns()
+    with mock.patch("time.time_ns", side_effect=[now, now, now - 10**9, now]):
+        ids = [uuid7() for _ in range(4)]
+    assert ids == sorted(ids) and len(set(ids)) == 4
+
+
 @pytest.mark.django_db
 def test_base_model_clean_check():
     """forced full_clean makes this raise. otherwise validation would not run"""
     with pytest.raises(exceptions.ValidationError):
         TestModel.objects.create(field=102)
+
+
+class IncrementalTestModel(DjangoBaseModel):
+    code = models.CharField(max_length=10, unique=True)
+    group = models.IntegerField()
+    rank = models.IntegerField(validators=[MaxValueValidator(100)])
+    note = models.CharField(max_length=10, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["group", "rank"], name="unique_group_rank"),
+            models.CheckConstraint(
+                **{"condition" if django.VERSION >= (5, 1) else "check": models.Q(group__gte=0)},
+                name="group_positive",
+            ),
+        ]
+
+
+@pytest.mark.django_db
+def test_base_model_incremental_clean():
+    IncrementalTestModel.objects.create(code="a", group=1, rank=1)
+    instance = IncrementalTestModel.objects.create(code="b", group=1, rank=2)
+    # invalid value that did not get in through save()
+    IncrementalTestModel.objects.filter(pk=instance.pk).update(rank=200)
+    instance = IncrementalTestModel.objects.get(pk=instance.pk)
+    assert instance.get_changed_fields() == set()
+
+    # only the UPDATE is executed, no uniqueness queries for untouched fields
+    instance.note = "foo"
+    assert instance.get_changed_fields() == {"note"}
+    with CaptureQueriesContext(connection) as ctx:
+        instance.save()
+    assert len(ctx.captured_queries) == 1
+    assert instance.get_changed_fields() == set()
+
+    with CaptureQueriesContext(connection) as ctx:
+        instance.save(update_fields=["note"])
+    assert len(ctx.captured_queries) == 1
+
+    # changed fields are validated together with the constraints involving them
+    instance.group = -1
+    with pytest.raises(exceptions.ValidationError) as excinfo:
+        instance.save()
+    assert "rank" in excinfo.value.message_dict
+    assert "group_positive" in str(excinfo.value)
+
+    instance.rank = 1
+    instance.group = 1
+    with pytest.raises(exceptions.ValidationError, match="Group and Rank already exists"):
+        instance.save()
+
+    instance.code = "a"
+    with pytest.raises(exceptions.ValidationError, match="Code already exists"):
+        instance.save(update_fields=["code"])
+
+
+class CleanedTestModel(DjangoBaseModel):
+    code = models.CharField(max_length=10)
+    rank = models.IntegerField(validators=[MaxValueValidator(100)])
+
+    def clean(self):
+        # derived value, not validated unless clean() changes are picked up
+        if self.code == "derive":
+            self.rank = 1000
+
+
+@pytest.mark.django_db
+def test_base_model_incremental_clean_changed_by_clean():
+    instance = CleanedTestModel.objects.create(code="a", rank=1)
+    instance = CleanedTestModel.objects.get(pk=instance.pk)
+    instance.code = "derive"
+    with pytest.raises(exceptions.ValidationError) as excinfo:
+        instance.save()
+    assert list(excinfo.value.message_dict) == ["rank"]
+    assert CleanedTestModel.objects.get(pk=instance.pk).rank == 1
+
+
+class UniqueTestModel(DjangoBaseModel):
+    __test__ = False
+    code = models.CharField(max_length=10, unique=True)
+    a = models.IntegerField()
+    b = models.IntegerField()
+    c = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        unique_together = [("a", "b")]
+        constraints = [models.UniqueConstraint(fields=["b", "c"], name="unique_b_c")]
+
+
+@pytest.mark.django_db
+def test_base_model_batched_unique_checks():
+    UniqueTestModel.objects.create(code="x", a=1, b=1, c=1)
+
+    # all uniqueness checks are combined into a single query
+    instance = UniqueTestModel(code="x", a=1, b=1, c=1)
+    with CaptureQueriesContext(connection) as ctx:
+        with pytest.raises(exceptions.ValidationError) as excinfo:
+            instance.full_clean()
+    assert len(ctx.captured_queries) == 1
+    assert excinfo.value.message_dict == {
+        "code": ["Unique test model with this Code already exists."],
+        "__all__": [
+            "Unique test model with this A and B already exists.",
+            "Unique test model with this B and C already exists.",
+        ],
+    }
+
+    instance = UniqueTestModel(code="y", a=2, b=1, c=None)
+    with CaptureQueriesContext(connection) as ctx:
+        instance.full_clean()
+    assert len(ctx.captured_queries) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("plans", [True, False])
+def test_base_model_batched_unique_checks_flags(plans):
+    UniqueTestModel.objects.create(code="x", a=1, b=1, c=1)
+    instance = UniqueTestModel(code="y", a=2, b=1, c=1)  # only violates unique_b_c
+
+    with mock.patch("django_seriously.settings.seriously_settings.VALIDATION_PLANS", plans):
+        # the constraint belongs to validate_constraints(), as in Django
+        with pytest.raises(exceptions.ValidationError) as excinfo:
+            instance.full_clean(validate_unique=False)
+        assert excinfo.value.message_dict == {
+            "__all__": ["Unique test model with this B and C already exists."]
+        }
+        instance.full_clean(validate_constraints=False)
+        instance.validate_unique()
+        with pytest.raises(exceptions.ValidationError):
+            instance.validate_constraints()
+
+
+@pytest.mark.django_db
+def test_base_model_validation_plan():
+    # plans of installed models are compiled at startup
+    hits = get_validation_plan.cache_info().hits
+    plan = get_validation_plan(IncrementalTestModel)
+    assert get_validation_plan.cache_info().hits == hits + 1
+    assert [name for name, *_ in plan.fields] == [
+        "id",
+        "created_at",
+        "updated_at",
+        "code",
+        "group",
+        "rank",
+        "note",
+    ]
+    # the unique constraint is only left out while full_clean() runs both checks
+    assert [batched for *_, batched in plan.constraints] == [True, False]
+
+    IncrementalTestModel.objects.create(code="a", group=1, rank=1)
+    instances = [
+        IncrementalTestModel(code="a", group=1, rank=1),
+        IncrementalTestModel(code="b" * 20, group=-1, rank=200, note=""),
+        IncrementalTestModel(code="c", group=2, rank=1),
+    ]
+    for exclude in [None, {"code"}, {"group"}, {"rank", "note"}]:
+        for instance in instances:
+            results = []
+            for enabled in (True, False):
+                with mock.patch(
+                    "django_seriously.settings.seriously_settings.VALIDATION_PLANS", enabled
+                ):
+                    try:
+                        instance.full_clean(exclude=exclude)
+                        results.append(None)
+                    except exceptions.ValidationError as e:
+                        results.append(e.message_dict)
+            # same result as Django's generic validation
+            assert results[0] == results[1]
+
+
+@pytest.mark.django_db
+def test_base_model_bulk_full_clean():
+    existing = UniqueTestModel.objects.create(code="x", a=1, b=1, c=1)
+    existing.code = "z"
+    instances = [
+        UniqueTestModel(code="x", a=2, b=2, c=2),  # conflicts with existing row
+        UniqueTestModel(code="y", a=3, b=3, c=3),
+        UniqueTestModel(code="y", a=4, b=4, c=4),  # duplicate within batch
+        UniqueTestModel(code="w", a=5, b=5, c=None, id=existing.pk),  # duplicate pk
+        UniqueTestModel(code="v", a=6, b=6, c=6),
+        existing,
+    ]
+    instances[4].code = "v" * 11  # field error
+
+    with CaptureQueriesContext(connection) as ctx:
+        errors = UniqueTestModel.bulk_full_clean(instances)
+    # one query per unique check, instead of one per check and instance
+    assert len(ctx.captured_queries) == 4
+    assert {i: list(e.message_dict) for i, e in errors.items()} == {
+        0: ["code"],
+        2: ["code"],
+        3: ["id"],
+        4: ["code"],
+    }
+    assert UniqueTestModel.bulk_full_clean([existing]) == {}
+
+
+class ValidatedBulkTestModel(DjangoBaseModel):
+    code = models.CharField(max_length=10, unique=True)
+    rank = models.IntegerField(validators=[MaxValueValidator(100)])
+    level = models.IntegerField(
+        validators=[MaxValueValidator(100)],
+        **({"db_default": 7} if django.VERSION >= (5, 0) else {"default": 7}),
+    )
+    user = models.ForeignKey(User, null=True, blank=True, on_delete=models.CASCADE)
+
+    objects = ValidatedManager()
+
+
+def get_bulk_objs(count: int, user: User) -> list[ValidatedBulkTestModel]:
+    return [ValidatedBulkTestModel(code=f"c{i}", rank=i, user=user) for i in range(count)]
+
+
+@pytest.mark.django_db
+def test_validated_bulk_create():
+    user = User.objects.create_user("bulk@example.com")
+    ValidatedBulkTestModel.objects.create(code="taken", rank=1)
+
+    objs = get_bulk_objs(6, user)
+    objs[1].rank = 101
+    objs[2].user_id = user.pk + 1
+    objs[3].code = "taken"
+    objs[4].code = objs[5].code
+
+    created, errors = ValidatedBulkTestModel.objects.validated_bulk_create(objs, batch_size=2)
+    assert created == [objs[0], objs[4]]
+    assert {i: list(e.message_dict) for i, e in errors.items()} == {
+        1: ["rank"],
+        2: ["user"],
+        3: ["code"],
+        5: ["code"],
+    }
+    assert ValidatedBulkTestModel.objects.count() == 3
+    # one timestamp for the whole batch
+    assert len({obj.created_at for obj in created} | {obj.updated_at for obj in created}) == 1
+    # database defaults are left to the database
+    assert set(ValidatedBulkTestModel.objects.values_list("level", flat=True)) == {7}
+
+    # queries do not depend on the number of rows
+    def count_queries(count: int) -> int:
+        objs = get_bulk_objs(count, user)
+        for obj in objs:
+            obj.code = f"{count}-{obj.code}"
+        with CaptureQueriesContext(connection) as ctx:
+            ValidatedBulkTestModel.objects.validated_bulk_create(objs)
+        return len(ctx.captured_queries)
+
+    assert count_queries(5) == count_queries(50)
+
+
+@pytest.mark.django_db
+def test_validated_bulk_update():
+    user = User.objects.create_user("bulk@example.com")
+    ValidatedBulkTestModel.objects.bulk_create(get_bulk_objs(5, user))
+    objs = list(ValidatedBulkTestModel.objects.order_by("rank"))
+    before = objs[0].updated_at
+    for obj in objs:
+        obj.rank += 90
+    # invalid, but neither validated nor written
+    objs[0].code = "too long for the field"
+
+    objs[4].rank = 200
+
+    rows, errors = ValidatedBulkTestModel.objects.validated_bulk_update(objs, ["rank"])
+    assert rows == 4
+    assert list(errors) == [4]
+    assert list(errors[4].message_dict) == ["rank"]
+
+    saved = list(ValidatedBulkTestModel.objects.order_by("rank"))
+    assert [obj.rank for obj in saved] == [4, 90, 91, 92, 93]
+    # updated_at is set consistently for the whole batch
+    assert len({obj.updated_at for obj in saved[1:]}) == 1
+    assert saved[1].updated_at > before
+    assert saved[1].code == "c0"
@@ -0,0 +1,116 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SETUP = "\n".join(
+    [
+        "import django, sys",
+        "from django.conf import settings",
+        "settings.configure(INSTALLED_APPS=['django.contrib.auth', 'django.contrib.contenttypes'])",
+        "django.setup()",
+        "sys.stderr.write('--- setup done\\n')",
+    ]
+)
+
+
+def get_imported_modules(code: str) -> set[str]:
+    """modules newly imported by running code after django.setup()"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{SETUP}\n{code}"],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    output = result.stderr.split("--- setup done\n", 1)[1]
+    return {
+        line.split("|")[-1].strip()
+        for line in output.splitlines()
+        if line.startswith("import time:") and line.split("|")[1].strip().isdigit()
+    }
+
+
+def is_integration(module: str) -> bool:
+    return module.split(".")[0] in ("rest_framework", "drf_spectacular")
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "django_seriously",
+        "django_seriously.authtoken",
+        "django_seriously.minimaluser",
+        "django_seriously.pydantic",
+        "django_seriously.pydantic.model_fields",
+        "django_seriously.pydantic.forms",
+        "django_seriously.utils",
+        "django_seriously.utils.models",
+        "django_seriously.utils.admin",
+    ],
+)
+def test_import_time(module):
+    modules = get_imported_modules(f"import {module}")
+    assert module in modules
+    # integrations are only loaded on app ready or on first use
+    assert not [m for m in modules if is_integration(m)]
+
+
+def test_integrations_registered_on_use():
+    modules = get_imported_modules(
+        "\n".join(
+            [
+                "from django.db import models",
+                "from django_seriously.pydantic.model_fields import ValidatedJSONField",
+                "class Foo(models.Model):",
+                "    data = ValidatedJSONField(structure=dict)",
+                "    class Meta:",
+                "        app_label = 'auth'",
+            ]
+        )
+    )
+    assert "django_seriously.pydantic.drf_fields" in modules
+    assert "django_seriously.pydantic.schema" in modules
+
+
+def test_integrations_registered_on_serializer_use():
+    modules = get_imported_modules(
+        "\n".join(
+            [
+                "from django_seriously.pydantic.drf_fields import ValidatedJSONField",
+                "ValidatedJSONField(structure=dict)",
+            ]
+        )
+    )
+    assert "django_seriously.pydantic.schema" in modules
+
+
+@pytest.mark.parametrize(
+    "app,unknown",
+    [("django_seriously", False), ("django_seriously", True), ("django_seriously.authtoken", True)],
+)
+def test_settings_loaded_on_ready(app, unknown):
+    user_settings = {"AUTH_TOKEN_SCOPE": []} if unknown else {}
+    code = "\n".join(
+        [
+            "import django",
+            "from django.conf import settings",
+            "settings.configure(",
+            f"    INSTALLED_APPS=['django.contrib.auth', 'django.contrib.contenttypes', '{app}'],",
+            f"    SERIOUSLY_SETTINGS={user_settings!r},",
+            ")",
+            "django.setup()",
+            "from django_seriously.settings import seriously_settings",
+            "assert 'ADMIN_ACTION_EXECUTOR' in vars(seriously_settings)",
+        ]
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BASE_DIR, capture_output=True, text=True
+    )
+    if unknown:
+        assert "ImproperlyConfigured: Invalid settings: AUTH_TOKEN_SCOPE" in result.stderr
+    else:
+        assert result.returncode == 0, result.stderr
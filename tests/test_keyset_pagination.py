@@ -0,0 +1,194 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.contrib.admin import AdminSite, ModelAdmin
+from django.contrib.auth.models import User
+from django.db import connection, models
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import path
+from rest_framework import generics, serializers
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from django_seriously.utils.admin import (
+    LookaheadPaginationMixin,
+    LookaheadPaginator,
+    LowerBound,
+    estimate_count,
+)
+from django_seriously.utils.models import DjangoBaseModel, KeysetManager
+from django_seriously.utils.pagination import KeysetPagination
+
+
+class KeysetTestModel(DjangoBaseModel):
+    value = models.IntegerField()
+
+    objects = KeysetManager()
+
+
+class KeysetSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = KeysetTestModel
+        fields = ["id", "value"]
+
+
+class SmallKeysetPagination(KeysetPagination):
+    page_size = 10
+
+
+class KeysetListView(generics.ListAPIView):
+    serializer_class = KeysetSerializer
+    queryset = KeysetTestModel.objects.all()
+    pagination_class = SmallKeysetPagination
+
+
+class KeysetModelAdmin(LookaheadPaginationMixin, ModelAdmin):
+    list_per_page = 5
+    lookahead_pages = 2
+
+
+site = AdminSite("keyset")
+site.register(KeysetTestModel, KeysetModelAdmin)
+
+urlpatterns = [path("k/", KeysetListView.as_view()), path("admin/", site.urls)]
+
+
+def create_rows(count: int) -> list:
+    KeysetTestModel.objects.bulk_create([KeysetTestModel(value=i) for i in range(count)])
+    # some rows share created_at, so that id has to break the tie
+    tie = KeysetTestModel.objects.order_by("id").values_list("id", flat=True)[: count // 2]
+    KeysetTestModel.objects.filter(id__in=list(tie)).update(
+        created_at=datetime(2025, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+    )
+    return list(KeysetTestModel.objects.order_by("created_at", "id").values_list("id", flat=True))
+
+
+@pytest.mark.django_db
+def test_iter_batches():
+    expected = create_rows(25)
+
+    with CaptureQueriesContext(connection) as ctx:
+        batches = list(KeysetTestModel.objects.iter_batches(batch_size=10))
+    assert [len(b) for b in batches] == [10, 10, 5]
+    assert [obj.id for batch in batches for obj in batch] == expected
+    assert len(ctx.captured_queries) == 3
+    assert "OFFSET" not in ctx.captured_queries[-1]["sql"]
+
+    batches = list(KeysetTestModel.objects.filter(value__lt=20).iter_batches(10, reverse=True))
+    ids = [obj.id for batch in batches for obj in batch]
+    assert sorted(obj.value for batch in batches for obj in batch) == list(range(20))
+    assert ids == [i for i in reversed(expected) if i in ids]
+
+    after = KeysetTestModel.objects.keyset_key(batches[0][0])
+    remaining = KeysetTestModel.objects.keyset(after=after).values_list("id", flat=True)
+    assert list(remaining) == expected[expected.index(batches[0][0].id) + 1 :]
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+def test_keyset_pagination():
+    expected = [str(i) for i in create_rows(25)]
+    client = APIClient()
+
+    pages, url = [], "/k/"
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        pages.append([item["id"] for item in response.json()["results"]])
+        url = response.json()["next"]
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [i for page in pages for i in page] == expected
+    assert response.json()["previous"]
+
+    # walk back from the last page
+    previous_pages = []
+    url = response.json()["previous"]
+    while url:
+        response = client.get(url)
+        previous_pages.append([item["id"] for item in response.json()["results"]])
+        url = response.json()["previous"]
+    assert previous_pages == [pages[1], pages[0]]
+    assert response.json()["next"]
+
+    assert client.get("/k/?cursor=invalid").status_code == 404
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_fields():
+    expected = create_rows(5)
+    KeysetTestModel.objects.update(value=-models.F("value"))
+    queryset = KeysetTestModel.objects.all()
+    request = Request(APIRequestFactory().get("/k/"))
+
+    # the keyset fields of the queryset apply by default
+    paginator = SmallKeysetPagination()
+    page = paginator.paginate_queryset(queryset, request)
+    assert paginator.fields == ("created_at", "id")
+    assert [obj.id for obj in page] == expected
+
+    # fields set on the paginator take precedence over the queryset's
+    class ValueKeysetPagination(SmallKeysetPagination):
+        keyset_fields = ("value", "id")
+
+    paginator = ValueKeysetPagination()
+    page = paginator.paginate_queryset(queryset, request)
+    assert paginator.fields == ("value", "id")
+    assert [obj.value for obj in page] == [-4, -3, -2, -1, 0]
+
+
+@pytest.mark.django_db
+def test_lookahead_paginator():
+    create_rows(25)
+    queryset = KeysetTestModel.objects.order_by("id")
+
+    assert LookaheadPaginator(queryset, 10, lookahead=100).count == 25
+    paginator = LookaheadPaginator(queryset, 10, lookahead=20)
+    with CaptureQueriesContext(connection) as ctx:
+        assert paginator.count == 20
+        assert paginator.num_pages == 2
+    assert "LIMIT 20" in ctx.captured_queries[0]["sql"]
+    assert isinstance(paginator.count, LowerBound) and str(paginator.count) == "20+"
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+def test_lookahead_pagination_admin():
+    create_rows(25)
+    client = Client()
+    client.force_login(User.objects.create_superuser("admin", "admin@example.com", "pw"))
+
+    response = client.get("/admin/tests/keysettestmodel/")
+    assert response.context["cl"].result_count == 15
+    assert "15+ keyset test models" in response.content.decode()
+    # the lookahead moves along, up to the last page
+    response = client.get("/admin/tests/keysettestmodel/?p=4")
+    assert response.context["cl"].result_count == 25
+    assert "25 keyset test models" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_lookahead_paginator_estimate():
+    create_rows(25)
+    queryset = KeysetTestModel.objects.order_by("id")
+    assert estimate_count(queryset) is None
+    assert LookaheadPaginator(queryset, 5, lookahead=10, threshold=10).count == LowerBound(10)
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    create_rows(5)
+    assert estimate_count(queryset) == 25
+    # planner estimates of filtered querysets are not used
+    assert estimate_count(queryset.filter(value__lt=10)) is None
+
+    # the estimate of the unfiltered table is used above the threshold, without counting
+    paginator = LookaheadPaginator(queryset, 5, lookahead=10, threshold=20)
+    with CaptureQueriesContext(connection) as ctx:
+        assert paginator.count == 25 and not isinstance(paginator.count, LowerBound)
+        assert paginator.num_pages == 5
+    assert "LIMIT 10" in ctx.captured_queries[0]["sql"]
+    # a lookahead beyond a stale estimate keeps the remaining rows reachable
+    assert LookaheadPaginator(queryset, 5, lookahead=30, threshold=20).count == 30
+    assert LookaheadPaginator(queryset, 5, lookahead=10, threshold=100).count == LowerBound(10)
+    filtered = LookaheadPaginator(queryset.filter(value__lt=10), 5, lookahead=10, threshold=1)
+    assert isinstance(filtered.count, LowerBound)
@@ -0,0 +1,122 @@
+import contextlib
+import json
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django import forms
+from django.core.management import call_command
+from django.test import override_settings
+from pydantic import BaseModel as PydanticBaseModel
+from rest_framework import exceptions
+
+from django_seriously.authtoken.authentication import TokenAuthentication
+from django_seriously.management.commands import seriously_metrics
+from django_seriously.pydantic.model_fields import PydanticJSONField
+from django_seriously.utils.metrics import InMemorySink, get_sink, instrument, use_sink
+from django_seriously.utils.models import DjangoBaseModel
+
+
+class Payload(PydanticBaseModel):
+    value: int
+
+
+class MetricsTestModel(DjangoBaseModel):
+    payload = PydanticJSONField(structure=Payload)
+
+
+def test_metrics_disabled():
+    assert get_sink() is None
+    with override_settings(SERIOUSLY_SETTINGS={"METRICS_SINK": InMemorySink}):
+        assert isinstance(get_sink(), InMemorySink)
+    assert get_sink() is None
+
+
+@pytest.mark.django_db
+def test_metrics_hot_paths():
+    with use_sink(InMemorySink()) as sink:
+        instance = MetricsTestModel(payload=Payload(value=1))
+        instance.save()
+        # loaded instances validate incrementally
+        instance.save()
+        instance.full_clean()
+        MetricsTestModel.bulk_full_clean([MetricsTestModel(payload=Payload(value=2))])
+        with pytest.raises(exceptions.AuthenticationFailed):
+            TokenAuthentication().authenticate_credentials("invalid")
+    summary = sink.summary()
+
+    assert summary["counters"] == {"authtoken.authenticate.errors": 1}
+    assert summary["histograms"]["model.full_clean.duration"]["count"] == 3
+    assert summary["histograms"]["model.bulk_full_clean.duration"]["count"] == 1
+    assert summary["histograms"]["authtoken.authenticate.duration"]["count"] == 1
+    assert "pydantic.loads.duration" in summary["histograms"]
+    assert "pydantic.dump_json.duration" in summary["histograms"]
+
+
+@pytest.mark.django_db
+def test_metrics_model_form():
+    class MetricsTestForm(forms.ModelForm):
+        class Meta:
+            model = MetricsTestModel
+            fields = ["payload"]
+
+    with use_sink(InMemorySink()) as sink:
+        form = MetricsTestForm(data={"payload": '{"value": 1}'})
+        assert form.is_valid()
+        form = MetricsTestForm(data={"payload": '{"value": "x"}'})
+        assert not form.is_valid()
+    summary = sink.summary()
+
+    # forms validate their instance with full_clean()
+    assert summary["histograms"]["model.full_clean.duration"]["count"] == 2
+
+
+def test_metrics_profile_hook():
+    profiled = []
+
+    class ProfilingSink(InMemorySink):
+        sample_rate = 1.0
+
+        @contextlib.contextmanager
+        def profile(self, name):
+            profiled.append(name)
+            yield
+
+    @instrument("test.call")
+    def call(x):
+        return x * 2
+
+    with use_sink(ProfilingSink()) as sink:
+        assert call(2) == 4
+    assert profiled == ["test.call"]
+    histogram = sink.summary()["histograms"]["test.call.duration"]
+    assert histogram["count"] == 1 and histogram["min"] == histogram["p95"]
+
+
+@pytest.mark.django_db
+def test_metrics_command():
+    calls = []
+
+    def run(command, *args):
+        calls.append((command, args))
+        MetricsTestModel.bulk_full_clean([MetricsTestModel(payload=Payload(value=1))])
+
+    with mock.patch.object(seriously_metrics, "call_command", side_effect=run):
+        out = StringIO()
+        call_command("seriously_metrics", "import_stuff", "a.csv", stdout=out)
+        assert "model.bulk_full_clean.duration" in out.getvalue()
+
+        out = StringIO()
+        call_command("seriously_metrics", "--json", "import_stuff", "a.csv", stdout=out)
+        summary = json.loads(out.getvalue())
+        assert summary["histograms"]["model.bulk_full_clean.duration"]["count"] == 1
+
+        # options after the command belong to the command
+        out = StringIO()
+        call_command("seriously_metrics", "import_stuff", "a.csv", "--json", stdout=out)
+        assert "model.bulk_full_clean.duration" in out.getvalue()
+    assert calls == [
+        ("import_stuff", ("a.csv",)),
+        ("import_stuff", ("a.csv",)),
+        ("import_stuff", ("a.csv", "--json")),
+    ]
@@ -0,0 +1,258 @@
+import functools
+import io
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+import pytest
+from django.contrib.admin import AdminSite
+from django.contrib.auth.hashers import check_password, make_password
+from django.contrib.auth.models import Group, Permission, User
+from django.core.management import call_command
+from django.db import connection, models
+from django.db.models.functions import Lower
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext, isolate_apps
+
+from django_seriously.minimaluser import models as minimaluser_models
+from django_seriously.minimaluser.admin import MinimalUserAdmin
+from django_seriously.minimaluser.backends import CachedPermissionsBackend
+from django_seriously.minimaluser.management.commands import bulk_create_users
+from django_seriously.minimaluser.models import MinimalAbstractUser, UserManager
+from django_seriously.utils.models import DjangoBaseModel
+
+
+class EmailUser(MinimalAbstractUser):
+    # avoid reverse accessor clashes with auth.User
+    groups = models.ManyToManyField(Group, blank=True, related_name="+")
+    user_permissions = models.ManyToManyField(Permission, blank=True, related_name="+")
+
+
+def test_email_index():
+    index = EmailUser._meta.indexes[0]
+    assert index.name == "tests_emailuser_email_ci"
+    assert index.expressions == (Lower("email"),)
+    assert not EmailUser._check_email_index()
+
+
+@isolate_apps("tests")
+def test_email_index_check():
+    class IndexlessUser(DjangoBaseModel, MinimalAbstractUser):
+        groups = models.ManyToManyField(Group, blank=True, related_name="+")
+        user_permissions = models.ManyToManyField(Permission, blank=True, related_name="+")
+
+    class IndexedUser(DjangoBaseModel, MinimalAbstractUser):
+        groups = models.ManyToManyField(Group, blank=True, related_name="+")
+        user_permissions = models.ManyToManyField(Permission, blank=True, related_name="+")
+
+        class Meta(MinimalAbstractUser.Meta):
+            pass
+
+    class ExtraordinarilyLongNamedUser(MinimalAbstractUser):
+        groups = models.ManyToManyField(Group, blank=True, related_name="+")
+        user_permissions = models.ManyToManyField(Permission, blank=True, related_name="+")
+
+    # Meta is inherited from DjangoBaseModel here
+    assert [e.id for e in IndexlessUser._check_email_index()] == ["minimaluser.W001"]
+    assert not IndexedUser._check_email_index()
+    # each subclass gets its own index name within the length limit
+    assert IndexedUser._meta.indexes[0].name == "tests_indexeduser_email_ci"
+    index = ExtraordinarilyLongNamedUser._meta.indexes[0]
+    assert index.name == "tests_extraordina_email_ci"
+    assert not ExtraordinarilyLongNamedUser._check_indexes(databases=["default"])
+
+
+@pytest.mark.django_db
+def test_filter_by_email():
+    user = EmailUser.objects.create_user("Jane@Example.com")
+    assert user.email == "jane@example.com"
+    # legacy rows may still contain uppercase
+    EmailUser.objects.filter(pk=user.pk).update(email="Jane@example.com")
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert EmailUser.objects.get_by_natural_key("JANE@example.COM") == user
+    assert "LOWER" in ctx.captured_queries[-1]["sql"].upper()
+    assert not EmailUser.objects.filter_by_email("jane@example.org").exists()
+
+
+@pytest.mark.django_db
+def test_get_by_natural_key_case_variants():
+    user = EmailUser.objects.create_user("jane@example.com")
+    legacy = EmailUser.objects.create_user("other@example.com")
+    EmailUser.objects.filter(pk=legacy.pk).update(email="Jane@example.com")
+
+    assert EmailUser.objects.get_by_natural_key("jane@example.com") == user
+    assert EmailUser.objects.get_by_natural_key("Jane@example.com") == legacy
+    # ambiguous rows are not guessed
+    with pytest.raises(EmailUser.DoesNotExist):
+        EmailUser.objects.get_by_natural_key("JANE@example.com")
+    with pytest.raises(EmailUser.DoesNotExist):
+        EmailUser.objects.get_by_natural_key("nobody@example.com")
+
+
+@pytest.mark.django_db
+def test_admin_prefix_search():
+    for email in ("anna@example.com", "anne@example.com", "bob@anna.com"):
+        EmailUser.objects.create_user(email)
+    user_admin = MinimalUserAdmin(EmailUser, AdminSite())
+    request = RequestFactory().get("/")
+
+    def search(term):
+        queryset, _ = user_admin.get_search_results(request, EmailUser.objects.all(), term)
+        return sorted(queryset.values_list("email", flat=True))
+
+    assert search("anna") == ["anna@example.com", "bob@anna.com"]
+    user_admin.prefix_search = True
+    assert search("ANN") == ["anna@example.com", "anne@example.com"]
+    assert search("anna") == ["anna@example.com"]
+    # legacy rows may still contain uppercase
+    EmailUser.objects.filter(email="anne@example.com").update(email="Anne@example.com")
+    assert search("anne") == ["Anne@example.com"]
+    assert len(search("")) == 3
+
+
+@pytest.mark.django_db
+def test_bulk_create_users():
+    legacy = EmailUser.objects.create_user("existing@example.com")
+    EmailUser.objects.filter(pk=legacy.pk).update(email="Existing@Example.com")
+    legacy_hash = make_password("legacy")
+    rows = [
+        {"email": "Existing@example.com", "password": "ignored"},
+        {"email": "a@Example.com", "password": "secret-a"},
+        {"email": "b@example.com", "password": "secret-b", "is_staff": True},
+        {"email": "A@example.com", "password": "duplicate"},
+        {"email": "c@example.com", "password_hash": legacy_hash},
+        {"email": "d@example.com"},
+        {"email": ""},
+    ]
+    assert EmailUser.objects.bulk_create_users(rows, batch_size=4, processes=2) == 4
+
+    users = {u.email: u for u in EmailUser.objects.all()}
+    assert sorted(users) == [
+        "Existing@Example.com",
+        "a@example.com",
+        "b@example.com",
+        "c@example.com",
+        "d@example.com",
+    ]
+    assert users["a@example.com"].check_password("secret-a")
+    assert users["b@example.com"].check_password("secret-b") and users["b@example.com"].is_staff
+    assert users["c@example.com"].password == legacy_hash
+    assert not users["d@example.com"].has_usable_password()
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+@pytest.mark.django_db
+def test_bulk_create_users_spawned_workers():
+    # spawned workers import the worker module without Django being set up
+    spawn_pool = functools.partial(
+        ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+    )
+    rows = [{"email": f"s{i}@example.com", "password": f"pw{i}"} for i in range(4)]
+    with mock.patch.object(minimaluser_models, "ProcessPoolExecutor", spawn_pool):
+        assert EmailUser.objects.bulk_create_users(rows, processes=2) == 4
+    assert check_password("pw3", EmailUser.objects.get(email="s3@example.com").password)
+
+
+@pytest.mark.django_db
+def test_bulk_create_users_counts_inserted_rows():
+    prepare = UserManager._prepare_bulk_users
+
+    def prepare_concurrently(manager, batch, pool, processes):
+        users = prepare(manager, batch, pool, processes)
+        # another process creates one of the users before the batch is inserted
+        EmailUser.objects.create_user("b@example.com")
+        return users
+
+    rows = [{"email": "a@example.com"}, {"email": "b@example.com"}]
+    with mock.patch.object(UserManager, "_prepare_bulk_users", prepare_concurrently):
+        assert EmailUser.objects.bulk_create_users(rows, processes=1) == 1
+    assert EmailUser.objects.count() == 2
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+@pytest.mark.django_db
+def test_bulk_create_users_command(tmp_path):
+    path = tmp_path / "users.jsonl"
+    path.write_text(
+        "\n".join(json.dumps({"email": f"u{i}@example.com", "password": "pw"}) for i in range(5))
+        + '\n{"email": "u9@example.com", "is_staff": "maybe"}\n[]\n'
+    )
+    csv_path = tmp_path / "users.csv"
+    csv_path.write_text(
+        "email,password,is_staff,nickname\n"
+        "staff@example.com,,TRUE,\n"
+        "user@example.com,pw,false,\n"
+        "not-an-email,pw,,\n"
+        ",pw,,\n"
+        "nick@example.com,,,nick\n"
+    )
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with mock.patch.object(bulk_create_users, "get_user_model", return_value=EmailUser):
+        call_command(bulk_create_users.Command(), str(path), processes=1, stderr=stderr)
+        call_command(
+            bulk_create_users.Command(),
+            str(csv_path),
+            "--batch-size=1",
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+    assert EmailUser.objects.filter(email__startswith="u").count() == 6
+    assert check_password("pw", EmailUser.objects.get(email="u3@example.com").password)
+    staff = EmailUser.objects.get(email="staff@example.com")
+    assert staff.is_staff and not staff.has_usable_password()
+    assert not EmailUser.objects.get(email="user@example.com").is_staff
+    assert stdout.getvalue() == "Created 2 users\n"
+    assert stderr.getvalue().splitlines() == [
+        "Line 6: is_staff: “maybe” value must be either True or False.",
+        "Line 7: Expected an object of user fields",
+        "Skipped 2 invalid rows",
+        "Line 4: email: Enter a valid email address.",
+        "Line 5: email: This field is required.",
+        "Line 6: nickname: Unknown user field.",
+        "Skipped 3 invalid rows",
+    ]
+
+
+@override_settings(
+    AUTHENTICATION_BACKENDS=["django_seriously.minimaluser.backends.CachedPermissionsBackend"]
+)
+@pytest.mark.django_db
+def test_cached_permissions_backend():
+    add_group, change_group = Permission.objects.filter(codename__in=["add_group", "change_group"])
+    group = Group.objects.create(name="editors")
+    group.permissions.add(add_group)
+    user = User.objects.create_user("perms")
+    user.groups.add(group)
+    CachedPermissionsBackend.reset_cache_stats()
+
+    def has_perm(perm):
+        return User.objects.get(pk=user.pk).has_perm(perm)
+
+    assert has_perm("auth.add_group")
+    fresh_user = User.objects.get(pk=user.pk)
+    with CaptureQueriesContext(connection) as ctx:
+        assert fresh_user.has_perm("auth.add_group")
+        assert fresh_user.get_group_permissions() == {"auth.add_group"}
+    assert not ctx.captured_queries
+    stats = CachedPermissionsBackend.get_cache_stats()
+    assert stats == {"hits": 2, "misses": 3, "hit_rate": 0.4}
+
+    # user relations
+    user.user_permissions.add(change_group)
+    assert has_perm("auth.change_group")
+    change_group.user_set.remove(user)
+    assert not has_perm("auth.change_group")
+    # group relations
+    group.permissions.remove(add_group)
+    assert not has_perm("auth.add_group")
+    group.permissions.add(add_group)
+    assert has_perm("auth.add_group")
+    group.user_set.clear()
+    assert not has_perm("auth.add_group")
+    user.groups.add(group)
+    group.delete()
+    assert not has_perm("auth.add_group")
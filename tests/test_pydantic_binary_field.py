@@ -0,0 +1,110 @@
+import zlib
+from datetime import datetime
+
+import pytest
+from django.core import exceptions
+from django.db import connection
+from pydantic import BaseModel as PydanticBaseModel
+from rest_framework import serializers
+
+from django_seriously.pydantic.drf_fields import ValidatedJSONField as ValidatedJSONDRFField
+from django_seriously.pydantic.model_fields import (
+    PydanticBinaryField,
+    ValidatedBinaryField,
+    ValidatedJSONField,
+)
+from django_seriously.utils.models import DjangoBaseModel
+
+
+class X(PydanticBaseModel):
+    a: int
+    b: str
+    c: datetime
+
+
+class BinaryFieldTestModel(DjangoBaseModel):
+    validated = ValidatedBinaryField(structure=X)
+    pyd = PydanticBinaryField(structure=X)
+    pyd_list = PydanticBinaryField(structure=list[X], compression="none", null=True, blank=True)
+
+
+class BinaryFieldTestSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BinaryFieldTestModel
+        fields = ("pyd", "pyd_list")
+
+
+def get_x_instance():
+    return {
+        "a": 1,
+        "b": "foo" * 100,
+        "c": datetime.fromisoformat("2025-03-02T20:08:25.000Z"),
+    }
+
+
+@pytest.mark.django_db
+def test_binary_field_roundtrip():
+    BinaryFieldTestModel.objects.create(
+        validated=get_x_instance(),
+        pyd=get_x_instance(),
+        pyd_list=[get_x_instance()],
+    )
+    instance = BinaryFieldTestModel.objects.get()
+    assert isinstance(instance.validated, dict)
+    assert instance.validated["a"] == 1
+    assert isinstance(instance.pyd, X)
+    assert instance.pyd.c == get_x_instance()["c"]
+    assert isinstance(instance.pyd_list[0], X)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT pyd FROM {BinaryFieldTestModel._meta.db_table}")
+        stored = cursor.fetchone()[0]
+    # document is stored compressed
+    assert len(stored) < len(instance.pyd.model_dump_json())
+    assert X.model_validate_json(zlib.decompress(stored)) == instance.pyd
+
+
+def test_binary_field_decode_memoryview():
+    field = BinaryFieldTestModel._meta.get_field("pyd")
+    data = field.get_prep_value(X(**get_x_instance()))
+    assert field.from_db_value(memoryview(data), None, connection) == X(**get_x_instance())
+
+    field = BinaryFieldTestModel._meta.get_field("pyd_list")
+    data = field.get_prep_value([X(**get_x_instance())])
+    assert field.from_db_value(memoryview(data), None, connection) == [X(**get_x_instance())]
+
+
+def test_binary_field_fingerprint():
+    field = BinaryFieldTestModel._meta.get_field("validated")
+    json_field = ValidatedJSONField(structure=X)
+    # the binary field fingerprints decoded content the same way as the JSON field
+    assert field.fingerprint(get_x_instance()) == json_field.fingerprint(get_x_instance())
+    assert field.fingerprint({**get_x_instance(), "a": 2}) != field.fingerprint(get_x_instance())
+    assert field.fingerprint(None) == b""
+
+
+@pytest.mark.django_db
+def test_binary_field_validation():
+    with pytest.raises(exceptions.ValidationError):
+        BinaryFieldTestModel.objects.create(validated={"a": "NaN"}, pyd=get_x_instance())
+    with pytest.raises(exceptions.ValidationError):
+        BinaryFieldTestModel.objects.create(validated=get_x_instance(), pyd={"a": "NaN"})
+
+
+def test_binary_field_unknown_compression():
+    with pytest.raises(exceptions.ImproperlyConfigured):
+        PydanticBinaryField(structure=X, compression="foo")
+
+
+@pytest.mark.django_db
+def test_binary_field_drf_serializer():
+    serializer = BinaryFieldTestSerializer()
+    assert isinstance(serializer.fields["pyd"], ValidatedJSONDRFField)
+    assert not serializer.fields["pyd"].read_only
+
+    serializer = BinaryFieldTestSerializer(data={"pyd": get_x_instance(), "pyd_list": None})
+    assert serializer.is_valid(), serializer.errors
+    instance = serializer.save(validated=get_x_instance())
+    instance.refresh_from_db()
+    assert instance.pyd == X(**get_x_instance())
+    assert BinaryFieldTestSerializer(instance).data["pyd"]["a"] == 1
@@ -1,13 +1,18 @@
 from datetime import datetime
 from typing import Any
+from unittest import mock
 
 import pydantic
 import pytest
+from django import forms
 from django.core import exceptions
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from pydantic import BaseModel as PydanticBaseModel
-from pydantic import ConfigDict
+from pydantic import ConfigDict, TypeAdapter
 
+from django_seriously.pydantic.forms import PydanticJSONFormField
 from django_seriously.pydantic.model_fields import PydanticJSONField
 from django_seriously.utils.models import DjangoBaseModel
 
@@ -128,3 +133,93 @@ def test_pydantic_assumptions():
     with pytest.raises(pydantic.ValidationError):
         xs = XStrict(**get_x_instance())
         xs.d = ["1,2"]  # type: ignore
+
+
+class PydanticTrackedTestModel(DjangoBaseModel):
+    document = PydanticJSONField(structure=X, track_changes=True)
+    counter = models.IntegerField(default=0)
+
+
+@pytest.mark.django_db
+def test_pydantic_field_track_changes():
+    PydanticTrackedTestModel.objects.create(document=get_x_instance())
+    instance = PydanticTrackedTestModel.objects.get()
+    assert instance.get_update_fields() is not None
+    assert "document" not in instance.get_update_fields()
+
+    # unchanged document is left out of the UPDATE
+    instance.counter = 1
+    with CaptureQueriesContext(connection) as ctx:
+        instance.save()
+    assert '"document"' not in ctx.captured_queries[-1]["sql"]
+
+    # modified document is written
+    instance.document.a = 2
+    assert instance.get_update_fields() is None
+    with CaptureQueriesContext(connection) as ctx:
+        instance.save()
+    assert '"document"' in ctx.captured_queries[-1]["sql"]
+
+    # and is considered unchanged again after saving
+    instance.counter = 2
+    with CaptureQueriesContext(connection) as ctx:
+        instance.save()
+    assert '"document"' not in ctx.captured_queries[-1]["sql"]
+
+    instance.refresh_from_db()
+    assert instance.document.a == 2
+    assert instance.counter == 2
+
+
+def test_pydantic_form_field_memoization():
+    class XForm(forms.Form):
+        field = PydanticJSONFormField(structure=TypeAdapter(X))
+
+    initial = {"field": X(**get_x_instance())}
+    data = {"field": X(**get_x_instance()).model_dump_json(indent=4)}
+    form = XForm(data=data, initial=initial)
+    structure = form.fields["field"].structure
+
+    with (
+        mock.patch.object(structure, "validate_json", wraps=structure.validate_json) as validate,
+        mock.patch.object(structure, "dump_json", wraps=structure.dump_json) as dump_json,
+    ):
+        assert form.is_valid()
+        assert form.changed_data == []
+        str(form)
+    # input is parsed once, initial and parsed value are dumped once per indentation
+    assert validate.call_count == 1
+    assert dump_json.call_count == 3
+
+    # invalid input is reported consistently from the memo
+    form = XForm(data={"field": '{"a": "x"}'}, initial=initial)
+    assert not form.is_valid()
+    assert not form.is_valid()
+    assert "field" in form.errors
+    assert "{&quot;a&quot;: &quot;x&quot;}" in str(form["field"])
+    # each form instance starts with an empty memo
+    assert form.fields["field"]._parsed is not XForm.base_fields["field"]._parsed
+
+
+def test_pydantic_form_field_memoization_mutation():
+    class XForm(forms.Form):
+        field = PydanticJSONFormField(structure=TypeAdapter(X))
+
+    initial = X(**get_x_instance())
+    form = XForm(data={"field": initial.model_dump_json()}, initial={"field": initial})
+    assert form.is_valid()
+    assert form.changed_data == []
+    assert "&quot;a&quot;: 1" in str(form["field"])
+
+    # changes to the cleaned value don't alter the parsed input
+    form.cleaned_data["field"].a = 2
+    assert "&quot;a&quot;: 1" in str(form["field"])
+    assert form.fields["field"].bound_data(form.data["field"], None).a == 1
+
+    # changes to the initial value are picked up
+    initial.a = 3
+    assert form.fields["field"].has_changed(initial, form.data["field"])
+    form = XForm(initial={"field": initial})
+    assert "&quot;a&quot;: 3" in str(form["field"])
+    initial.a = 4
+    assert "&quot;a&quot;: 4" in str(form["field"])
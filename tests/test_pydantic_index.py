@@ -0,0 +1,121 @@
+from datetime import datetime
+from typing import Annotated, Optional
+from unittest import mock
+
+import pytest
+from django.db import connection, models
+from django.db.migrations.state import ModelState
+from django.db.migrations.writer import MigrationWriter
+from django.db.models.expressions import Col
+from django.test.utils import isolate_apps
+from pydantic import BaseModel
+
+from django_seriously.pydantic import indexes as pydantic_indexes
+from django_seriously.pydantic.indexes import Indexed, StructureIndex, StructureKeyTransform
+from django_seriously.pydantic.model_fields import PydanticJSONField, ValidatedJSONField
+from django_seriously.utils.models import DjangoBaseModel
+
+
+class Structure(BaseModel):
+    number: Annotated[int, Indexed()]
+    flag: Annotated[Optional[bool], Indexed] = None
+    created: Annotated[datetime, Indexed()]
+    tags: Annotated[list[str], Indexed()] = []
+    text: str
+
+
+class IndexedModel(DjangoBaseModel):
+    val = ValidatedJSONField(structure=Structure)
+    pyd = PydanticJSONField(structure=Structure)
+
+
+def get_structure(number: int):
+    return {
+        "number": number,
+        "flag": number % 2 == 0,
+        "created": datetime.fromisoformat(f"2025-03-{number:02d}T20:08:25.000Z"),
+        "tags": ["a"],
+        "text": "foo",
+    }
+
+
+def test_structure_indexes():
+    indexes = [index for index in IndexedModel._meta.indexes if isinstance(index, StructureIndex)]
+    assert {(index.field_name, index.key_name) for index in indexes} == {
+        (field, key) for field in ("val", "pyd") for key in ("number", "flag", "created", "tags")
+    }
+    assert all(len(index.name) <= StructureIndex.max_name_length for index in indexes)
+
+    # indexes are picked up by the migration autodetector and can be serialized
+    state = ModelState.from_model(IndexedModel)
+    assert len(state.options["indexes"]) == 8
+    rendered, imports = MigrationWriter.serialize(indexes[0])
+    assert rendered.startswith("django_seriously.pydantic.indexes.StructureIndex(")
+    assert indexes[0].clone() == indexes[0]
+
+
+@pytest.mark.django_db
+def test_structure_typed_lookups():
+    for i in range(1, 6):
+        IndexedModel.objects.create(val=get_structure(i), pyd=get_structure(i))
+
+    for field in ("val", "pyd"):
+        qs = IndexedModel.objects.all()
+        assert qs.filter(**{f"{field}__number": 3}).count() == 1
+        # query values are coerced with the structure's type
+        assert qs.filter(**{f"{field}__number": "3"}).count() == 1
+        assert qs.filter(**{f"{field}__number__gte": "3"}).count() == 3
+        assert qs.filter(**{f"{field}__number__in": ["1", 2]}).count() == 2
+        assert qs.filter(**{f"{field}__flag": "true"}).count() == 2
+        assert qs.filter(**{f"{field}__created": get_structure(2)["created"]}).count() == 1
+        assert qs.filter(**{f"{field}__created__startswith": "2025-03-0"}).count() == 5
+
+    # non-indexed keys keep the regular JSONField behavior
+    assert IndexedModel.objects.filter(val__text="foo").count() == 5
+    assert IndexedModel.objects.filter(val__tags__0="a").count() == 5
+
+
+@pytest.mark.django_db
+def test_structure_index_usage():
+    sql, params = IndexedModel.objects.filter(val__number=3).query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        plan = " ".join(str(row) for row in cursor.fetchall())
+
+    index = next(i for i in IndexedModel._meta.indexes if i.key_name == "number")
+    assert index.name in plan
+
+
+def test_structure_key_sql_per_vendor():
+    compiler = mock.Mock(compile=lambda expression: ('"t"."val"', []))
+
+    def compile(key, vendor):
+        transform = StructureKeyTransform(key, Col("t", IndexedModel._meta.get_field("val")))
+        as_vendor = getattr(transform, f"as_{vendor}", transform.as_sql)
+        return as_vendor(compiler, mock.Mock(vendor=vendor))[0]
+
+    assert compile("number", "sqlite") == """JSON_EXTRACT("t"."val", '$."number"')"""
+    assert compile("number", "postgresql") == """("t"."val" ->> 'number')::bigint"""
+    assert compile("tags", "postgresql") == """("t"."val" -> 'tags')"""
+    assert compile("created", "oracle") == """JSON_VALUE("t"."val", '$."created"')"""
+    assert compile("tags", "oracle") == """JSON_QUERY("t"."val", '$."tags"')"""
+    # lookups keep working on MySQL, but the expression cannot be indexed there
+    assert compile("number", "mysql") == """JSON_EXTRACT("t"."val", '$."number"')"""
+
+
+@pytest.mark.parametrize("vendor", ["mysql", "sqlite"])
+@isolate_apps("tests")
+def test_structure_index_vendors(vendor):
+    databases = {"default": mock.Mock(vendor=vendor)}
+    with mock.patch.object(pydantic_indexes, "connections", databases):
+
+        class VendorModel(models.Model):
+            val = ValidatedJSONField(structure=Structure)
+
+        field = VendorModel._meta.get_field("val")
+        if vendor == "mysql":
+            assert not VendorModel._meta.indexes
+            assert [e.id for e in field._check_indexed_keys()] == ["django_seriously.W001"]
+        else:
+            assert len(VendorModel._meta.indexes) == 4
+            assert not field._check_indexed_keys()
@@ -2,12 +2,20 @@ from datetime import datetime
 
 import pytest
 from django.db import models
+from django.urls import path
 from drf_spectacular.generators import SchemaGenerator
 from pydantic import BaseModel
 from rest_framework import serializers, viewsets
 from rest_framework.routers import SimpleRouter
+from rest_framework.test import APIClient
 
 from django_seriously.pydantic.model_fields import PydanticJSONField, ValidatedJSONField
+from django_seriously.pydantic.schema import (
+    CachedSpectacularAPIView,
+    _structure_cache,
+    _view_cache,
+    clear_schema_cache,
+)
 
 
 class Foo(BaseModel):
@@ -40,15 +48,43 @@ class XModelViewset(viewsets.ReadOnlyModelViewSet):
 
 router = SimpleRouter()
 router.register("test", XModelViewset)
-urlpatterns = router.urls
+urlpatterns = router.urls + [
+    path("schema/", CachedSpectacularAPIView.as_view(serve_public=True)),
+]
 
 
 @pytest.mark.urls(__name__)
 @pytest.mark.django_db
 def test_schema(no_warnings):
+    clear_schema_cache()
     generator = SchemaGenerator()
     schema = generator.get_schema(request=None, public=True)
+    assert_components(schema)
+    assert {structure for structure, _ in _structure_cache} == {Foo, list[Foo]}
 
+    # second generation is served from the cache and yields the identical schema
+    warm_schema = SchemaGenerator().get_schema(request=None, public=True)
+    assert_components(warm_schema)
+    assert warm_schema == schema
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+def test_cached_schema_view(no_warnings):
+    clear_schema_cache()
+    client = APIClient()
+    response = client.get("/schema/", HTTP_ACCEPT="application/vnd.oai.openapi+json")
+    assert response.status_code == 200
+    assert len(_view_cache) == 1
+    schema = next(iter(_view_cache.values()))
+
+    response = client.get("/schema/", HTTP_ACCEPT="application/vnd.oai.openapi+json")
+    assert response.status_code == 200
+    assert next(iter(_view_cache.values())) is schema
+    assert_components(response.json())
+
+
+def assert_components(schema):
     assert schema["components"]["schemas"] == {
         "Foo": {
             "description": "Some pydantic model",
@@ -0,0 +1,124 @@
+import pytest
+from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.auth.models import User
+from django.db import connection, models
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import path
+
+from django_seriously.utils.admin import (
+    RelatedLink,
+    RelatedLinkAdminMixin,
+    RelatedLinkChangeList,
+    admin_navigation_link,
+)
+from django_seriously.utils.models import DjangoBaseModel
+
+
+class LinkTestAuthor(DjangoBaseModel):
+    name = models.CharField(max_length=20)
+
+
+class LinkTestArticle(DjangoBaseModel):
+    author = models.ForeignKey(LinkTestAuthor, on_delete=models.CASCADE)
+    published = models.BooleanField(default=False)
+
+
+class LinkTestComment(DjangoBaseModel):
+    article = models.ForeignKey(LinkTestArticle, on_delete=models.CASCADE)
+    text = models.CharField(max_length=20)
+
+
+class OrderedChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        return super().get_queryset(request, exclude_parameters).order_by("-text")
+
+
+class OrderedChangeListMixin:
+    def get_changelist(self, request, **kwargs):
+        return OrderedChangeList
+
+
+site = admin.AdminSite(name="linktest")
+
+
+@admin.register(LinkTestArticle, site=site)
+class LinkTestArticleAdmin(RelatedLinkAdminMixin, admin.ModelAdmin):
+    list_display = ("published", "author_link")
+    author_link = RelatedLink("author", label="name")
+
+
+@admin.register(LinkTestComment, site=site)
+class LinkTestCommentAdmin(RelatedLinkAdminMixin, OrderedChangeListMixin, admin.ModelAdmin):
+    list_display = ("text", "article_link", "author_link")
+    article_link = RelatedLink("article", description="Article")
+    author_link = RelatedLink("article__author", label="name")
+
+
+site.register(LinkTestAuthor)
+site.register(User)
+
+urlpatterns = [
+    path("admin/", site.urls),
+]
+
+
+def create_objects(count: int) -> None:
+    for i in range(count):
+        author = LinkTestAuthor.objects.create(name=f"author{i}")
+        article = LinkTestArticle.objects.create(author=author, published=i % 2 == 0)
+        LinkTestComment.objects.create(article=article, text=f"comment{i:02}")
+
+
+def test_related_link_changelist_class():
+    request = RequestFactory().get("/")
+    article_admin = site._registry[LinkTestArticle]
+    assert article_admin.get_changelist(request) is RelatedLinkChangeList
+
+    # changelist customizations further down the MRO are kept
+    changelist = site._registry[LinkTestComment].get_changelist(request)
+    assert issubclass(changelist, OrderedChangeList)
+    assert changelist.apply_select_related is not OrderedChangeList.apply_select_related
+    assert site._registry[LinkTestComment].get_changelist(request) is changelist
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+def test_related_link_columns():
+    client = Client()
+    client.force_login(User.objects.create_superuser("admin", "admin@example.com", "pw"))
+
+    query_counts = []
+    for count in (3, 12):
+        LinkTestAuthor.objects.all().delete()
+        create_objects(count)
+        with CaptureQueriesContext(connection) as ctx:
+            articles = client.get("/admin/tests/linktestarticle/")
+            comments = client.get("/admin/tests/linktestcomment/")
+        assert articles.status_code == comments.status_code == 200
+        query_counts.append(len(ctx.captured_queries))
+
+        for author in LinkTestAuthor.objects.all():
+            link = admin_navigation_link(author, label=author.name)
+            assert articles.content.decode().count(link) == 1
+            assert comments.content.decode().count(link) == 1
+        assert b">Article</a>" in comments.content  # sortable column header
+    assert query_counts[0] == query_counts[1]
+
+    # the ordering of the inherited changelist still applies
+    texts = [c.text for c in comments.context["cl"].result_list]
+    assert texts == sorted(texts, reverse=True)
+
+    # only the fields needed for the links are loaded
+    (sql,) = [
+        q["sql"] for q in ctx.captured_queries if 'FROM "tests_linktestarticle" INNER' in q["sql"]
+    ]
+    assert '"tests_linktestauthor"."name"' in sql
+    assert '"tests_linktestauthor"."created_at"' not in sql
+    # str() of the article might need any field
+    (sql,) = [
+        q["sql"] for q in ctx.captured_queries if 'FROM "tests_linktestcomment" INNER' in q["sql"]
+    ]
+    assert '"tests_linktestarticle"."published"' in sql
+    assert '"tests_linktestauthor"."created_at"' in sql